@@ -3,5 +3,14 @@ from metagraph.types import Graph, BipartiteGraph
 
 
 @abstract_algorithm("bipartite.graph_projection")
-def graph_projection(bgraph: BipartiteGraph, nodes_retained: int = 0) -> Graph:
+def graph_projection(
+    bgraph: BipartiteGraph,
+    nodes_retained: int = 0,
+    weighted: bool = False,
+    normalize: bool = False,
+) -> Graph:
+    """
+    If weighted, edges are weighted by the number of shared neighbors, divided by the
+    size of the other node group if normalize is True.
+    """
     pass
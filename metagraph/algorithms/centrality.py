@@ -1,3 +1,4 @@
+import math
 import metagraph as mg
 from metagraph import abstract_algorithm
 from metagraph.types import Graph, NodeMap, NodeSet, NodeID
@@ -12,6 +13,47 @@ def betweenness_centrality(
     pass  # pragma: no cover
 
 
+@abstract_algorithm("centrality.approximate_betweenness")
+def approximate_betweenness_centrality(
+    graph: Graph(edge_type="map", edge_dtype={"int", "float"}),
+    k: mg.Optional[int] = None,
+    epsilon: float = 0.1,
+    normalize: bool = False,
+    seed: mg.Optional[int] = None,
+) -> NodeMap:
+    """
+    Estimates betweenness centrality from shortest paths starting at k sampled source nodes.
+    If k is None, it is chosen from epsilon (see `betweenness_sample_size`).
+    """
+    pass  # pragma: no cover
+
+
+def betweenness_sample_size(num_nodes: int, k: int = None, epsilon: float = 0.1) -> int:
+    """
+    Number of sources to sample for approximate betweenness centrality.
+
+    Without an explicit k, ceil(ln(n) / epsilon**2) sources are used (Eppstein & Wang),
+    which estimates normalized scores to within about epsilon with high probability.
+    The result never exceeds num_nodes, at which point the computation is exact.
+    """
+    if k is None:
+        if epsilon <= 0:
+            raise ValueError(f"epsilon must be positive, not {epsilon}")
+        k = math.ceil(math.log(max(num_nodes, 2)) / epsilon ** 2)
+    elif k <= 0:
+        raise ValueError(f"k must be positive, not {k}")
+    return min(k, num_nodes)
+
+
+@abstract_algorithm("centrality.eigenvector")
+def eigenvector_centrality(
+    graph: Graph(edge_type="map", edge_dtype={"int", "float"}),
+    maxiter: int = 100,
+    tolerance: float = 1e-06,
+) -> NodeMap:
+    pass  # pragma: no cover
+
+
 @abstract_algorithm("centrality.katz")
 def katz_centrality(
     graph: Graph(edge_type="map", edge_dtype={"int", "float"}),
@@ -1,3 +1,4 @@
+import metagraph as mg
 from metagraph import abstract_algorithm
 from metagraph.types import Graph, NodeMap
 from typing import Tuple, Callable, Any
@@ -20,9 +21,13 @@ def label_propagation_community(graph: Graph(is_directed=False)) -> NodeMap:
 
 @abstract_algorithm("clustering.louvain_community")
 def louvain_community_step(
-    graph: Graph(is_directed=False, edge_type="map", edge_dtype={"int", "float"})
+    graph: Graph(is_directed=False, edge_type="map", edge_dtype={"int", "float"}),
+    seed: mg.Optional[int] = None,
 ) -> Tuple[NodeMap, float]:
-    """Runs one step of louvain, returning communities and modularity score"""
+    """
+    Runs one step of louvain, returning communities and modularity score
+    seed randomizes the order in which nodes are visited reproducibly
+    """
     pass  # pragma: no cover
 
 
@@ -39,3 +44,9 @@ def collapse_by_label(
 def triangle_count(graph: Graph(is_directed=False)) -> int:
     """Counts the number of unique triangles in an undirected graph"""
     pass  # pragma: no cover
+
+
+@abstract_algorithm("cluster.triangles")
+def node_triangles(graph: Graph(is_directed=False)) -> NodeMap:
+    """Counts the number of triangles each node is part of in an undirected graph"""
+    pass  # pragma: no cover
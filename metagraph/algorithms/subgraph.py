@@ -1,5 +1,5 @@
 from metagraph import abstract_algorithm
-from metagraph.types import NodeSet, Graph
+from metagraph.types import NodeSet, NodeMap, Graph
 
 
 @abstract_algorithm("subgraph.extract_subgraph")
@@ -10,3 +10,12 @@ def extract_subgraph(graph: Graph, nodes: NodeSet) -> Graph:
 @abstract_algorithm("subgraph.k_core")
 def k_core(graph: Graph(is_directed=False), k: int) -> Graph:
     pass
+
+
+@abstract_algorithm("subgraph.core_number")
+def core_number(graph: Graph(is_directed=False)) -> NodeMap:
+    """
+    The core number of each node: the largest k for which it is in the k-core.
+    The k-core for any k is the subgraph of nodes with core number >= k.
+    """
+    pass
@@ -1,5 +1,5 @@
 from metagraph import abstract_algorithm
-from metagraph.types import Graph, Vector, NodeMap, NodeID
+from metagraph.types import Graph, Vector, NodeMap, NodeSet, NodeID
 from typing import Tuple
 
 
@@ -35,6 +35,17 @@ def breadth_first_search_tree(
     pass
 
 
+@abstract_algorithm("traversal.bfs_multi")
+def breadth_first_search_multi(
+    graph: Graph, source_nodes: NodeSet, depth_limit: int = -1
+) -> Tuple[Graph, Graph]:
+    """
+    Output is (Parents, Depth)
+    Edge (s, v) holds the parent of (or depth of) v in the BFS tree from source s
+    """
+    pass
+
+
 @abstract_algorithm("traversal.dijkstra")
 def dijkstra(
     graph: Graph(
@@ -44,3 +55,17 @@ def dijkstra(
 ) -> Tuple[NodeMap, NodeMap]:
     """Output is (Parents, Distance)"""
     pass
+
+
+@abstract_algorithm("traversal.dijkstra_multi")
+def dijkstra_multi(
+    graph: Graph(
+        edge_has_negative_weights=False, edge_type="map", edge_dtype={"int", "float"}
+    ),
+    source_nodes: NodeSet,
+) -> Tuple[Graph, Graph]:
+    """
+    Output is (Parents, Distance)
+    Edge (s, v) holds the parent of (or distance to) v on a shortest path from source s
+    """
+    pass
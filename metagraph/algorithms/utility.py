@@ -58,6 +58,7 @@ def graph_aggregate_edges(
     if in_edges == out_edges == False, every node is mapped to initial_value 
     if the graph is undirected and either in_edges == True or out_edges == True, we aggregate over all of the edges for each node exactly once to avoid double counting
     if the graph is directed, in_edges and out_edges specify which edge types to aggregate over for a given node
+    func is called as func(edge_weight, aggregated_value), starting from initial_value
     """
     pass
 
@@ -14,32 +14,143 @@ setup(
 The find_plugins function should return a metagraph.PluginRegistry of the relevant plugins.
 """
 
-from typing import Set, Dict, Callable
+import fnmatch
+import inspect
+from typing import Set, Dict, Callable, Iterable, Optional, Tuple
 import importlib_metadata
 from .plugin_registry import PluginRegistry
+from .plugin import ConcreteType, MetaWrapper
+from .typing import Combo
 
 
 class EntryPointsError(Exception):
     pass
 
 
-def load_plugins():
-    entry_points = importlib_metadata.entry_points().get("metagraph.plugins", [])
+def _distribution_name(dist) -> str:
+    name = dist.metadata["Name"]
+    if name is None:
+        # Fall back to the location of distributions lacking metadata
+        name = str(dist.locate_file(""))
+    return name
+
+
+def _plugin_entry_points():
+    """Yield (distribution name, entry point) for every metagraph.plugins entry point"""
+    for dist in importlib_metadata.distributions():
+        for entry_point in dist.entry_points:
+            if entry_point.group == "metagraph.plugins":
+                yield _distribution_name(dist), entry_point
+
+
+def _matches(name: str, patterns: Iterable[str]) -> bool:
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+
+
+def load_plugins(
+    *, enabled: Optional[Iterable[str]] = None, disabled: Iterable[str] = ()
+):
+    """
+    Find and load all plugins exposed by metagraph.plugins entry points.
+
+    enabled: names (or glob patterns) of plugins to keep; None keeps all plugins
+    disabled: names (or glob patterns) of plugins to drop
+
+    Both lists may also contain the names of installed packages providing plugins.
+    The entry point of a disabled package is never imported.
+
+    When plugins are dropped, translators and concrete algorithms of the remaining
+    plugins which refer to concrete types of dropped plugins are dropped as well.
+    """
+    enabled = None if enabled is None else list(enabled)
+    disabled = list(disabled)
     plugins = dict()
     seen = set()
-    for entry_point in entry_points:
+    any_dropped = False
+    for dist_name, entry_point in _plugin_entry_points():
         if entry_point.name != "plugins":
             raise EntryPointsError(
                 f"metagraph.plugin found an unexpected entry_point: {entry_point.name}"
             )
         elif entry_point not in seen:
+            seen.add(entry_point)
+            if _matches(dist_name, disabled):
+                any_dropped = True
+                continue
             plugin_loader = entry_point.load()
             entry_point_plugins = plugin_loader()
 
             for entry_point_plugin_name in entry_point_plugins.keys():
                 if entry_point_plugin_name in plugins:
                     raise ValueError(f"{entry_point_plugin_name} already registered.")
-            plugins.update(entry_point_plugins)
-            seen.add(entry_point)
+                if _matches(entry_point_plugin_name, disabled) or (
+                    enabled is not None
+                    and not _matches(entry_point_plugin_name, enabled)
+                    and not _matches(dist_name, enabled)
+                ):
+                    any_dropped = True
+                else:
+                    plugins[entry_point_plugin_name] = entry_point_plugins[
+                        entry_point_plugin_name
+                    ]
 
+    if any_dropped:
+        plugins = _prune_dangling_references(plugins)
     return plugins
+
+
+def _referenced_concrete_types(annotation):
+    if isinstance(annotation, ConcreteType):
+        yield type(annotation)
+    elif type(annotation) is MetaWrapper:
+        if hasattr(annotation, "Type"):
+            yield annotation.Type
+    elif isinstance(annotation, type):
+        if issubclass(annotation, ConcreteType):
+            yield annotation
+    elif isinstance(annotation, Combo):
+        for t in annotation.types:
+            yield from _referenced_concrete_types(t)
+    else:
+        # typing constructs such as Tuple and Union
+        for arg in getattr(annotation, "__args__", None) or ():
+            yield from _referenced_concrete_types(arg)
+
+
+def _signature_concrete_types(sig: inspect.Signature) -> Set[type]:
+    found = set()
+    for p in sig.parameters.values():
+        found.update(_referenced_concrete_types(p.annotation))
+    found.update(_referenced_concrete_types(sig.return_annotation))
+    return found
+
+
+def _prune_dangling_references(plugins):
+    """
+    Drop translators and concrete algorithms which refer to concrete types that are
+    not provided by any of the given plugins.
+    """
+    known_types = set()
+    for plugin in plugins.values():
+        known_types.update(plugin.get("concrete_types", ()))
+        known_types.update(
+            wr.Type for wr in plugin.get("wrappers", ()) if hasattr(wr, "Type")
+        )
+
+    pruned = {}
+    for plugin_name, plugin in plugins.items():
+        plugin = dict(plugin)
+        if "translators" in plugin:
+            plugin["translators"] = {
+                tr
+                for tr in plugin["translators"]
+                if _signature_concrete_types(inspect.signature(tr.func)) <= known_types
+            }
+        if "concrete_algorithms" in plugin:
+            plugin["concrete_algorithms"] = {
+                ca
+                for ca in plugin["concrete_algorithms"]
+                if _signature_concrete_types(ca.__signature__) <= known_types
+            }
+        pruned[plugin_name] = plugin
+    return pruned
@@ -1,3 +1,7 @@
+import warnings
+import numpy as np
+
+
 class NodeLabels:
     """
     Bidirectional mapping from node_id to label
@@ -12,6 +16,12 @@ class NodeLabels:
         any potential conflict with the label being a tuple. Lists are not hashable and therefore
         cannot be used as a valid label, so handling lists specially allows for clear disambiguation
         of meaning by the caller.
+    Passing a numpy array of labels or node_ids will return a numpy array. The lookup is
+        vectorized, making this the preferred way to relabel large edge lists.
+
+    Node ids are stored as a sorted numpy array. Integer, float, and string labels are also
+    stored as a sorted numpy array, with lookups done by binary search. Other labels (tuples,
+    mixed types, etc.) fall back to a Python dict for label -> node_id lookups.
 
     Usage
     -----
@@ -28,27 +38,44 @@ class NodeLabels:
     [0, 42]
     >>> node_labels.ids[[42, 10]]
     ['C', 'B']
+    >>> node_labels[np.array(['C', 'C', 'A'])]
+    array([42, 42,  0])
     """
 
     def __init__(self, node_ids, labels):
         if len(node_ids) != len(labels):
             raise ValueError(f"lengths must match: {len(node_ids)} != {len(labels)}")
 
-        id2label = {}
-        label2id = {}
-        for nodeid, label in zip(node_ids, labels):
-            if type(nodeid) is not int:
-                raise TypeError(f"node ids must be int, not {type(nodeid)}")
-            id2label[nodeid] = label
-            label2id[label] = nodeid
-
-        if len(id2label) != len(node_ids):
+        node_ids = _as_1d_array(node_ids)
+        if node_ids.dtype.kind not in "iu":
+            if node_ids.dtype.kind != "O":
+                raise TypeError(f"node ids must be int, not {node_ids.dtype}")
+            for nodeid in node_ids:
+                if type(nodeid) is not int:
+                    raise TypeError(f"node ids must be int, not {type(nodeid)}")
+            node_ids = node_ids.astype(np.int64)
+        labels = _as_1d_array(labels)
+
+        # Node id -> label lookups; labels are aligned with the sorted node ids
+        order = np.argsort(node_ids, kind="stable")
+        self._ids = node_ids[order]
+        self._id_labels = labels[order]
+        if (self._ids[1:] == self._ids[:-1]).any():
             raise ValueError("duplicate node ids")
-        if len(label2id) != len(labels):
-            raise ValueError("duplicate labels")
 
-        self._id2label = id2label
-        self._label2id = label2id
+        # Label -> node id lookups
+        if labels.dtype.kind in _SORTABLE_KINDS:
+            order = np.argsort(labels, kind="stable")
+            self._labels = labels[order]
+            self._label_ids = node_ids[order]
+            self._label2id = None
+            if (self._labels[1:] == self._labels[:-1]).any():
+                raise ValueError("duplicate labels")
+        else:
+            self._labels = self._label_ids = None
+            self._label2id = dict(zip(labels, node_ids.tolist()))
+            if len(self._label2id) != len(labels):
+                raise ValueError("duplicate labels")
 
         self.ids = NodeLabels._ReverseMapper(self)
 
@@ -70,27 +97,134 @@ class NodeLabels:
     def __eq__(self, other):
         if type(other) is not NodeLabels:
             return NotImplemented
-        return self._label2id == other._label2id
+        return np.array_equal(self._ids, other._ids) and np.array_equal(
+            self._id_labels, other._id_labels
+        )
 
     def __len__(self):
-        return len(self._label2id)
+        return len(self._ids)
 
     def __getitem__(self, label):
         if type(label) is list:
-            return [self._label2id[x] for x in label]
-        return self._label2id[label]
+            return self._lookup_labels(label).tolist()
+        if isinstance(label, np.ndarray):
+            return self._lookup_labels(label)
+        if self._label2id is not None:
+            return self._label2id[label]
+        return _to_python(self._lookup_labels(label, scalar=True))
 
     def __contains__(self, item):
-        return item in self._label2id
+        if self._label2id is not None:
+            return item in self._label2id
+        try:
+            self._lookup_labels(item, scalar=True)
+        except KeyError:
+            return False
+        return True
+
+    def _lookup_labels(self, labels, scalar=False):
+        if self._label2id is not None:
+            label2id = self._label2id
+            return np.array([label2id[x] for x in labels], dtype=self._ids.dtype)
+        return _search(self._labels, self._label_ids, labels, scalar)
 
     class _ReverseMapper:
         def __init__(self, outer):
             self._outer = outer
 
         def __getitem__(self, node_id):
+            outer = self._outer
             if type(node_id) is list:
-                return [self._outer._id2label[x] for x in node_id]
-            return self._outer._id2label[node_id]
+                return _search(outer._ids, outer._id_labels, node_id).tolist()
+            if isinstance(node_id, np.ndarray):
+                return _search(outer._ids, outer._id_labels, node_id)
+            return _to_python(
+                _search(outer._ids, outer._id_labels, node_id, scalar=True)
+            )
 
         def __contains__(self, node_id):
-            return node_id in self._outer._id2label
+            try:
+                _search(self._outer._ids, self._outer._id_labels, node_id, scalar=True)
+            except KeyError:
+                return False
+            return True
+
+
+# numpy dtype kinds which can be sorted and searched: bool, int, uint, float, bytes, str
+_SORTABLE_KINDS = "biufSU"
+
+
+def _to_python(x):
+    return x.item() if isinstance(x, np.generic) else x
+
+
+def _type_kind(t):
+    """numpy dtype kinds which hold values of type t unchanged"""
+    if issubclass(t, (bool, np.bool_)):
+        return "b"
+    if issubclass(t, (int, np.integer)):
+        return "iu"
+    if issubclass(t, (float, np.floating)):
+        return "f"
+    if issubclass(t, str):
+        return "U"
+    if issubclass(t, bytes):
+        return "S"
+    return None
+
+
+def _has_uniform_kind(values, kind):
+    # Collecting the distinct types first keeps this fast for long lists
+    kinds = {_type_kind(t) for t in set(map(type, values))}
+    return len(kinds) == 1 and None not in kinds and kind in kinds.pop()
+
+
+def _as_1d_array(values):
+    if isinstance(values, np.ndarray):
+        arr = values
+    else:
+        values = list(values)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", np.VisibleDeprecationWarning)
+                arr = np.array(values)
+        except ValueError:
+            arr = None
+        if (
+            arr is None
+            or arr.ndim != 1
+            or arr.dtype.kind not in _SORTABLE_KINDS
+            # numpy silently converts mixed types (e.g. 1 and 2.5, or True and 2)
+            or (values and not _has_uniform_kind(values, arr.dtype.kind))
+        ):
+            # Keep elements (e.g. tuples) as-is rather than letting numpy broadcast them
+            arr = np.empty(len(values), dtype=object)
+            arr[:] = values
+    if arr.ndim != 1:
+        raise ValueError(f"expected a 1-D sequence, not {arr.ndim}-D")
+    return arr
+
+
+def _search(keys, values, query, scalar=False):
+    """
+    Find query in sorted array `keys` and return the corresponding items from `values`.
+
+    Raises KeyError if any item of query is not found.
+    """
+    try:
+        query_arr = np.asarray(query)
+        if scalar and query_arr.ndim != 0:
+            raise KeyError(query)
+        pos = np.searchsorted(keys, query_arr)
+        if len(keys) == 0:
+            found = np.zeros(pos.shape, dtype=bool)
+        else:
+            pos = np.minimum(pos, len(keys) - 1)
+            found = keys[pos] == query_arr
+    except (TypeError, ValueError):
+        raise KeyError(query)
+    if not np.all(found):
+        if scalar:
+            raise KeyError(query)
+        raise KeyError(np.asarray(query)[~found][0])
+    return values[pos]
@@ -640,8 +640,15 @@ class Resolver:
                 )
 
     def load_plugins_from_environment(self):
-        """Scans environment for plugins and populates registry with them."""
-        plugins_by_name = load_plugins()
+        """Scans environment for plugins and populates registry with them.
+
+        Plugins are filtered by the `core.plugins.enabled` and `core.plugins.disabled`
+        config options.
+        """
+        plugins_by_name = load_plugins(
+            enabled=config.get("core.plugins.enabled", None),
+            disabled=config.get("core.plugins.disabled", None) or (),
+        )
         self.register(plugins_by_name)
 
     def typeclass_of(self, value):
@@ -700,9 +707,17 @@ class Resolver:
         if algo_name not in self.abstract_algorithms:
             raise ValueError(f'No abstract algorithm "{algo_name}" has been registered')
 
+        pinned = config.get("core.dispatch.pinned_plugins", None) or {}
+        if algo_name in pinned:
+            concrete_algos = self._pinned_concrete_algorithms(
+                algo_name, pinned[algo_name]
+            )
+        else:
+            concrete_algos = self.concrete_algorithms.get(algo_name, {})
+
         # Find all possible solution paths
         solutions: List[AlgorithmPlan] = []
-        for concrete_algo in self.concrete_algorithms.get(algo_name, {}):
+        for concrete_algo in concrete_algos:
             plan = AlgorithmPlan.build(self, concrete_algo, *args, **kwargs)
             if plan is not None:
                 solutions.append(plan)
@@ -717,6 +732,21 @@ class Resolver:
 
         return solutions
 
+    def _pinned_concrete_algorithms(
+        self, algo_name: str, plugin_names: Union[str, List[str]]
+    ) -> Set[ConcreteAlgorithm]:
+        if isinstance(plugin_names, str):
+            plugin_names = [plugin_names]
+        concrete_algos = set()
+        for plugin_name in plugin_names:
+            if plugin_name not in dir(self.plugins):
+                raise ValueError(
+                    f'Plugin "{plugin_name}" pinned for "{algo_name}" has not been registered'
+                )
+            plugin = getattr(self.plugins, plugin_name)
+            concrete_algos.update(plugin.concrete_algorithms.get(algo_name, ()))
+        return concrete_algos
+
     def find_algorithm_exact(
         self, algo_name: str, *args, **kwargs
     ) -> Optional[ConcreteAlgorithm]:
@@ -1,6 +1,8 @@
-from metagraph import concrete_algorithm, NodeID
+import metagraph as mg
+import numpy as np
+from metagraph import concrete_algorithm, NodeID, config
 from metagraph.plugins import has_grblas
-from typing import Tuple, Iterable, Any
+from typing import Tuple, Iterable, Any, Optional
 
 if has_grblas:
     import grblas as gb
@@ -11,8 +13,90 @@ if has_grblas:
         GrblasNodeMap,
         GrblasNodeSet,
         GrblasVectorType,
+        _node_positions,
     )
     from ..python.types import PythonNodeSet
+    from ..numpy.types import NumpyVector
+    from ..numpy.algorithms import argsort_top_k
+
+    def _adjacency(graph: GrblasGraph) -> gb.Matrix:
+        A = graph.edges.value
+        return A.T.new() if graph.edges.transposed else A
+
+    def _node_ids(graph: GrblasGraph, positions: np.ndarray) -> np.ndarray:
+        """Map matrix positions to node ids"""
+        node_list = graph.edges.node_list
+        return positions if node_list is None else node_list[positions]
+
+    def _positions(graph: GrblasGraph, node_ids) -> np.ndarray:
+        """Map node ids to matrix positions, dropping ids which are not in the graph"""
+        positions, found = _node_positions(
+            graph.edges.node_list, graph.edges.value.nrows, np.asarray(node_ids)
+        )
+        return positions[found]
+
+    def _source_position(graph: GrblasGraph, source_node: NodeID) -> int:
+        positions, found = _node_positions(
+            graph.edges.node_list, graph.edges.value.nrows, np.array([source_node])
+        )
+        if not found[0]:
+            raise ValueError(f"source node {source_node} is not in the graph")
+        return int(positions[0])
+
+    def _node_set_ids(nodes: GrblasNodeSet) -> np.ndarray:
+        idx, _ = nodes.value.to_values()
+        idx = np.asarray(idx)
+        return idx if nodes.node_list is None else nodes.node_list[idx]
+
+    def _present_nodes(graph: GrblasGraph) -> np.ndarray:
+        """Sorted positions which are nodes of the graph"""
+        if graph.nodes is not None:
+            idx, _ = graph.nodes.value.to_values()
+            return np.asarray(idx)
+        A = graph.edges.value
+        rows, cols, _ = A.to_values()
+        return np.union1d(rows, cols)
+
+    def _values_to_node_ids(graph: GrblasGraph, vec: gb.Vector) -> gb.Vector:
+        """Replace position values (e.g. parents or labels) with node ids"""
+        if graph.edges.node_list is None:
+            return vec
+        idx, vals = vec.to_values()
+        return gb.Vector.from_values(
+            idx, graph.edges.node_list[np.asarray(vals)], size=vec.size
+        )
+
+    def _subgraph(graph: GrblasGraph, positions: np.ndarray) -> GrblasGraph:
+        """Extract the subgraph of sorted node positions, compacting node ids into a node_list"""
+        index = positions.tolist()
+        A = graph.edges.value[index, index].new()
+        node_ids = _node_ids(graph, positions)
+        if len(node_ids) == 0 or node_ids[-1] == len(node_ids) - 1:
+            node_list = None
+        else:
+            node_list = node_ids
+        edges = type(graph.edges)(
+            A, transposed=graph.edges.transposed, node_list=node_list
+        )
+        nodes = None
+        if graph.nodes is not None:
+            nodes = type(graph.nodes)(
+                graph.nodes.value[index].new(), node_list=node_list
+            )
+        return GrblasGraph(edges, nodes)
+
+    def _off_diagonal_pattern(A: gb.Matrix) -> gb.Matrix:
+        """INT64 matrix of ones for the edges of A, without self-loops"""
+        rows, cols, _ = A.to_values()
+        rows, cols = np.asarray(rows), np.asarray(cols)
+        off_diag = rows != cols
+        return gb.Matrix.from_values(
+            rows[off_diag],
+            cols[off_diag],
+            np.ones(off_diag.sum(), dtype=np.int64),
+            nrows=A.nrows,
+            ncols=A.ncols,
+        )
 
     @concrete_algorithm("cluster.triangle_count")
     def grblas_triangle_count(graph: GrblasGraph) -> int:
@@ -29,6 +113,22 @@ if has_grblas:
         )  # Using a (structural) mask is equivalent to the elementwise multiplication step
         return val.reduce_scalar().value // 6
 
+    @concrete_algorithm("cluster.triangles")
+    def grblas_node_triangles(graph: GrblasGraph) -> GrblasNodeMap:
+        # Masked mxm counts the common neighbors of the ends of each edge;
+        # each triangle at a node is found through both of its other corners
+        P = _off_diagonal_pattern(graph.edges.value)
+        n = P.nrows
+        common = P.mxm(P, gb.semiring.plus_pair[gb.dtypes.INT64]).new(mask=P.S)
+        counts = common.reduce_rows().new()
+        # Nodes in no triangles get an explicit zero
+        nodes = _present_nodes(graph)
+        result = gb.Vector.from_values(
+            nodes, np.zeros(len(nodes), dtype=np.int64), size=n
+        )
+        result(mask=counts.S) << counts.apply(gb.binary.cdiv, right=2)
+        return GrblasNodeMap(result, node_list=graph.edges.node_list)
+
     @concrete_algorithm("centrality.pagerank")
     def grblas_pagerank(
         graph: GrblasGraph, damping: float, maxiter: int, tolerance: float
@@ -36,25 +136,36 @@ if has_grblas:
         # `scale_edges` matrix does the bulk of the work; it's what distributes
         # the current value of a vertex to its neighbors
         A = graph.edges.value
-        N = A.ncols
+        n = A.ncols
+        nodes = _present_nodes(graph)
+        N = len(nodes)
         scale_edges = A.apply(gb.unary.one).new(dtype=float)
         node_scale = scale_edges.reduce_rows().new()  # num edges
         node_scale << node_scale.apply(gb.unary.minv)  # 1 / num_edges
         index, vals = node_scale.to_values()  # TODO: implement diag and use here
-        node_scale_diag = gb.Matrix.from_values(index, index, vals, ncols=N, nrows=N)
-        scale_edges(mask=scale_edges.S)[:, :] = 0.85
-        scale_edges << scale_edges.T.mxm(node_scale_diag)  # 0.85 / num_edges
+        node_scale_diag = gb.Matrix.from_values(index, index, vals, ncols=n, nrows=n)
+        scale_edges(mask=scale_edges.S)[:, :] = damping
+        scale_edges << scale_edges.T.mxm(node_scale_diag)  # damping / num_edges
 
-        # `base` vector gets added to the result every iteration
-        base = gb.Vector.new(float, N)
-        base[:] = 0.15 / N
+        # Rank of dangling nodes (without out edges) is spread uniformly over all nodes
+        dangling = np.setdiff1d(nodes, np.asarray(index))
+        dangling_nodes = gb.Vector.from_values(
+            dangling, np.ones(len(dangling)), size=n, dtype=float
+        )
 
         # `r` vector holds the results
-        r = gb.Vector.new(float, N)
-        r[:] = 1 / N
+        r = gb.Vector.from_values(nodes, np.full(N, 1 / N), size=n, dtype=float)
 
         for i in range(maxiter):
             prev_r = r.dup()
+            dangling_sum = prev_r.ewise_mult(dangling_nodes).new().reduce().value or 0
+            # `base` vector gets added to the result every iteration
+            base = gb.Vector.from_values(
+                nodes,
+                np.full(N, (damping * dangling_sum + 1 - damping) / N),
+                size=n,
+                dtype=float,
+            )
             r << scale_edges.mxv(r)
             r << r.ewise_add(base, gb.monoid.plus)
             # now calculate the difference and check the tolerance
@@ -63,4 +174,386 @@ if has_grblas:
             err = prev_r.reduce().value
             if err < N * tolerance:
                 break
-        return GrblasNodeMap(r)
+        return GrblasNodeMap(r, node_list=graph.edges.node_list)
+
+    @concrete_algorithm("clustering.connected_components")
+    def grblas_connected_components(graph: GrblasGraph) -> GrblasNodeMap:
+        """
+        Min-label propagation with pointer jumping, not FastSV.
+
+        Each round hooks every node onto the smallest parent among itself and its
+        neighbors, then shortcuts parent pointers once. There is no stochastic or
+        aggressive hooking, so this takes O(diameter) rounds of one mxv each.
+        Labels are the smallest node id in each component.
+        """
+        A = graph.edges.value
+        n = A.nrows
+        nodes = _present_nodes(graph)
+        parent = gb.Vector.from_values(nodes, nodes, size=n, dtype=gb.dtypes.INT64)
+        while True:
+            min_neighbor_parent = A.mxv(
+                parent, gb.semiring.min_second[gb.dtypes.INT64]
+            ).new()
+            hooked = parent.ewise_add(min_neighbor_parent, gb.monoid.min).new()
+            # Shortcut: parent[i] = hooked[hooked[i]]
+            idx, vals = hooked.to_values()
+            _, grandparents = hooked[np.asarray(vals).tolist()].new().to_values()
+            new_parent = gb.Vector.from_values(
+                idx, grandparents, size=n, dtype=gb.dtypes.INT64
+            )
+            if new_parent.isequal(parent):
+                break
+            parent = new_parent
+        return GrblasNodeMap(
+            _values_to_node_ids(graph, parent), node_list=graph.edges.node_list
+        )
+
+    def _bfs(graph: GrblasGraph, source_node: NodeID, depth_limit: int):
+        """Returns (order, depth, parent) where order is a list of position arrays per level"""
+        A = _adjacency(graph)
+        n = A.nrows
+        source = _source_position(graph, source_node)
+        depth = gb.Vector.from_values([source], [0], size=n, dtype=gb.dtypes.INT64)
+        parent = gb.Vector.from_values(
+            [source], [source], size=n, dtype=gb.dtypes.INT64
+        )
+        # Frontier values are their own positions so min_first passes them on as parents
+        frontier = parent.dup()
+        order = [np.array([source])]
+        level = 0
+        while depth_limit < 0 or level < depth_limit:
+            found = frontier.vxm(A, gb.semiring.min_first[gb.dtypes.INT64]).new(
+                mask=~parent.S
+            )
+            if found.nvals == 0:
+                break
+            level += 1
+            parent(mask=found.S) << found
+            depth(mask=found.S)[:] = level
+            idx, _ = found.to_values()
+            idx = np.asarray(idx)
+            order.append(idx)
+            frontier = gb.Vector.from_values(idx, idx, size=n, dtype=gb.dtypes.INT64)
+        return order, depth, parent
+
+    @concrete_algorithm("traversal.bfs_iter")
+    def grblas_breadth_first_search_iter(
+        graph: GrblasGraph, source_node: NodeID, depth_limit: int
+    ) -> GrblasVectorType:
+        order, _, _ = _bfs(graph, source_node, depth_limit)
+        node_ids = _node_ids(graph, np.concatenate(order))
+        return gb.Vector.from_values(
+            np.arange(len(node_ids)), node_ids, dtype=gb.dtypes.INT64
+        )
+
+    @concrete_algorithm("traversal.bfs_tree")
+    def grblas_breadth_first_search_tree(
+        graph: GrblasGraph, source_node: NodeID, depth_limit: int
+    ) -> Tuple[GrblasNodeMap, GrblasNodeMap]:
+        _, depth, parent = _bfs(graph, source_node, depth_limit)
+        node_list = graph.edges.node_list
+        return (
+            GrblasNodeMap(depth, node_list=node_list),
+            GrblasNodeMap(_values_to_node_ids(graph, parent), node_list=node_list),
+        )
+
+    def _source_batch_size() -> int:
+        return config.get("plugins.graphblas.source_batch_size", 64)
+
+    def _edge_incidence(A: gb.Matrix):
+        """
+        Returns (rows, cols, src, src_weighted, dst) for the edges of A.
+
+        src and dst are (nodes x edges) incidence matrices of edge sources and destinations;
+        src_weighted holds the edge weights instead of ones.
+        """
+        rows, cols, weights = A.to_values()
+        n = A.nrows
+        num_edges = len(rows)
+        edge_ids = np.arange(num_edges)
+        ones = np.ones(num_edges)
+        src = gb.Matrix.from_values(rows, edge_ids, ones, nrows=n, ncols=num_edges)
+        src_weighted = gb.Matrix.from_values(
+            rows, edge_ids, weights, nrows=n, ncols=num_edges
+        )
+        dst = gb.Matrix.from_values(cols, edge_ids, ones, nrows=n, ncols=num_edges)
+        return np.asarray(rows), np.asarray(cols), src, src_weighted, dst
+
+    def _shortest_path_dag(
+        dist: gb.Matrix, src_weighted: gb.Matrix, dst: gb.Matrix
+    ) -> gb.Matrix:
+        """
+        Returns a (sources x edges) matrix of ones for the edges (u, v) on a shortest path
+        from each source, i.e. where dist[s, u] + w(u, v) == dist[s, v]
+        """
+        via_edge = dist.mxm(src_weighted, gb.semiring.min_plus[gb.dtypes.FP64]).new()
+        at_dst = dist.mxm(dst, gb.semiring.min_first[gb.dtypes.FP64]).new()
+        on_path = via_edge.ewise_mult(at_dst, gb.binary.eq).new()
+        return on_path.apply(gb.unary.one).new(mask=on_path.V)
+
+    def _min_plus_distances(A: gb.Matrix, D: gb.Matrix, max_iter: int) -> gb.Matrix:
+        """
+        Relax distances D (sources x nodes) along the edges of A with the min-plus semiring.
+
+        Raises ValueError if distances are still changing after max_iter rounds,
+        which indicates a negative weight cycle.
+        """
+        for _ in range(max_iter):
+            relaxed = D.mxm(A, gb.semiring.min_plus[gb.dtypes.FP64]).new()
+            relaxed << relaxed.ewise_add(D, gb.monoid.min)
+            if relaxed.isequal(D):
+                return D
+            D = relaxed
+        raise ValueError("graph contains a negative weight cycle")
+
+    @concrete_algorithm("traversal.bellman_ford")
+    def grblas_bellman_ford(
+        graph: GrblasGraph, source_node: NodeID
+    ) -> Tuple[GrblasNodeMap, GrblasNodeMap]:
+        """
+        Bellman-Ford with the min-plus semiring.
+
+        Each round multiplies the distances by the whole adjacency matrix, and rounds
+        continue until distances stop changing, so the cost is O(diameter * nnz) rather
+        than Dijkstra's O(nnz + n log n), where diameter is the most edges on any
+        shortest path. Negative weight cycles are detected after n + 1 rounds.
+        """
+        A = _adjacency(graph).apply(gb.unary.identity).new(dtype=gb.dtypes.FP64)
+        n = A.nrows
+        source = _source_position(graph, source_node)
+        D = gb.Matrix.from_values([0], [source], [0.0], nrows=1, ncols=n)
+        D = _min_plus_distances(A, D, n + 1)
+        _, idx, dist = D.to_values()
+        idx = np.asarray(idx)
+        dist = np.asarray(dist)
+
+        # Recover parents from the edges which lie on a shortest path
+        distance = np.full(n, np.inf)
+        distance[idx] = dist
+        rows, cols, weights = A.to_values()
+        rows, cols = np.asarray(rows), np.asarray(cols)
+        on_path = (distance[rows] + np.asarray(weights) == distance[cols]) & (
+            cols != source
+        )
+        parents = np.full(n, -1, dtype=np.int64)
+        parents[cols[on_path]] = rows[on_path]
+        parents[source] = source
+
+        dtype = graph.edges.value.dtype
+        if dtype.name not in {"FP32", "FP64"}:
+            dist = dist.astype(np.int64)
+            dtype = gb.dtypes.INT64
+        node_list = graph.edges.node_list
+        parent_vec = gb.Vector.from_values(
+            idx, _node_ids(graph, parents[idx]), size=n, dtype=gb.dtypes.INT64
+        )
+        distance_vec = gb.Vector.from_values(idx, dist, size=n, dtype=dtype)
+        return (
+            GrblasNodeMap(parent_vec, node_list=node_list),
+            GrblasNodeMap(distance_vec, node_list=node_list),
+        )
+
+    def _source_positions(
+        graph: GrblasGraph, source_nodes: GrblasNodeSet
+    ) -> np.ndarray:
+        source_ids = _node_set_ids(source_nodes)
+        positions, found = _node_positions(
+            graph.edges.node_list, graph.edges.value.nrows, source_ids
+        )
+        if not found.all():
+            raise ValueError(f"source node {source_ids[~found][0]} is not in the graph")
+        return positions
+
+    def _scatter_source_rows(graph: GrblasGraph, parts, dtype) -> GrblasGraph:
+        """Build a square graph from (rows, cols, values) parts of the source rows"""
+        n = graph.edges.value.nrows
+        empty = np.zeros(0, dtype=np.int64)
+        # Indices from to_values are unsigned; mixing them with int64 would give floats
+        rows, cols, values = (
+            np.concatenate([np.asarray(x, dtype=dtype) for x in part])
+            for part, dtype in zip(
+                zip((empty, empty, empty), *parts), (np.int64, np.int64, None)
+            )
+        )
+        A = gb.Matrix.from_values(rows, cols, values, nrows=n, ncols=n, dtype=dtype)
+        return GrblasGraph(GrblasEdgeMap(A, node_list=graph.edges.node_list))
+
+    @concrete_algorithm("traversal.bfs_multi")
+    def grblas_breadth_first_search_multi(
+        graph: GrblasGraph, source_nodes: GrblasNodeSet, depth_limit: int
+    ) -> Tuple[GrblasGraph, GrblasGraph]:
+        # Batched frontier: row i of each (sources x nodes) matrix is the BFS from batch[i]
+        A = _adjacency(graph)
+        n = A.nrows
+        sources = _source_positions(graph, source_nodes)
+        depth_parts = []
+        parent_parts = []
+        batch_size = _source_batch_size()
+        for start in range(0, len(sources), batch_size):
+            batch = sources[start : start + batch_size]
+            B = len(batch)
+            batch_rows = np.arange(B)
+            depth = gb.Matrix.from_values(
+                batch_rows, batch, np.zeros(B), nrows=B, ncols=n, dtype=gb.dtypes.INT64
+            )
+            parent = gb.Matrix.from_values(
+                batch_rows, batch, batch, nrows=B, ncols=n, dtype=gb.dtypes.INT64
+            )
+            # Frontier values are their own positions so min_first passes them on as parents
+            frontier = parent.dup()
+            level = 0
+            while depth_limit < 0 or level < depth_limit:
+                found = frontier.mxm(A, gb.semiring.min_first[gb.dtypes.INT64]).new(
+                    mask=~parent.S
+                )
+                if found.nvals == 0:
+                    break
+                level += 1
+                parent(mask=found.S) << found
+                depth(mask=found.S)[:, :] = level
+                rows, cols, _ = found.to_values()
+                frontier = gb.Matrix.from_values(
+                    rows, cols, cols, nrows=B, ncols=n, dtype=gb.dtypes.INT64
+                )
+            rows, cols, vals = depth.to_values()
+            depth_parts.append((batch[np.asarray(rows)], cols, vals))
+            rows, cols, vals = parent.to_values()
+            parent_parts.append(
+                (batch[np.asarray(rows)], cols, _node_ids(graph, np.asarray(vals)))
+            )
+        return (
+            _scatter_source_rows(graph, parent_parts, gb.dtypes.INT64),
+            _scatter_source_rows(graph, depth_parts, gb.dtypes.INT64),
+        )
+
+    @concrete_algorithm("subgraph.extract_subgraph")
+    def grblas_extract_subgraph(
+        graph: GrblasGraph, nodes: GrblasNodeSet
+    ) -> GrblasGraph:
+        positions = np.intersect1d(
+            _positions(graph, _node_set_ids(nodes)), _present_nodes(graph)
+        )
+        return _subgraph(graph, positions)
+
+    @concrete_algorithm("subgraph.k_core")
+    def grblas_k_core(graph: GrblasGraph, k: int) -> GrblasGraph:
+        # Self-loops do not count towards the degree, as in the scipy and networkx versions
+        A = _off_diagonal_pattern(graph.edges.value)
+        kept = _present_nodes(graph)
+        index = kept.tolist()
+        A = A[index, index].new()
+        # SuiteSparse:GraphBLAS 5.1 crashes reducing an empty matrix, so stop before it
+        while A.nrows > 0:
+            # Repeatedly peel off nodes with fewer than k neighbors
+            degrees = A.reduce_rows().new()
+            idx, vals = degrees.to_values()
+            degree = np.zeros(A.nrows, dtype=np.int64)
+            degree[np.asarray(idx)] = vals
+            keep = np.flatnonzero(degree >= k)
+            if len(keep) == A.nrows:
+                break
+            index = keep.tolist()
+            A = A[index, index].new()
+            kept = kept[keep]
+        return _subgraph(graph, kept)
+
+    @concrete_algorithm("centrality.betweenness")
+    def grblas_betweenness_centrality(
+        graph: GrblasGraph, nodes: mg.Optional[GrblasNodeSet], normalize: bool,
+    ) -> GrblasNodeMap:
+        """
+        Batched Brandes over a block of sources at a time.
+
+        Weighted shortest path DAGs differ per source, so DAG edges are represented as a
+        (sources x edges) matrix and pushed through edge incidence matrices to
+        count paths (forward) and accumulate dependencies (backward).
+        """
+        is_directed = GrblasGraph.Type.compute_abstract_properties(
+            graph, {"is_directed"}
+        )["is_directed"]
+        A = _adjacency(graph).apply(gb.unary.identity).new(dtype=gb.dtypes.FP64)
+        n = A.nrows
+        all_nodes = _present_nodes(graph)
+        if nodes is None:
+            sources = all_nodes
+        else:
+            sources = np.intersect1d(_positions(graph, _node_set_ids(nodes)), all_nodes)
+        # Targets are the same as sources, as in networkx's betweenness_centrality_subset
+        target_diag = gb.Matrix.from_values(
+            sources, sources, np.ones(len(sources)), nrows=n, ncols=n
+        )
+
+        _, _, src, src_weighted, dst = _edge_incidence(A)
+        src_T = src.T.new()
+        dst_T = dst.T.new()
+
+        plus_first = gb.semiring.plus_first[gb.dtypes.FP64]
+        betweenness = gb.Vector.from_values(
+            all_nodes, np.zeros(len(all_nodes)), size=n, dtype=gb.dtypes.FP64
+        )
+        batch_size = _source_batch_size()
+        for start in range(0, len(sources), batch_size):
+            batch = sources[start : start + batch_size]
+            B = len(batch)
+            batch_rows = np.arange(B)
+            start_nodes = gb.Matrix.from_values(
+                batch_rows, batch, np.ones(B), nrows=B, ncols=n
+            )
+
+            # Shortest path distances and DAG edges: dist[s, u] + w(u, v) == dist[s, v]
+            dist = gb.Matrix.from_values(
+                batch_rows, batch, np.zeros(B), nrows=B, ncols=n
+            )
+            dist = _min_plus_distances(A, dist, n + 1)
+            dag = _shortest_path_dag(dist, src_weighted, dst)
+
+            # Forward: count shortest paths one DAG hop at a time
+            sigma = start_nodes.dup()
+            frontier = start_nodes
+            num_levels = 0
+            while num_levels < n:
+                frontier = frontier.mxm(src, plus_first).new(mask=dag.S)
+                frontier = frontier.mxm(dst_T, plus_first).new()
+                if frontier.nvals == 0:
+                    break
+                sigma << sigma.ewise_add(frontier, gb.monoid.plus)
+                num_levels += 1
+
+            # Backward: dependencies settle after as many rounds as the deepest DAG path
+            is_target = (
+                sigma.apply(gb.unary.one).new().mxm(target_diag, plus_first).new()
+            )
+            targets = gb.Matrix.new(gb.dtypes.FP64, B, n)
+            targets(mask=~start_nodes.S) << is_target
+            delta = gb.Matrix.new(gb.dtypes.FP64, B, n)
+            for _ in range(num_levels):
+                coeff = delta.ewise_add(targets, gb.monoid.plus).new()
+                coeff << coeff.ewise_mult(sigma, gb.binary.truediv)
+                coeff = coeff.mxm(dst, plus_first).new(mask=dag.S)
+                coeff = coeff.mxm(src_T, plus_first).new()
+                delta = coeff.ewise_mult(sigma, gb.binary.times).new()
+
+            dependencies = gb.Matrix.new(gb.dtypes.FP64, B, n)
+            dependencies(mask=~start_nodes.S) << delta
+            betweenness << betweenness.ewise_add(
+                dependencies.reduce_columns(gb.monoid.plus).new(), gb.monoid.plus
+            )
+
+        # Rescale to match networkx
+        num_nodes = len(all_nodes)
+        if normalize:
+            if num_nodes > 2:
+                betweenness << betweenness.apply(
+                    gb.binary.times, right=1 / ((num_nodes - 1) * (num_nodes - 2))
+                )
+        elif not is_directed:
+            betweenness << betweenness.apply(gb.binary.times, right=0.5)
+        return GrblasNodeMap(betweenness, node_list=graph.edges.node_list)
+
+    @concrete_algorithm("util.nodemap.sort")
+    def grblas_nodemap_sort(
+        x: GrblasNodeMap, ascending: bool, limit: Optional[int]
+    ) -> NumpyVector:
+        # Values are exported as arrays anyway, so select the top `limit` with numpy
+        node_ids, values = x.items_arrays()
+        return NumpyVector(node_ids[argsort_top_k(values, ascending, limit)])
@@ -16,21 +16,34 @@ if has_grblas:
         GrblasNodeSet,
         GrblasNodeMap,
         dtype_mg_to_grblas,
+        should_compact_node_ids,
     )
 
+    def _node_positions_and_size(node_ids):
+        """
+        Return (positions, size, node_list) for a sorted array of node ids.
+
+        Node ids are used directly as positions unless they are sparse enough to compact,
+        in which case positions are 0..n-1 and node_list maps them back to node ids.
+        """
+        size = int(node_ids[-1]) + 1 if len(node_ids) > 0 else 0
+        if should_compact_node_ids(size, len(node_ids)):
+            return np.arange(len(node_ids)), len(node_ids), node_ids
+        return node_ids, size, None
+
     @translator
     def nodemap_to_nodeset(x: GrblasNodeMap, **props) -> GrblasNodeSet:
         data = x.value.dup()
         # Force all values to be 1's to indicate no weights
         data[:](data.S) << 1
-        return GrblasNodeSet(data)
+        return GrblasNodeSet(data, node_list=x.node_list)
 
     @translator
     def edgemap_to_edgeset(x: GrblasEdgeMap, **props) -> GrblasEdgeSet:
         data = x.value.dup()
         # Force all values to be 1's to indicate no weights
         data[:, :](data.S) << 1
-        return GrblasEdgeSet(data, transposed=x.transposed)
+        return GrblasEdgeSet(data, transposed=x.transposed, node_list=x.node_list)
 
     @translator
     def vector_from_numpy(x: NumpyVector, **props) -> GrblasVectorType:
@@ -45,89 +58,185 @@ if has_grblas:
 
     @translator
     def nodeset_from_python(x: PythonNodeSet, **props) -> GrblasNodeSet:
-        nodes = list(sorted(x.value))
-        size = nodes[-1] + 1
-        vec = grblas.Vector.from_values(nodes, [1] * len(nodes), size=size)
-        return GrblasNodeSet(vec)
+        nodes = np.array(sorted(x.value), dtype=np.int64)
+        positions, size, node_list = _node_positions_and_size(nodes)
+        vec = grblas.Vector.from_values(positions, [1] * len(nodes), size=size)
+        return GrblasNodeSet(vec, node_list=node_list)
 
     @translator
     def nodemap_from_numpy(x: NumpyNodeMap, **props) -> GrblasNodeMap:
-        if x.mask is not None:
-            idx = np.flatnonzero(x.mask)
-            vals = x.value[idx]
-        elif x.id2pos is not None:
-            idx = x.pos2id
-            vals = x.value
-        else:
-            idx = np.arange(len(x.value))
-            vals = x.value
-        size = idx[-1] + 1
+        idx, vals = x.items_arrays()
+        positions, size, node_list = _node_positions_and_size(idx)
         vec = grblas.Vector.from_values(
-            idx, vals, size=size, dtype=dtype_mg_to_grblas[x.value.dtype]
+            positions, vals, size=size, dtype=dtype_mg_to_grblas[x.value.dtype]
         )
-        return GrblasNodeMap(vec)
+        return GrblasNodeMap(vec, node_list=node_list)
 
 
 if has_grblas and has_scipy:
     from ..scipy.types import ScipyEdgeSet, ScipyEdgeMap, ScipyGraph, ScipyMatrixType
     from .types import dtype_mg_to_grblas
 
+    def _grblas_matrix_from_scipy(x, positions, size, *, is_set=False, dtype=None):
+        """
+        Build a square grblas.Matrix of dimension `size` from a ScipyEdgeSet/EdgeMap.
+
+        positions gives the grblas index of each row/column of the scipy matrix.
+        When positions is sorted, CSR/CSC buffers are imported directly. If positions
+        is also compact (0..n-1), indptr and indices are passed through unchanged;
+        otherwise indptr is expanded and indices are remapped.
+        Unsorted positions fall back to building from COO values.
+        """
+        m = x.value
+        is_sorted = not np.any(positions[1:] <= positions[:-1])
+        if m.format not in {"csr", "csc"} or not is_sorted:
+            m = m.tocoo()
+        values = np.ones_like(m.data) if is_set else m.data
+        if m.format == "coo":
+            return grblas.Matrix.from_values(
+                positions[m.row],
+                positions[m.col],
+                values,
+                nrows=size,
+                ncols=size,
+                dtype=dtype,
+            )
+
+        indptr = m.indptr
+        indices = m.indices
+        if size != len(positions):
+            counts = np.zeros(size, dtype=indptr.dtype)
+            counts[positions] = np.diff(indptr)
+            indptr = np.concatenate([[0], np.cumsum(counts)])
+            indices = positions[indices]
+        if m.format == "csr":
+            return grblas.Matrix.ss.import_csr(
+                nrows=size,
+                ncols=size,
+                indptr=indptr,
+                col_indices=indices,
+                values=values,
+                sorted_index=m.has_sorted_indices,
+                dtype=dtype,
+            )
+        else:
+            return grblas.Matrix.ss.import_csc(
+                nrows=size,
+                ncols=size,
+                indptr=indptr,
+                row_indices=indices,
+                values=values,
+                sorted_index=m.has_sorted_indices,
+                dtype=dtype,
+            )
+
+    def _edges_from_scipy(x, node_ids=None):
+        """
+        Translate a ScipyEdgeSet/EdgeMap, using `node_ids` (sorted, a superset of the
+        edge node ids) to decide the grblas dimensions. Returns (edges, node_list).
+        """
+        node_list = np.asarray(x.node_list)
+        if node_ids is None:
+            node_ids = np.unique(node_list)
+        _, size, compact_list = _node_positions_and_size(node_ids)
+        if compact_list is None:
+            positions = node_list
+        else:
+            positions = np.searchsorted(compact_list, node_list)
+        if isinstance(x, ScipyEdgeMap):
+            dtype = dtype_mg_to_grblas[x.value.dtype]
+            out = _grblas_matrix_from_scipy(x, positions, size, dtype=dtype)
+            edges = GrblasEdgeMap(out, transposed=x.transposed, node_list=compact_list)
+        else:
+            out = _grblas_matrix_from_scipy(x, positions, size, is_set=True)
+            edges = GrblasEdgeSet(out, transposed=x.transposed, node_list=compact_list)
+        return edges, compact_list
+
     @translator
     def edgeset_from_scipy(x: ScipyEdgeSet, **props) -> GrblasEdgeSet:
-        m = x.value.tocoo()
-        node_list = x.node_list
-        size = max(node_list) + 1
-        out = grblas.Matrix.from_values(
-            node_list[m.row],
-            node_list[m.col],
-            np.ones_like(m.data),
-            nrows=size,
-            ncols=size,
-        )
-        return GrblasEdgeSet(out, transposed=x.transposed)
+        edges, _ = _edges_from_scipy(x)
+        return edges
 
     @translator
     def edgemap_from_scipy(x: ScipyEdgeMap, **props) -> GrblasEdgeMap:
-        m = x.value.tocoo()
-        node_list = x.node_list
-        size = max(node_list) + 1
-        dtype = dtype_mg_to_grblas[x.value.dtype]
-        out = grblas.Matrix.from_values(
-            node_list[m.row],
-            node_list[m.col],
-            m.data,
-            nrows=size,
-            ncols=size,
-            dtype=dtype,
-        )
-        return GrblasEdgeMap(out, transposed=x.transposed)
+        edges, _ = _edges_from_scipy(x)
+        return edges
 
     @translator
     def graph_from_scipy(x: ScipyGraph, **props) -> GrblasGraph:
         aprops = ScipyGraph.Type.compute_abstract_properties(
             x, {"node_type", "edge_type"}
         )
-        nodes = None
-        if aprops["node_type"] == "map":
-            nodes = nodemap_from_numpy(x.nodes)
-        elif aprops["node_type"] == "set":
-            if x.nodes is not None:
-                nodes = nodeset_from_python(x.nodes)
-
-        if aprops["edge_type"] == "map":
-            edges = edgemap_from_scipy(x.edges)
-        elif aprops["edge_type"] == "set":
-            edges = edgeset_from_scipy(x.edges)
-        else:
+        if aprops["edge_type"] not in {"map", "set"}:
             raise TypeError(f"Cannot translate with edge_type={aprops['edge_type']}")
 
+        # Decide the node id -> position mapping once and share it between edges and nodes
+        node_ids = np.asarray(x.edges.node_list)
+        if x.nodes is not None:
+            if aprops["node_type"] == "map":
+                nodemap_ids, nodemap_vals = x.nodes.items_arrays()
+                node_ids = np.union1d(node_ids, nodemap_ids)
+            else:
+                node_ids = np.union1d(node_ids, x.nodes.nodes())
+        else:
+            node_ids = np.unique(node_ids)
+        edges, node_list = _edges_from_scipy(x.edges, node_ids)
+        size = edges.value.nrows
+
+        nodes = None
+        if x.nodes is not None:
+            if aprops["node_type"] == "map":
+                positions = (
+                    nodemap_ids
+                    if node_list is None
+                    else np.searchsorted(node_list, nodemap_ids)
+                )
+                vec = grblas.Vector.from_values(
+                    positions,
+                    nodemap_vals,
+                    size=size,
+                    dtype=dtype_mg_to_grblas[nodemap_vals.dtype],
+                )
+                nodes = GrblasNodeMap(vec, node_list=node_list)
+            else:
+                set_ids = x.nodes.nodes()
+                positions = (
+                    set_ids
+                    if node_list is None
+                    else np.searchsorted(node_list, set_ids)
+                )
+                vec = grblas.Vector.from_values(
+                    positions, np.ones(len(positions), dtype=np.int64), size=size
+                )
+                nodes = GrblasNodeSet(vec, node_list=node_list)
+
         return GrblasGraph(edges=edges, nodes=nodes)
 
     @translator
     def matrix_from_scipy(x: ScipyMatrixType, **props) -> GrblasMatrixType:
-        x = x.tocoo()
         nrows, ncols = x.shape
         dtype = dtype_mg_to_grblas[x.dtype]
+        if x.format == "csr":
+            return grblas.Matrix.ss.import_csr(
+                nrows=nrows,
+                ncols=ncols,
+                indptr=x.indptr,
+                col_indices=x.indices,
+                values=x.data,
+                sorted_index=x.has_sorted_indices,
+                dtype=dtype,
+            )
+        if x.format == "csc":
+            return grblas.Matrix.ss.import_csc(
+                nrows=nrows,
+                ncols=ncols,
+                indptr=x.indptr,
+                row_indices=x.indices,
+                values=x.data,
+                sorted_index=x.has_sorted_indices,
+                dtype=dtype,
+            )
+        x = x.tocoo()
         vec = grblas.Matrix.from_values(
             x.row, x.col, x.data, nrows=nrows, ncols=ncols, dtype=dtype
         )
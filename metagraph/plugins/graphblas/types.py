@@ -8,8 +8,67 @@ from metagraph.wrappers import (
     CompositeGraphWrapper,
 )
 from metagraph.plugins import has_grblas
+from metagraph import config
 
 from typing import Set, Dict, Any
+import numpy as np
+
+
+def should_compact_node_ids(size: int, num_nodes: int) -> bool:
+    """
+    Whether GraphBLAS objects holding num_nodes nodes with ids below `size`
+    should be stored compactly, using a node_list to map positions back to node ids.
+
+    Controlled by the `plugins.graphblas.compact_ratio` config option.
+    """
+    ratio = config.get("plugins.graphblas.compact_ratio", 16)
+    return ratio is not None and size > ratio * max(num_nodes, 1)
+
+
+def _check_node_list(wrapper, node_list, size):
+    if node_list is None:
+        return None
+    if not isinstance(node_list, np.ndarray):
+        node_list = np.array(node_list)
+    wrapper._assert(
+        len(node_list) == size,
+        f"node list size ({len(node_list)}) and data size ({size}) don't match.",
+    )
+    wrapper._assert(np.all(np.diff(node_list) > 0), "node list must be sorted")
+    return node_list
+
+
+def _node_ids_from_positions(node_list, positions):
+    return positions if node_list is None else node_list[positions]
+
+
+def _node_positions(node_list, size, node_ids):
+    """Return (positions, found) for an array of node ids"""
+    # Imported here because the numpy plugin imports this module while loading
+    from ..numpy.types import NodeIndex
+
+    node_ids = np.asarray(node_ids)
+    if node_list is None:
+        found = (node_ids >= 0) & (node_ids < size)
+        return node_ids, found
+    return NodeIndex(node_list)._search(node_ids)
+
+
+def _edge_arrays(edges):
+    """Return (src_ids, dst_ids, values) of a GrblasEdgeSet/EdgeMap, sorted by node id"""
+    rows, cols, vals = edges.value.to_values()
+    if edges.transposed:
+        rows, cols = cols, rows
+    rows = _node_ids_from_positions(edges.node_list, np.asarray(rows))
+    cols = _node_ids_from_positions(edges.node_list, np.asarray(cols))
+    order = np.lexsort((cols, rows))
+    return rows[order], cols[order], np.asarray(vals)[order]
+
+
+def _same_node_list(node_list1, node_list2):
+    if node_list1 is None or node_list2 is None:
+        return node_list1 is node_list2
+    return np.array_equal(node_list1, node_list2)
 
 
 if has_grblas:
@@ -73,16 +132,33 @@ if has_grblas:
                 assert obj1.isequal(obj2, check_dtype=True)
 
     class GrblasNodeSet(NodeSetWrapper, abstract=NodeSet):
-        def __init__(self, data):
+        def __init__(self, data, node_list=None):
+            """
+            data: grblas.Vector with an element present for each node
+            node_list: optional sorted array of node ids for each position in data.
+                       If None, positions are node ids.
+            """
             self._assert_instance(data, grblas.Vector)
             self.value = data
+            self.node_list = _check_node_list(self, node_list, data.size)
 
         @property
         def num_nodes(self):
             return self.value.nvals
 
         def __contains__(self, key):
-            return 0 <= key < len(self.value) and self.value[key].value is not None
+            if self.node_list is not None:
+                positions, found = _node_positions(
+                    self.node_list, self.value.size, np.array([key])
+                )
+                if not found[0]:
+                    return False
+                key = int(positions[0])
+            return 0 <= key < self.value.size and self.value[key].value is not None
+
+        def contains_many(self, node_ids):
+            idx, _ = self.value.to_values()
+            return np.isin(node_ids, _node_ids_from_positions(self.node_list, idx))
 
         class TypeMixin:
             @classmethod
@@ -104,17 +180,37 @@ if has_grblas:
                 ), f"num nodes mismatch: {v1.nvals} != {v2.nvals}"
                 assert aprops1 == aprops2, f"property mismatch: {aprops1} != {aprops2}"
                 # Compare
+                if not _same_node_list(obj1.node_list, obj2.node_list):
+                    idx1, _ = v1.to_values()
+                    idx2, _ = v2.to_values()
+                    ids1 = _node_ids_from_positions(obj1.node_list, np.asarray(idx1))
+                    ids2 = _node_ids_from_positions(obj2.node_list, np.asarray(idx2))
+                    assert (ids1 == ids2).all(), f"node ids do not match"
+                    return
                 shape_match = obj1.value.ewise_mult(
                     obj2.value, grblas.binary.pair
                 ).new()
                 assert shape_match.nvals == v1.nvals, f"node ids do not match"
 
     class GrblasNodeMap(NodeMapWrapper, abstract=NodeMap):
-        def __init__(self, data):
+        def __init__(self, data, node_list=None):
+            """
+            data: grblas.Vector of values for each node
+            node_list: optional sorted array of node ids for each position in data.
+                       If None, positions are node ids.
+            """
             self._assert_instance(data, grblas.Vector)
             self.value = data
+            self.node_list = _check_node_list(self, node_list, data.size)
 
         def __getitem__(self, node_id):
+            if self.node_list is not None:
+                positions, found = _node_positions(
+                    self.node_list, self.value.size, np.array([node_id])
+                )
+                if not found[0]:
+                    raise ValueError(f"node {node_id} is not in the NodeMap")
+                node_id = int(positions[0])
             return self.value[node_id].value
 
         @property
@@ -122,7 +218,32 @@ if has_grblas:
             return self.value.nvals
 
         def __contains__(self, key):
-            return 0 <= key < len(self.value) and self.value[key].value is not None
+            if self.node_list is not None:
+                positions, found = _node_positions(
+                    self.node_list, self.value.size, np.array([key])
+                )
+                if not found[0]:
+                    return False
+                key = int(positions[0])
+            return 0 <= key < self.value.size and self.value[key].value is not None
+
+        def contains_many(self, node_ids):
+            idx, _ = self.value.to_values()
+            return np.isin(node_ids, _node_ids_from_positions(self.node_list, idx))
+
+        def get_many(self, node_ids):
+            node_ids = np.asarray(node_ids)
+            found = self.contains_many(node_ids)
+            if not found.all():
+                raise ValueError(f"nodes {node_ids[~found]} are not in the NodeMap")
+            positions, _ = _node_positions(self.node_list, self.value.size, node_ids)
+            _, vals = self.value[positions.tolist()].new().to_values()
+            return np.asarray(vals)
+
+        def items_arrays(self):
+            idx, vals = self.value.to_values()
+            idx = np.asarray(idx)
+            return _node_ids_from_positions(self.node_list, idx), np.asarray(vals)
 
         class TypeMixin:
             @classmethod
@@ -154,11 +275,23 @@ if has_grblas:
                 abs_tol=0.0,
             ):
                 v1, v2 = obj1.value, obj2.value
-                assert v1.size == v2.size, f"size mismatch: {v1.size} != {v2.size}"
                 assert (
                     v1.nvals == v2.nvals
                 ), f"num nodes mismatch: {v1.nvals} != {v2.nvals}"
                 assert aprops1 == aprops2, f"property mismatch: {aprops1} != {aprops2}"
+                if not _same_node_list(obj1.node_list, obj2.node_list):
+                    # Compare using node ids rather than positions
+                    ids1, vals1 = obj1.items_arrays()
+                    ids2, vals2 = obj2.items_arrays()
+                    assert (ids1 == ids2).all(), f"node id mismatch: {ids1} != {ids2}"
+                    if issubclass(vals1.dtype.type, np.floating):
+                        assert np.isclose(
+                            vals1, vals2, rtol=rel_tol, atol=abs_tol
+                        ).all()
+                    else:
+                        assert (vals1 == vals2).all()
+                    return
+                assert v1.size == v2.size, f"size mismatch: {v1.size} != {v2.size}"
                 # Compare
                 if v1.dtype.name in {"FP32", "FP64"}:
                     assert obj1.value.isclose(
@@ -217,12 +350,18 @@ if has_grblas:
 
     class GrblasEdgeSet(EdgeSetWrapper, abstract=EdgeSet):
         def __init__(
-            self, data, transposed=False,
+            self, data, transposed=False, node_list=None,
         ):
+            """
+            data: square grblas.Matrix adjacency matrix
+            node_list: optional sorted array of node ids for each row/column of data.
+                       If None, row/column indices are node ids.
+            """
             self._assert_instance(data, grblas.Matrix)
             self._assert(data.nrows == data.ncols, "adjacency matrix must be square")
             self.value = data
             self.transposed = transposed
+            self.node_list = _check_node_list(self, node_list, data.nrows)
 
         def show(self):
             return self.value.show()
@@ -255,11 +394,19 @@ if has_grblas:
                 abs_tol=0.0,
             ):
                 v1, v2 = obj1.value, obj2.value
-                assert v1.nrows == v2.nrows, f"size mismatch: {v1.nrows} != {v2.nrows}"
                 assert (
                     v1.nvals == v2.nvals
                 ), f"num nodes mismatch: {v1.nvals} != {v2.nvals}"
                 assert aprops1 == aprops2, f"property mismatch: {aprops1} != {aprops2}"
+                if not _same_node_list(obj1.node_list, obj2.node_list):
+                    # Compare using node ids rather than positions
+                    rows1, cols1, _ = _edge_arrays(obj1)
+                    rows2, cols2, _ = _edge_arrays(obj2)
+                    assert (rows1 == rows2).all() and (
+                        cols1 == cols2
+                    ).all(), f"edges do not match"
+                    return
+                assert v1.nrows == v2.nrows, f"size mismatch: {v1.nrows} != {v2.nrows}"
                 # Handle transposed states
                 d1 = v1.T if obj1.transposed else v1
                 d2 = v2.T if obj2.transposed else v2
@@ -269,12 +416,18 @@ if has_grblas:
 
     class GrblasEdgeMap(EdgeMapWrapper, abstract=EdgeMap):
         def __init__(
-            self, data, transposed=False,
+            self, data, transposed=False, node_list=None,
         ):
+            """
+            data: square grblas.Matrix adjacency matrix
+            node_list: optional sorted array of node ids for each row/column of data.
+                       If None, row/column indices are node ids.
+            """
             self._assert_instance(data, grblas.Matrix)
             self._assert(data.nrows == data.ncols, "adjacency matrix must be square")
             self.value = data
             self.transposed = transposed
+            self.node_list = _check_node_list(self, node_list, data.nrows)
 
         def show(self):
             return self.value.show()
@@ -326,11 +479,25 @@ if has_grblas:
                 abs_tol=0.0,
             ):
                 v1, v2 = obj1.value, obj2.value
-                assert v1.nrows == v2.nrows, f"size mismatch: {v1.nrows} != {v2.nrows}"
                 assert (
                     v1.nvals == v2.nvals
                 ), f"num nodes mismatch: {v1.nvals} != {v2.nvals}"
                 assert aprops1 == aprops2, f"property mismatch: {aprops1} != {aprops2}"
+                if not _same_node_list(obj1.node_list, obj2.node_list):
+                    # Compare using node ids rather than positions
+                    rows1, cols1, vals1 = _edge_arrays(obj1)
+                    rows2, cols2, vals2 = _edge_arrays(obj2)
+                    assert (rows1 == rows2).all() and (
+                        cols1 == cols2
+                    ).all(), f"edges do not match"
+                    if issubclass(vals1.dtype.type, np.floating):
+                        assert np.isclose(
+                            vals1, vals2, rtol=rel_tol, atol=abs_tol
+                        ).all()
+                    else:
+                        assert (vals1 == vals2).all()
+                    return
+                assert v1.nrows == v2.nrows, f"size mismatch: {v1.nrows} != {v2.nrows}"
                 # Handle transposed states
                 d1 = v1.T if obj1.transposed else v1
                 d2 = v2.T if obj2.transposed else v2
@@ -351,3 +518,7 @@ if has_grblas:
             self._assert_instance(edges, (GrblasEdgeSet, GrblasEdgeMap))
             if nodes is not None:
                 self._assert_instance(nodes, (GrblasNodeSet, GrblasNodeMap))
+                self._assert(
+                    _same_node_list(edges.node_list, nodes.node_list),
+                    "edges and nodes must have the same node_list",
+                )
@@ -5,11 +5,13 @@ from typing import Tuple, Iterable, Any, Callable
 
 
 if has_networkx:
+    import random
     import networkx as nx
     import numpy as np
     from .types import NetworkXGraph, NetworkXBipartiteGraph
     from ..python.types import PythonNodeMap, PythonNodeSet
     from ..numpy.types import NumpyVector
+    from ...algorithms.centrality import betweenness_sample_size
 
     @concrete_algorithm("centrality.pagerank")
     def nx_pagerank(
@@ -38,6 +40,18 @@ if has_networkx:
         )
         return PythonNodeMap(katz_centrality_scores)
 
+    @concrete_algorithm("centrality.eigenvector")
+    def nx_eigenvector_centrality(
+        graph: NetworkXGraph, maxiter: int, tolerance: float,
+    ) -> PythonNodeMap:
+        eigenvector_centrality_scores = nx.eigenvector_centrality(
+            graph.value,
+            max_iter=maxiter,
+            tol=tolerance,
+            weight=graph.edge_weight_label,
+        )
+        return PythonNodeMap(eigenvector_centrality_scores)
+
     @concrete_algorithm("cluster.triangle_count")
     def nx_triangle_count(graph: NetworkXGraph) -> int:
         triangles = nx.triangles(graph.value)
@@ -46,6 +60,10 @@ if has_networkx:
         total_triangles = sum(triangles.values()) // 3
         return total_triangles
 
+    @concrete_algorithm("cluster.triangles")
+    def nx_node_triangles(graph: NetworkXGraph) -> PythonNodeMap:
+        return PythonNodeMap(nx.triangles(graph.value))
+
     @concrete_algorithm("clustering.connected_components")
     def nx_connected_components(graph: NetworkXGraph) -> PythonNodeMap:
         index_to_label = dict()
@@ -85,6 +103,10 @@ if has_networkx:
         k_core_graph = nx.k_core(graph.value, k)
         return NetworkXGraph(k_core_graph, edge_weight_label=graph.edge_weight_label)
 
+    @concrete_algorithm("subgraph.core_number")
+    def nx_core_number(graph: NetworkXGraph) -> PythonNodeMap:
+        return PythonNodeMap(nx.core_number(graph.value))
+
     @concrete_algorithm("traversal.bellman_ford")
     def nx_bellman_ford(
         graph: NetworkXGraph, source_node: NodeID
@@ -138,24 +160,131 @@ if has_networkx:
         )
         return PythonNodeMap(node_to_score_map,)
 
+    @concrete_algorithm("centrality.approximate_betweenness")
+    def nx_approximate_betweenness_centrality(
+        graph: NetworkXGraph,
+        k: mg.Optional[int],
+        epsilon: float,
+        normalize: bool,
+        seed: mg.Optional[int],
+    ) -> PythonNodeMap:
+        nodes = sorted(graph.value.nodes())
+        k = betweenness_sample_size(len(nodes), k, epsilon)
+        sources = random.Random(seed).sample(nodes, k)
+        node_to_score_map = nx.betweenness_centrality_subset(
+            graph.value,
+            sources=sources,
+            targets=nodes,
+            normalized=normalize,
+            weight=graph.edge_weight_label,
+        )
+        # Scale the sampled sources up to all nodes
+        if k > 0:
+            scale = len(nodes) / k
+            node_to_score_map = {
+                node: score * scale for node, score in node_to_score_map.items()
+            }
+        return PythonNodeMap(node_to_score_map,)
+
     @concrete_algorithm("traversal.bfs_iter")
     def nx_breadth_first_search(
         graph: NetworkXGraph, source_node: NodeID, depth_limit: int
     ) -> NumpyVector:
         bfs_ordered_node_array = np.array(
-            nx.breadth_first_search.bfs_tree(graph.value, source_node)
+            nx.breadth_first_search.bfs_tree(
+                graph.value,
+                source_node,
+                depth_limit=depth_limit if depth_limit >= 0 else None,
+            )
         )
         return NumpyVector(bfs_ordered_node_array)
 
+    @concrete_algorithm("traversal.bfs_tree")
+    def nx_breadth_first_search_tree(
+        graph: NetworkXGraph, source_node: NodeID, depth_limit: int
+    ) -> Tuple[PythonNodeMap, PythonNodeMap]:
+        depth_limit = depth_limit if depth_limit >= 0 else None
+        depth_map = nx.single_source_shortest_path_length(
+            graph.value, source_node, cutoff=depth_limit
+        )
+        parent_map = dict(
+            nx.bfs_predecessors(graph.value, source_node, depth_limit=depth_limit)
+        )
+        parent_map[source_node] = source_node
+        return (
+            PythonNodeMap(depth_map,),
+            PythonNodeMap(parent_map,),
+        )
+
+    def _multi_source_graph(graph: NetworkXGraph, edges) -> NetworkXGraph:
+        out = nx.DiGraph()
+        out.add_nodes_from(graph.value.nodes())
+        out.add_weighted_edges_from(edges)
+        return NetworkXGraph(out)
+
+    @concrete_algorithm("traversal.bfs_multi")
+    def nx_breadth_first_search_multi(
+        graph: NetworkXGraph, source_nodes: PythonNodeSet, depth_limit: int
+    ) -> Tuple[NetworkXGraph, NetworkXGraph]:
+        depth_limit = depth_limit if depth_limit >= 0 else None
+        parent_edges = []
+        depth_edges = []
+        for source_node in sorted(source_nodes.value):
+            parent_edges.append((source_node, source_node, source_node))
+            parent_edges.extend(
+                (source_node, v, p)
+                for v, p in nx.bfs_predecessors(
+                    graph.value, source_node, depth_limit=depth_limit
+                )
+            )
+            depth_map = nx.single_source_shortest_path_length(
+                graph.value, source_node, cutoff=depth_limit
+            )
+            depth_edges.extend((source_node, v, d) for v, d in depth_map.items())
+        return (
+            _multi_source_graph(graph, parent_edges),
+            _multi_source_graph(graph, depth_edges),
+        )
+
+    @concrete_algorithm("traversal.dijkstra_multi")
+    def nx_dijkstra_multi(
+        graph: NetworkXGraph, source_nodes: PythonNodeSet
+    ) -> Tuple[NetworkXGraph, NetworkXGraph]:
+        parent_edges = []
+        distance_edges = []
+        for source_node in sorted(source_nodes.value):
+            predecessors_map, distance_map = nx.dijkstra_predecessor_and_distance(
+                graph.value, source_node
+            )
+            parent_edges.extend(
+                (source_node, v, parents[0] if len(parents) > 0 else source_node)
+                for v, parents in predecessors_map.items()
+            )
+            distance_edges.extend((source_node, v, d) for v, d in distance_map.items())
+        return (
+            _multi_source_graph(graph, parent_edges),
+            _multi_source_graph(graph, distance_edges),
+        )
+
     @concrete_algorithm("bipartite.graph_projection")
     def nx_graph_projection(
-        bgraph: NetworkXBipartiteGraph, nodes_retained: int
+        bgraph: NetworkXBipartiteGraph,
+        nodes_retained: int,
+        weighted: bool,
+        normalize: bool,
     ) -> NetworkXGraph:
-        g_proj = nx.projected_graph(bgraph.value, bgraph.nodes[nodes_retained])
+        nodes = bgraph.nodes[nodes_retained]
+        if weighted:
+            g_proj = nx.bipartite.weighted_projected_graph(
+                bgraph.value, nodes, ratio=normalize
+            )
+        else:
+            g_proj = nx.projected_graph(bgraph.value, nodes)
         return NetworkXGraph(
             g_proj,
             node_weight_label=bgraph.node_weight_label,
-            edge_weight_label=bgraph.edge_weight_label,
+            # weighted_projected_graph always stores counts under "weight"
+            edge_weight_label="weight" if weighted else bgraph.edge_weight_label,
         )
 
     @concrete_algorithm("util.graph.aggregate_edges")
@@ -218,9 +347,15 @@ if has_networkx and has_community:
     from ..python.types import PythonNodeMap
 
     @concrete_algorithm("clustering.louvain_community")
-    def nx_louvain_community(graph: NetworkXGraph) -> Tuple[PythonNodeMap, float]:
-        index_to_label = community_louvain.best_partition(graph.value)
-        modularity_score = community_louvain.modularity(index_to_label, graph.value)
+    def nx_louvain_community(
+        graph: NetworkXGraph, seed: mg.Optional[int]
+    ) -> Tuple[PythonNodeMap, float]:
+        index_to_label = community_louvain.best_partition(
+            graph.value, weight=graph.edge_weight_label, random_state=seed
+        )
+        modularity_score = community_louvain.modularity(
+            index_to_label, graph.value, weight=graph.edge_weight_label
+        )
         return (
             PythonNodeMap(index_to_label,),
             modularity_score,
@@ -2,11 +2,8 @@ import numpy as np
 from functools import reduce
 from metagraph import concrete_algorithm, NodeID
 from .types import NumpyVector, NumpyNodeMap, NumpyNodeSet
+from .vectorize import vectorize
 from typing import Any, Callable, Optional
-from .. import has_numba
-
-if has_numba:
-    import numba
 
 
 @concrete_algorithm("util.nodeset.choose_random")
@@ -25,25 +22,39 @@ def np_nodeset_from_vector(x: NumpyVector) -> NumpyNodeSet:
     return NumpyNodeSet(node_ids=data)
 
 
+def argsort_top_k(
+    values: np.ndarray, ascending: bool, limit: Optional[int]
+) -> np.ndarray:
+    """
+    Positions of values in sorted order, keeping only the first `limit` if given.
+
+    With a limit, np.argpartition selects the winners in O(n) and only they are sorted.
+    """
+    num_values = len(values)
+    if not limit or limit >= num_values:
+        positions = np.argsort(values)
+        return positions if ascending else np.flip(positions)
+    if ascending:
+        positions = np.argpartition(values, limit - 1)[:limit]
+    else:
+        positions = np.argpartition(values, num_values - limit)[num_values - limit :]
+    positions = positions[np.argsort(values[positions])]
+    return positions if ascending else np.flip(positions)
+
+
 @concrete_algorithm("util.nodemap.sort")
 def np_nodemap_sort(
     x: NumpyNodeMap, ascending: bool, limit: Optional[int]
 ) -> NumpyVector:
     if x.id2pos is not None:
-        positions_of_sorted_values = np.argsort(x.value)
-        ids_of_sorted_values = x.pos2id[positions_of_sorted_values]
+        ids_of_sorted_values = x.pos2id[argsort_top_k(x.value, ascending, limit)]
     elif x.mask is not None:
-        ids_of_sorted_values = np.argsort(x.value)
-        missing_value_ids = np.flatnonzero(~x.mask)
-        ids_of_sorted_values = np.setdiff1d(
-            ids_of_sorted_values, missing_value_ids, assume_unique=True
-        )
+        # Only sort the present values rather than removing missing ids afterward
+        present_ids = np.flatnonzero(x.mask)
+        positions = argsort_top_k(x.value[present_ids], ascending, limit)
+        ids_of_sorted_values = present_ids[positions]
     else:
-        ids_of_sorted_values = np.argsort(x.value)
-    if not ascending:
-        ids_of_sorted_values = np.flip(ids_of_sorted_values)
-    if limit:
-        ids_of_sorted_values = ids_of_sorted_values[:limit]
+        ids_of_sorted_values = argsort_top_k(x.value, ascending, limit)
     return NumpyVector(ids_of_sorted_values)
 
 
@@ -55,7 +66,7 @@ def np_nodemap_select(x: NumpyNodeMap, nodes: NumpyNodeSet) -> NumpyNodeMap:
         else:
             select_nodes = nodes.node_array
         new_pos2id = np.intersect1d(x.pos2id, select_nodes)
-        positions_to_keep = np.array([x.id2pos[node_id] for node_id in new_pos2id])
+        positions_to_keep = x.id2pos.positions(new_pos2id)
         new_data = x.value[positions_to_keep].copy()
         selected_node_map = NumpyNodeMap(new_data, node_ids=new_pos2id)
     else:
@@ -82,8 +93,7 @@ def np_nodemap_select(x: NumpyNodeMap, nodes: NumpyNodeSet) -> NumpyNodeMap:
 
 @concrete_algorithm("util.nodemap.filter")
 def np_nodemap_filter(x: NumpyNodeMap, func: Callable[[Any], bool]) -> NumpyNodeSet:
-    # TODO consider caching this somewhere or enforcing that only vectorized functions are given
-    func_vectorized = numba.vectorize(func) if has_numba else np.vectorize(func)
+    func_vectorized = vectorize(func, x.value.dtype)
     if x.id2pos is not None:
         filtered_positions = np.flatnonzero(func_vectorized(x.value))
         filtered_ids = x.pos2id[filtered_positions]
@@ -99,12 +109,11 @@ def np_nodemap_filter(x: NumpyNodeMap, func: Callable[[Any], bool]) -> NumpyNode
 
 @concrete_algorithm("util.nodemap.apply")
 def np_nodemap_apply(x: NumpyNodeMap, func: Callable[[Any], Any]) -> NumpyNodeMap:
-    # TODO consider caching this somewhere or enforcing that only vectorized functions are given
-    func_vectorized = numba.vectorize(func) if has_numba else np.vectorize(func)
+    func_vectorized = vectorize(func, x.value.dtype)
     if x.id2pos is not None:
         new_node_map = NumpyNodeMap(func_vectorized(x.value), node_ids=x.pos2id.copy())
     elif x.mask is not None:
-        results = func_vectorized(new_node_map.value[new_node_map.mask])
+        results = func_vectorized(x.value[x.mask])
         new_data = np.empty_like(x.value, dtype=results.dtype)
         new_data[x.mask] = results
         new_node_map = NumpyNodeMap(new_data, mask=x.mask.copy())
@@ -13,7 +13,7 @@ def nodemap_to_nodeset(x: NumpyNodeMap, **props) -> NumpyNodeSet:
 @translator
 def nodeset_to_pynodeset(x: NumpyNodeSet, **props) -> PythonNodeSet:
     if x.mask is None:
-        return PythonNodeSet(x.node_set)
+        return PythonNodeSet(set(x.node_array.tolist()))
     else:
         return PythonNodeSet(set(np.flatnonzero(x.mask)))
 
@@ -25,26 +25,13 @@ def pynodeset_to_nodeset(x: PythonNodeSet, **props) -> NumpyNodeSet:
 
 @translator
 def nodemap_to_pynodeset(x: NumpyNodeMap, **props) -> PythonNodeSet:
-    if x.mask is not None:
-        nodes = set(np.flatnonzero(x.mask))
-    elif x.id2pos is not None:
-        nodes = set(x.id2pos)
-    else:
-        nodes = set(range(len(x.value)))
-    return PythonNodeSet(nodes)
+    return PythonNodeSet(set(x.nodes().tolist()))
 
 
 @translator
 def nodemap_from_python(x: PythonNodeMap, **props) -> NumpyNodeMap:
-    dtype = x._determine_dtype()
-    np_dtype = dtype if dtype != "str" else "object"
-    data = np.empty((len(x.value),), dtype=np_dtype)
-    lookup = {}
-    pyvals = x.value
-    for pos, node_id in enumerate(sorted(pyvals)):
-        data[pos] = pyvals[node_id]
-        lookup[node_id] = pos
-    return NumpyNodeMap(data, node_ids=lookup)
+    node_ids, data = x.items_arrays()
+    return NumpyNodeMap(data, node_ids=node_ids)
 
 
 if has_scipy:
@@ -5,11 +5,100 @@ from metagraph.types import Vector, Matrix, NodeSet, NodeMap
 from metagraph.wrappers import NodeSetWrapper, NodeMapWrapper
 
 
+class NodeIndex:
+    """
+    Maps NodeIDs to their position in a sorted numpy array of node ids.
+
+    This provides the read-only mapping interface of a dict (``in``, ``[]``, ``get``,
+    ``len``, iteration, ``items``) without storing a Python object per node.
+    Lookups use binary search, and ``positions`` and ``contains`` accept whole
+    arrays of node ids.
+    """
+
+    def __init__(self, node_ids: np.ndarray):
+        self.node_ids = node_ids
+
+    def __len__(self):
+        return len(self.node_ids)
+
+    def __iter__(self):
+        return iter(self.node_ids)
+
+    def __contains__(self, node_id):
+        try:
+            return bool(self.contains(node_id))
+        except TypeError:
+            return False
+
+    def __getitem__(self, node_id):
+        try:
+            return int(self.positions(node_id))
+        except (ValueError, TypeError):
+            raise KeyError(node_id)
+
+    def get(self, node_id, default=None):
+        try:
+            return self[node_id]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return self.node_ids
+
+    def values(self):
+        return np.arange(len(self.node_ids))
+
+    def items(self):
+        return zip(self.node_ids, range(len(self.node_ids)))
+
+    def copy(self):
+        return NodeIndex(self.node_ids.copy())
+
+    def _search(self, node_ids):
+        pos = np.searchsorted(self.node_ids, node_ids)
+        if len(self.node_ids) == 0:
+            return pos, np.zeros(np.shape(pos), dtype=bool)
+        # Out-of-range ids are clipped so they can be compared; they will not match
+        found = self.node_ids[np.minimum(pos, len(self.node_ids) - 1)] == node_ids
+        return pos, found
+
+    def contains(self, node_ids):
+        """Boolean array indicating which of node_ids are in the index"""
+        return self._search(node_ids)[1]
+
+    def positions(self, node_ids):
+        """
+        Positions of node_ids within the index.
+
+        Raises ValueError if any of node_ids are missing.
+        """
+        pos, found = self._search(node_ids)
+        if not np.all(found):
+            missing = np.asarray(node_ids)[~np.asarray(found)]
+            raise ValueError(f"nodes {missing} are not in the index")
+        return pos
+
+
+def _mask_contains(mask, node_ids):
+    in_range = (node_ids >= 0) & (node_ids < len(mask))
+    ret = np.zeros(node_ids.shape, dtype=bool)
+    ret[in_range] = mask[node_ids[in_range]]
+    return ret
+
+
 class NumpyNodeSet(NodeSetWrapper, abstract=NodeSet):
+    """
+    NumpyNodeSet stores node ids as a numpy array or as a boolean mask.
+
+    Membership tests on the array use binary search; a Python set of the node ids
+    is only built if ``node_set`` is accessed.
+    """
+
     def __init__(self, node_ids=None, *, mask=None):
         self.node_array = None
-        self.node_set = None
         self.mask = None
+        self._node_set = None
+        self._node_index = None
         self._assert(
             (node_ids is None) ^ (mask is None),
             "Either node_ids or mask must be present, but not both",
@@ -20,15 +109,29 @@ class NumpyNodeSet(NodeSetWrapper, abstract=NodeSet):
             self.mask = mask
         else:
             if isinstance(node_ids, set):
-                self.node_set = node_ids
+                self._node_set = node_ids
                 self.node_array = np.array(list(node_ids))
                 self.node_array.sort()
             elif isinstance(node_ids, np.ndarray):
                 self.node_array = node_ids
-                self.node_set = set(node_ids)
             else:
                 raise TypeError("node_ids must be a set or numpy array")
 
+    @property
+    def node_set(self):
+        if self._node_set is None and self.node_array is not None:
+            self._node_set = set(self.node_array.tolist())
+        return self._node_set
+
+    @property
+    def node_index(self):
+        if self._node_index is None and self.node_array is not None:
+            node_array = self.node_array
+            if np.any(node_array[1:] < node_array[:-1]):
+                node_array = np.sort(node_array)
+            self._node_index = NodeIndex(node_array)
+        return self._node_index
+
     @property
     def num_nodes(self):
         if self.mask is not None:
@@ -61,7 +164,14 @@ class NumpyNodeSet(NodeSetWrapper, abstract=NodeSet):
         if self.mask is not None:
             return 0 <= key < len(self.mask) and self.mask[key]
         else:
-            return key in self.node_set
+            return key in self.node_index
+
+    def contains_many(self, node_ids):
+        node_ids = np.asarray(node_ids)
+        if self.mask is not None:
+            return _mask_contains(self.mask, node_ids)
+        else:
+            return self.node_index.contains(node_ids)
 
     class TypeMixin:
         allowed_props = {"is_compact": [True, False]}
@@ -210,26 +320,26 @@ class NumpyNodeMap(NodeMapWrapper, abstract=NodeMap):
             self.mask = mask
         elif node_ids is not None:
             if isinstance(node_ids, dict):
-                id2pos = node_ids
                 pos2id = np.empty((len(node_ids),), dtype=int)
-                for node_id, pos in node_ids.items():
-                    pos2id[pos] = node_id
+                positions = np.fromiter(node_ids.values(), int, len(node_ids))
+                pos2id[positions] = np.fromiter(node_ids.keys(), int, len(node_ids))
+            elif isinstance(node_ids, NodeIndex):
+                pos2id = node_ids.node_ids
             elif isinstance(node_ids, np.ndarray):
                 pos2id = node_ids
-                id2pos = {node_id: pos for pos, node_id in enumerate(node_ids)}
             else:
                 raise ValueError(f"Invalid type for node_ids: {type(node_ids)}")
-            self.id2pos = id2pos
+            self.id2pos = NodeIndex(pos2id)
             self.pos2id = pos2id
             # Ensure all node ids are monotonically increasing
             self._assert(np.all(np.diff(pos2id) > 0), "Node IDs must be ordered")
             self._assert(
-                len(id2pos) == len(data), f"node_ids must be the same length as data"
+                len(pos2id) == len(data), f"node_ids must be the same length as data"
             )
 
     def __getitem__(self, node_id):
         if self.mask is not None:
-            if self.mask[node_id]:
+            if node_id not in self:
                 raise ValueError(f"node {node_id} is not in the NodeMap")
         elif self.id2pos is not None:
             if node_id not in self.id2pos:
@@ -248,7 +358,7 @@ class NumpyNodeMap(NodeMapWrapper, abstract=NodeMap):
 
     def copy(self):
         mask = None if self.mask is None else self.mask.copy()
-        node_ids = None if self.id2pos is None else self.id2pos.copy()
+        node_ids = None if self.pos2id is None else self.pos2id.copy()
         copied_node_map = NumpyNodeMap(self.value.copy(), mask=mask, node_ids=node_ids)
         return copied_node_map
 
@@ -266,8 +376,34 @@ class NumpyNodeMap(NodeMapWrapper, abstract=NodeMap):
     def __contains__(self, key):
         if self.mask is not None:
             return 0 <= key < len(self.mask) and self.mask[key]
-        else:
+        elif self.id2pos is not None:
             return key in self.id2pos
+        else:
+            return 0 <= key < len(self.value)
+
+    def contains_many(self, node_ids):
+        node_ids = np.asarray(node_ids)
+        if self.mask is not None:
+            return _mask_contains(self.mask, node_ids)
+        elif self.id2pos is not None:
+            return self.id2pos.contains(node_ids)
+        else:
+            return (node_ids >= 0) & (node_ids < len(self.value))
+
+    def get_many(self, node_ids):
+        node_ids = np.asarray(node_ids)
+        if self.id2pos is not None:
+            positions, found = self.id2pos._search(node_ids)
+        else:
+            positions, found = node_ids, self.contains_many(node_ids)
+        if not np.all(found):
+            raise ValueError(f"nodes {node_ids[~found]} are not in the NodeMap")
+        return self.value[positions]
+
+    def items_arrays(self):
+        if self.mask is not None:
+            return np.flatnonzero(self.mask), self.value[self.mask]
+        return self.nodes(), self.value
 
     class TypeMixin:
         allowed_props = {"is_compact": [True, False]}
@@ -0,0 +1,185 @@
+import operator
+import types
+import weakref
+import numpy as np
+from typing import Any, Callable, Optional, Sequence
+from .. import has_numba
+
+if has_numba:
+    import numba
+    from numba.np.ufunc.dufunc import DUFunc
+
+    # Already elementwise, so used directly
+    _VECTORIZED_TYPES = (np.ufunc, DUFunc)
+else:
+    _VECTORIZED_TYPES = (np.ufunc,)
+
+# Maps user callables (held weakly) to {input dtype: vectorized function}
+_vectorized_cache = weakref.WeakKeyDictionary()
+
+# Input dtype kinds numba can compile for: bool, int, unsigned int, float, complex
+_NUMBA_KINDS = set("biufc")
+
+
+def _detached_copy(func: types.FunctionType) -> types.FunctionType:
+    """
+    Copy of func sharing its code, globals and closure.
+
+    Compiled functions keep a reference to the Python function they were built from.
+    Compiling a copy means the cache value does not keep its own weak key alive.
+    """
+    copy = types.FunctionType(
+        func.__code__,
+        func.__globals__,
+        func.__name__,
+        func.__defaults__,
+        func.__closure__,
+    )
+    copy.__kwdefaults__ = func.__kwdefaults__
+    copy.__qualname__ = func.__qualname__
+    copy.__module__ = func.__module__
+    return copy
+
+
+def vectorize(
+    func: Callable, dtype=None, signatures: Optional[Sequence[str]] = None
+) -> Callable:
+    """
+    Returns an elementwise version of func to apply to arrays of the given dtype.
+
+    numpy ufuncs and functions already vectorized by numba are returned as-is.
+    Plain Python functions are compiled with numba.vectorize and cached for as long
+    as func is alive, so repeated calls with the same func and dtype only compile once.
+    Passing signatures such as ``["float64(float64)"]`` compiles those ahead of time
+    and caches the result for each of their input dtypes. Without numba, or for dtypes
+    numba cannot handle, np.vectorize is used.
+    """
+    if isinstance(func, _VECTORIZED_TYPES):
+        return func
+    if dtype is not None:
+        dtype = np.dtype(dtype)
+    use_numba = has_numba and (dtype is None or dtype.kind in _NUMBA_KINDS)
+    if not use_numba:
+        return np.vectorize(func)
+    if not isinstance(func, types.FunctionType):
+        # Other callables (e.g. numba dispatchers) cannot be copied, so are not cached
+        return (
+            numba.vectorize(signatures)(func) if signatures else numba.vectorize(func)
+        )
+
+    cached = _vectorized_cache.setdefault(func, {})
+    if signatures:
+        vectorized = numba.vectorize(list(signatures))(_detached_copy(func))
+        for type_codes in vectorized.types:
+            cached[np.dtype(type_codes[0])] = vectorized
+        return vectorized
+    vectorized = cached.get(dtype)
+    if vectorized is None:
+        # Without signatures, numba compiles on the first call for each input dtype
+        vectorized = numba.vectorize(_detached_copy(func))
+        cached[dtype] = vectorized
+    return vectorized
+
+
+# Python callables with an equivalent numpy ufunc, which reduces without boxing values
+_UFUNC_EQUIVALENTS = {
+    operator.add: np.add,
+    operator.mul: np.multiply,
+    operator.and_: np.bitwise_and,
+    operator.or_: np.bitwise_or,
+    operator.xor: np.bitwise_xor,
+    min: np.minimum,
+    max: np.maximum,
+}
+
+# Commutative and associative ufuncs, for which reduceat gives the same result as a fold
+_REDUCEAT_UFUNCS = {
+    np.add,
+    np.multiply,
+    np.bitwise_and,
+    np.bitwise_or,
+    np.bitwise_xor,
+    np.logical_and,
+    np.logical_or,
+    np.logical_xor,
+    np.minimum,
+    np.maximum,
+    np.fmin,
+    np.fmax,
+}
+
+# Maps user callables (held weakly) to a compiled segmented reduction kernel
+_reducer_cache = weakref.WeakKeyDictionary()
+
+# Maps user callables (held weakly) to the (values, out) dtypes numba could not compile
+# them for, so later calls fall back without compiling again
+_unjitable_cache = weakref.WeakKeyDictionary()
+
+
+def _python_reduce_segments(func, indptr, values, out):
+    # Same fold order as the compiled kernel below
+    values = values.tolist()
+    for row in range(len(indptr) - 1):
+        start, end = indptr[row], indptr[row + 1]
+        if start < end:
+            acc = out[row]
+            for value in values[start:end]:
+                acc = func(value, acc)
+            out[row] = acc
+
+
+def _compile_reducer(func: types.FunctionType):
+    jitted = numba.njit(_detached_copy(func))
+
+    @numba.njit
+    def reduce_segments(indptr, values, out):
+        for row in range(len(indptr) - 1):
+            acc = out[row]
+            for j in range(indptr[row], indptr[row + 1]):
+                acc = jitted(values[j], acc)
+            out[row] = acc
+
+    return reduce_segments
+
+
+def reduce_segments(
+    func: Callable[[Any, Any], Any],
+    indptr: np.ndarray,
+    values: np.ndarray,
+    out: np.ndarray,
+):
+    """
+    Folds the binary func over each segment ``values[indptr[i]:indptr[i + 1]]`` into
+    ``out[i]``, which holds the starting value and is updated in place.
+    Like the networkx aggregate_edges, each value is folded in order as
+    ``acc = func(value, acc)``, starting from ``acc = out[i]``.
+
+    Commutative and associative numpy ufuncs, and Python callables with an equivalent
+    ufunc such as operator.add or min, reduce directly on the typed values. Other plain Python functions are
+    compiled with numba (and cached like `vectorize`). Anything else, including
+    object or string values and functions numba fails to compile, falls back to
+    reducing Python objects.
+    """
+    typed = values.dtype.kind in _NUMBA_KINDS and out.dtype.kind in _NUMBA_KINDS
+    ufunc = _UFUNC_EQUIVALENTS.get(func, func)
+    if typed and ufunc in _REDUCEAT_UFUNCS:
+        keep_mask = np.diff(indptr) > 0
+        reduced_values = ufunc.reduceat(values, indptr[:-1][keep_mask])
+        out[keep_mask] = ufunc(out[keep_mask], reduced_values)
+    elif (
+        has_numba
+        and typed
+        and isinstance(func, types.FunctionType)
+        and (values.dtype, out.dtype) not in _unjitable_cache.get(func, ())
+    ):
+        reducer = _reducer_cache.get(func)
+        if reducer is None:
+            reducer = _reducer_cache[func] = _compile_reducer(func)
+        try:
+            reducer(indptr, values, out)
+        except numba.core.errors.TypingError:
+            # func is not jit-able for these dtypes; out is untouched since compilation failed
+            _unjitable_cache.setdefault(func, set()).add((values.dtype, out.dtype))
+            _python_reduce_segments(func, indptr, values, out)
+    else:
+        _python_reduce_segments(func, indptr, values, out)
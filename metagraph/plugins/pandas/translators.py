@@ -1,6 +1,7 @@
 from metagraph import translator
 from metagraph.plugins import has_pandas, has_networkx, has_scipy
 import operator
+import numpy as np
 
 if has_pandas:
     from .types import PandasEdgeMap, PandasEdgeSet
@@ -15,42 +16,61 @@ if has_pandas and has_scipy:
     import scipy.sparse as ss
     from ..scipy.types import ScipyEdgeMap, ScipyEdgeSet
 
-    @translator
-    def scipy_edgemap_to_pandas_edgemap(x: ScipyEdgeMap, **props) -> PandasEdgeMap:
-        is_directed = ScipyEdgeMap.Type.compute_abstract_properties(x, {"is_directed"})[
-            "is_directed"
-        ]
+    def _scipy_edges_to_columns(x, is_directed):
+        """
+        Return arrays of source ids, target ids, and values for the edges in x.
+
+        For undirected graphs, only one copy of each edge (source < target) is kept.
+        """
         coo_matrix = x.value.tocoo()
-        get_node_from_pos = lambda index: x.node_list[index]
-        row_ids = map(get_node_from_pos, coo_matrix.row)
-        column_ids = map(get_node_from_pos, coo_matrix.col)
-        rcw_triples = zip(row_ids, column_ids, coo_matrix.data)
-        if not is_directed:
-            rcw_triples = filter(lambda triple: triple[0] < triple[1], rcw_triples)
-        df = pd.DataFrame(rcw_triples, columns=["source", "target", "weight"])
-        return PandasEdgeMap(df, is_directed=is_directed)
+        node_list = np.asarray(x.node_list)
+        row_ids = node_list[coo_matrix.row]
+        column_ids = node_list[coo_matrix.col]
+        if is_directed:
+            keep = slice(None)
+        else:
+            keep = row_ids < column_ids
+        return row_ids[keep], column_ids[keep], coo_matrix.data[keep]
 
-    @translator
-    def pandas_edgemap_to_scipy_edgemap(x: PandasEdgeMap, **props) -> ScipyEdgeMap:
-        is_directed = x.is_directed
-        node_list = pd.unique(x.value[[x.src_label, x.dst_label]].values.ravel("K"))
-        node_list.sort()
+    def _pandas_edges_to_coo(x, weights):
+        """
+        Return (node_list, matrix) for the edges in x, with node_list sorted.
+
+        Undirected edges are mirrored.
+        """
+        sources = x.value[x.src_label].values
+        targets = x.value[x.dst_label].values
+        node_list, positions = np.unique(
+            np.concatenate([sources, targets]), return_inverse=True
+        )
         num_nodes = len(node_list)
-        id2pos = dict(map(reversed, enumerate(node_list)))
-        get_id_pos = lambda node_id: id2pos[node_id]
-        source_positions = x.value[x.src_label].map(get_id_pos)
-        target_positions = x.value[x.dst_label].map(get_id_pos)
-        weights = x.value[x.weight_label]
-        if not is_directed:
+        source_positions = positions[: len(sources)]
+        target_positions = positions[len(sources) :]
+        if not x.is_directed:
             source_positions, target_positions = (
-                pd.concat([source_positions, target_positions]),
-                pd.concat([target_positions, source_positions]),
+                np.concatenate([source_positions, target_positions]),
+                np.concatenate([target_positions, source_positions]),
             )
-            weights = pd.concat([weights, weights])
+            weights = np.concatenate([weights, weights])
         matrix = ss.coo_matrix(
             (weights, (source_positions, target_positions)),
             shape=(num_nodes, num_nodes),
         ).tocsr()
+        return node_list, matrix
+
+    @translator
+    def scipy_edgemap_to_pandas_edgemap(x: ScipyEdgeMap, **props) -> PandasEdgeMap:
+        is_directed = ScipyEdgeMap.Type.compute_abstract_properties(x, {"is_directed"})[
+            "is_directed"
+        ]
+        row_ids, column_ids, weights = _scipy_edges_to_columns(x, is_directed)
+        df = pd.DataFrame({"source": row_ids, "target": column_ids, "weight": weights})
+        return PandasEdgeMap(df, is_directed=is_directed)
+
+    @translator
+    def pandas_edgemap_to_scipy_edgemap(x: PandasEdgeMap, **props) -> ScipyEdgeMap:
+        weights = x.value[x.weight_label].values
+        node_list, matrix = _pandas_edges_to_coo(x, weights)
         return ScipyEdgeMap(matrix, node_list)
 
     @translator
@@ -58,35 +78,14 @@ if has_pandas and has_scipy:
         is_directed = ScipyEdgeSet.Type.compute_abstract_properties(x, {"is_directed"})[
             "is_directed"
         ]
-        coo_matrix = x.value.tocoo()
-        get_node_from_pos = lambda index: x.node_list[index]
-        row_ids = map(get_node_from_pos, coo_matrix.row)
-        column_ids = map(get_node_from_pos, coo_matrix.col)
-        rc_pairs = zip(row_ids, column_ids)
-        if not is_directed:
-            rc_pairs = filter(lambda pair: pair[0] < pair[1], rc_pairs)
-        df = pd.DataFrame(rc_pairs, columns=["source", "target"])
+        row_ids, column_ids, _ = _scipy_edges_to_columns(x, is_directed)
+        df = pd.DataFrame({"source": row_ids, "target": column_ids})
         return PandasEdgeSet(df, is_directed=is_directed)
 
     @translator
     def pandas_edgeset_to_scipy_edgeset(x: PandasEdgeSet, **props) -> ScipyEdgeSet:
-        is_directed = x.is_directed
-        node_list = pd.unique(x.value[[x.src_label, x.dst_label]].values.ravel("K"))
-        node_list.sort()
-        num_nodes = len(node_list)
-        id2pos = dict(map(reversed, enumerate(node_list)))
-        get_id_pos = lambda node_id: id2pos[node_id]
-        source_positions = x.value[x.src_label].map(get_id_pos)
-        target_positions = x.value[x.dst_label].map(get_id_pos)
-        if not is_directed:
-            source_positions, target_positions = (
-                pd.concat([source_positions, target_positions]),
-                pd.concat([target_positions, source_positions]),
-            )
-        matrix = ss.coo_matrix(
-            (np.ones(len(source_positions)), (source_positions, target_positions)),
-            shape=(num_nodes, num_nodes),
-        ).tocsr()
+        weights = np.ones(len(x.value))
+        node_list, matrix = _pandas_edges_to_coo(x, weights)
         return ScipyEdgeSet(matrix, node_list)
 
 
@@ -1,3 +1,4 @@
+import heapq
 import random
 import operator
 from functools import reduce
@@ -17,11 +18,14 @@ def python_nodeset_choose_random(x: PythonNodeSet, k: int) -> PythonNodeSet:
 def python_nodemap_sort(
     x: PythonNodeMap, ascending: bool, limit: Optional[int]
 ) -> NumpyVector:
-    sorted_items = sorted(
-        x.value.items(), key=operator.itemgetter(1), reverse=(not ascending)
-    )
     if limit:
-        sorted_items = sorted_items[:limit]
+        # Keep a heap of the best `limit` items while streaming over the dict
+        select = heapq.nsmallest if ascending else heapq.nlargest
+        sorted_items = select(limit, x.value.items(), key=operator.itemgetter(1))
+    else:
+        sorted_items = sorted(
+            x.value.items(), key=operator.itemgetter(1), reverse=(not ascending)
+        )
     sorted_keys = np.array(list(map(operator.itemgetter(0), sorted_items)))
     return NumpyVector(sorted_keys)
 
@@ -12,15 +12,8 @@ def nodemap_to_nodeset(x: PythonNodeMap, **props) -> PythonNodeSet:
 @translator
 def nodemap_from_numpy(x: NumpyNodeMap, **props) -> PythonNodeMap:
     cast = dtype_casting[dtypes.dtypes_simplified[x.value.dtype]]
-    npdata = x.value
-    if x.mask is not None:
-        nplookup = np.flatnonzero(x.mask)
-        data = {idx: cast(npdata[idx]) for idx in nplookup}
-    elif x.id2pos is not None:
-        nplookup = x.id2pos
-        data = {label: cast(npdata[idx]) for label, idx in nplookup.items()}
-    else:
-        data = {label: cast(npdata_elem) for label, npdata_elem in enumerate(npdata)}
+    node_ids, vals = x.items_arrays()
+    data = dict(zip(node_ids.tolist(), map(cast, vals.tolist())))
     return PythonNodeMap(data)
 
 
@@ -29,6 +22,6 @@ if has_grblas:
 
     @translator
     def nodemap_from_graphblas(x: GrblasNodeMap, **props) -> PythonNodeMap:
-        idx, vals = x.value.to_values()
-        data = dict(zip(idx, vals))
+        idx, vals = x.items_arrays()
+        data = dict(zip(idx.tolist(), vals.tolist()))
         return PythonNodeMap(data)
@@ -1,5 +1,6 @@
 from typing import Set, Dict, Any
 import math
+import numpy as np
 from metagraph.types import NodeSet, NodeMap
 from metagraph.wrappers import NodeSetWrapper, NodeMapWrapper
 
@@ -25,6 +26,13 @@ class PythonNodeSet(NodeSetWrapper, abstract=NodeSet):
     def __contains__(self, key):
         return key in self.value
 
+    def contains_many(self, node_ids):
+        node_ids = np.asarray(node_ids)
+        value = self.value
+        return np.fromiter(
+            (node_id in value for node_id in node_ids.tolist()), bool, len(node_ids)
+        )
+
     class TypeMixin:
         @classmethod
         def assert_equal(
@@ -66,6 +74,32 @@ class PythonNodeMap(NodeMapWrapper, abstract=NodeMap):
     def __contains__(self, key):
         return key in self.value
 
+    def contains_many(self, node_ids):
+        node_ids = np.asarray(node_ids)
+        value = self.value
+        return np.fromiter(
+            (node_id in value for node_id in node_ids.tolist()), bool, len(node_ids)
+        )
+
+    def get_many(self, node_ids):
+        node_ids = np.asarray(node_ids)
+        try:
+            vals = list(map(self.value.__getitem__, node_ids.tolist()))
+        except KeyError:
+            found = self.contains_many(node_ids)
+            raise ValueError(f"nodes {node_ids[~found]} are not in the NodeMap")
+        return np.array(vals, dtype=self._np_dtype())
+
+    def items_arrays(self):
+        node_ids = np.fromiter(self.value.keys(), int, len(self.value))
+        vals = np.array(list(self.value.values()), dtype=self._np_dtype())
+        order = np.argsort(node_ids)
+        return node_ids[order], vals[order]
+
+    def _np_dtype(self):
+        dtype = self._determine_dtype()
+        return dtype if dtype != "str" else "object"
+
     def _determine_dtype(self):
         types = set(type(val) for val in self.value.values())
         if not types or (types - {float, int, bool}):
@@ -1,10 +1,12 @@
 import numpy as np
-from metagraph import concrete_algorithm, NodeID
+import metagraph as mg
+from metagraph import concrete_algorithm, NodeID, config
 from metagraph.plugins import has_scipy
-from .types import ScipyEdgeSet, ScipyEdgeMap, ScipyGraph
+from .types import ScipyEdgeSet, ScipyEdgeMap, ScipyGraph, ScipyBipartiteGraph
 from .. import has_numba
 import numpy as np
-from typing import Tuple, Callable, Any, Union
+import heapq
+from typing import Tuple, Callable, Any, Union, Iterator, Optional
 
 if has_numba:
     import numba
@@ -12,6 +14,131 @@ if has_numba:
 if has_scipy:
     import scipy.sparse as ss
     from ..numpy.types import NumpyNodeMap, NumpyNodeSet, NumpyVector
+    from ..numpy.vectorize import vectorize, reduce_segments
+    from ...algorithms.centrality import betweenness_sample_size
+
+    if has_numba:
+
+        @numba.njit(parallel=True)
+        def _numba_csr_matvec(indptr, indices, data, x):
+            n = len(indptr) - 1
+            out = np.empty(n, dtype=np.float64)
+            for row in numba.prange(n):
+                total = 0.0
+                for j in range(indptr[row], indptr[row + 1]):
+                    total += data[j] * x[indices[j]]
+                out[row] = total
+            return out
+
+    def _matvec(m: ss.csr_matrix) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Returns a function computing `m @ x`, run in parallel over rows with numba if available
+        """
+        if has_numba:
+            indptr, indices, data = m.indptr, m.indices, m.data
+            return lambda x: _numba_csr_matvec(indptr, indices, data, x)
+        return m.dot
+
+    def _graph_adjacency(graph: ScipyGraph) -> Tuple[np.ndarray, ss.csr_matrix]:
+        """
+        Returns (node_ids, matrix) where node_ids is sorted and includes nodes without edges,
+        and matrix is the CSR adjacency matrix with rows/columns in node_ids order.
+        """
+        node_list = np.asarray(graph.edges.node_list)
+        m = graph.edges.value
+        if graph.edges.transposed:
+            m = m.T
+        if graph.nodes is not None:
+            node_ids = np.union1d(node_list, graph.nodes.nodes())
+        else:
+            node_ids = np.unique(node_list)
+        n = len(node_ids)
+        if len(node_list) == n and (node_list == node_ids).all():
+            return node_ids, m.tocsr()
+        positions = np.searchsorted(node_ids, node_list)
+        coo = m.tocoo()
+        m = ss.csr_matrix(
+            (coo.data, (positions[coo.row], positions[coo.col])), shape=(n, n)
+        )
+        return node_ids, m
+
+    def _node_map(node_ids: np.ndarray, values: np.ndarray) -> NumpyNodeMap:
+        if len(node_ids) == 0 or node_ids[-1] == len(node_ids) - 1:
+            return NumpyNodeMap(values)
+        return NumpyNodeMap(values, node_ids=node_ids)
+
+    @concrete_algorithm("centrality.pagerank")
+    def ss_pagerank(
+        graph: ScipyGraph, damping: float, maxiter: int, tolerance: float
+    ) -> NumpyNodeMap:
+        node_ids, m = _graph_adjacency(graph)
+        n = len(node_ids)
+        # Like the networkx and graphblas implementations, edge weights are ignored
+        out_degree = np.diff(m.indptr)
+        dangling = out_degree == 0
+        # Transition matrix transposed: each node sends 1 / out_degree to its neighbors
+        transition = ss.csr_matrix(
+            (
+                np.repeat(1.0 / np.maximum(out_degree, 1), out_degree),
+                m.indices,
+                m.indptr,
+            ),
+            shape=m.shape,
+        )
+        matvec = _matvec(transition.T.tocsr())
+
+        r = np.full(n, 1 / n)
+        for _ in range(maxiter):
+            prev_r = r
+            # Rank of dangling nodes is spread uniformly over all nodes
+            dangling_sum = prev_r[dangling].sum()
+            r = damping * (matvec(prev_r) + dangling_sum / n) + (1 - damping) / n
+            if np.abs(r - prev_r).sum() < n * tolerance:
+                break
+        return _node_map(node_ids, r)
+
+    @concrete_algorithm("centrality.katz")
+    def ss_katz_centrality(
+        graph: ScipyGraph,
+        attenuation_factor: float,
+        immediate_neighbor_weight: float,
+        maxiter: int,
+        tolerance: float,
+    ) -> NumpyNodeMap:
+        node_ids, m = _graph_adjacency(graph)
+        n = len(node_ids)
+        matvec = _matvec(m.T.tocsr())
+
+        x = np.zeros(n)
+        for _ in range(maxiter):
+            prev_x = x
+            x = attenuation_factor * matvec(prev_x) + immediate_neighbor_weight
+            if np.abs(x - prev_x).sum() < n * tolerance:
+                break
+        norm = np.linalg.norm(x)
+        if norm > 0:
+            x /= norm
+        return _node_map(node_ids, x)
+
+    @concrete_algorithm("centrality.eigenvector")
+    def ss_eigenvector_centrality(
+        graph: ScipyGraph, maxiter: int, tolerance: float
+    ) -> NumpyNodeMap:
+        node_ids, m = _graph_adjacency(graph)
+        n = len(node_ids)
+        matvec = _matvec(m.T.tocsr())
+
+        x = np.full(n, 1 / n)
+        for _ in range(maxiter):
+            prev_x = x
+            # Iterate with (A + I) so bipartite graphs converge
+            x = matvec(prev_x) + prev_x
+            norm = np.linalg.norm(x)
+            if norm > 0:
+                x /= norm
+            if np.abs(x - prev_x).sum() < n * tolerance:
+                break
+        return _node_map(node_ids, x)
 
     @concrete_algorithm("clustering.connected_components")
     def ss_connected_components(graph: ScipyGraph) -> NumpyNodeMap:
@@ -27,67 +154,1170 @@ if has_scipy:
         )
         return NumpyNodeMap(node_labels, node_ids=graph.edges.node_list)
 
+    # Community detection kernels
+    # These are plain Python over the CSR arrays and are compiled with numba when available.
+
+    def _greedy_coloring(indptr, indices, order):
+        """Color nodes in the given order with the smallest color unused by their neighbors"""
+        n = len(indptr) - 1
+        colors = np.full(n, -1, dtype=np.int64)
+        # used[c] == node marks color c as taken by a neighbor of node
+        used = np.full(n + 1, -1, dtype=np.int64)
+        for node in order:
+            for j in range(indptr[node], indptr[node + 1]):
+                nbr_color = colors[indices[j]]
+                if nbr_color >= 0:
+                    used[nbr_color] = node
+            color = 0
+            while used[color] == node:
+                color += 1
+            colors[node] = color
+        return colors
+
+    def _most_frequent_label(indptr, indices, labels, node, counts, touched):
+        """
+        Returns (best_label, is_current_best) for the labels of the neighbors of node.
+
+        Ties between the most frequent labels are broken by keeping the current label
+        if it is among them, otherwise by the largest label (Prec-Max).
+        counts must be all zeros and is left that way.
+        """
+        num_touched = 0
+        for j in range(indptr[node], indptr[node + 1]):
+            label = labels[indices[j]]
+            if counts[label] == 0:
+                touched[num_touched] = label
+                num_touched += 1
+            counts[label] += 1
+        max_count = 0
+        for i in range(num_touched):
+            max_count = max(max_count, counts[touched[i]])
+        current = labels[node]
+        best = -1
+        is_current_best = False
+        for i in range(num_touched):
+            label = touched[i]
+            if counts[label] == max_count:
+                if label == current:
+                    is_current_best = True
+                best = max(best, label)
+            counts[label] = 0
+        if is_current_best or num_touched == 0:
+            return current, True
+        return best, False
+
+    def _label_propagation(indptr, indices, order):
+        """
+        Semi-synchronous label propagation (Cordasco & Gargano) as done by networkx.
+
+        Nodes of the same color are never neighbors, so each color class is updated as a
+        group. Iterates until every node has one of the most frequent labels of its neighbors.
+        """
+        n = len(indptr) - 1
+        colors = _greedy_coloring(indptr, indices, order)
+        num_colors = colors.max() + 1 if n > 0 else 0
+        by_color = np.argsort(colors, kind="mergesort")
+        color_start = np.searchsorted(colors[by_color], np.arange(num_colors + 1))
+        labels = np.arange(n)
+        counts = np.zeros(n, dtype=np.int64)
+        touched = np.empty(n, dtype=np.int64)
+        while True:
+            is_complete = True
+            for node in range(n):
+                _, is_current_best = _most_frequent_label(
+                    indptr, indices, labels, node, counts, touched
+                )
+                if not is_current_best:
+                    is_complete = False
+                    break
+            if is_complete:
+                return labels
+            for color in range(num_colors):
+                for i in range(color_start[color], color_start[color + 1]):
+                    node = by_color[i]
+                    labels[node], _ = _most_frequent_label(
+                        indptr, indices, labels, node, counts, touched
+                    )
+
+    def _louvain_pass(
+        indptr,
+        indices,
+        data,
+        order,
+        node2com,
+        degrees,
+        loops,
+        com_degrees,
+        com_internals,
+        total_weight,
+        neighbor_weights,
+        touched,
+    ):
+        """
+        Move each node (in the given order) to the neighboring community with the largest
+        modularity gain, as in python-louvain. Returns whether any node moved.
+
+        neighbor_weights must be all zeros and is left that way.
+        """
+        modified = False
+        for node in order:
+            com_node = node2com[node]
+            degc_totw = degrees[node] / (total_weight * 2.0)
+            num_touched = 0
+            for j in range(indptr[node], indptr[node + 1]):
+                nbr = indices[j]
+                if nbr == node:
+                    continue
+                com = node2com[nbr]
+                if neighbor_weights[com] == 0.0:
+                    touched[num_touched] = com
+                    num_touched += 1
+                neighbor_weights[com] += data[j]
+            weight_to_own = neighbor_weights[com_node]
+            remove_cost = (
+                -weight_to_own + (com_degrees[com_node] - degrees[node]) * degc_totw
+            )
+            com_degrees[com_node] -= degrees[node]
+            com_internals[com_node] -= weight_to_own + loops[node]
+            best_com = com_node
+            best_increase = 0.0
+            for i in range(num_touched):
+                com = touched[i]
+                increase = (
+                    remove_cost + neighbor_weights[com] - com_degrees[com] * degc_totw
+                )
+                if increase > best_increase:
+                    best_increase = increase
+                    best_com = com
+            com_degrees[best_com] += degrees[node]
+            com_internals[best_com] += neighbor_weights[best_com] + loops[node]
+            node2com[node] = best_com
+            if best_com != com_node:
+                modified = True
+            for i in range(num_touched):
+                neighbor_weights[touched[i]] = 0.0
+        return modified
+
+    if has_numba:
+        _greedy_coloring = numba.njit(_greedy_coloring)
+        _most_frequent_label = numba.njit(_most_frequent_label)
+        _label_propagation = numba.njit(_label_propagation)
+        _louvain_pass = numba.njit(_louvain_pass)
+
+    def _modularity(com_degrees, com_internals, total_weight):
+        if total_weight <= 0:
+            return 0.0
+        return float(
+            (com_internals / total_weight).sum()
+            - ((com_degrees / (2.0 * total_weight)) ** 2).sum()
+        )
+
+    def _louvain_level(m: ss.csr_matrix, rng) -> Tuple[np.ndarray, float]:
+        """
+        Repeat Louvain passes over m until modularity stops improving.
+
+        Returns (communities, modularity). m is symmetric and stores each self-loop once.
+        """
+        n = m.shape[0]
+        loops = m.diagonal().astype(np.float64)
+        # Weighted degree, with self-loops counted twice
+        degrees = np.asarray(m.sum(axis=1)).ravel() + loops
+        total_weight = degrees.sum() / 2.0
+        node2com = np.arange(n)
+        com_degrees = degrees.copy()
+        com_internals = loops.copy()
+        neighbor_weights = np.zeros(n)
+        touched = np.empty(n, dtype=np.int64)
+        order = np.arange(n)
+        mod = _modularity(com_degrees, com_internals, total_weight)
+        while True:
+            if rng is not None:
+                order = rng.permutation(n)
+            modified = _louvain_pass(
+                m.indptr,
+                m.indices,
+                m.data,
+                order,
+                node2com,
+                degrees,
+                loops,
+                com_degrees,
+                com_internals,
+                total_weight,
+                neighbor_weights,
+                touched,
+            )
+            new_mod = _modularity(com_degrees, com_internals, total_weight)
+            if not modified or new_mod - mod < _LOUVAIN_MIN_GAIN:
+                return node2com, new_mod
+            mod = new_mod
+
+    def _induced_graph(m: ss.csr_matrix, communities: np.ndarray, num_communities: int):
+        """Graph of communities, where edge weights are summed and self-loops stored once"""
+        coo = m.tocoo()
+        induced = ss.csr_matrix(
+            (coo.data, (communities[coo.row], communities[coo.col])),
+            shape=(num_communities, num_communities),
+        )
+        # Edges inside a community land on the diagonal twice, self-loops only once
+        loops = np.bincount(communities, m.diagonal(), minlength=num_communities)
+        induced.setdiag((induced.diagonal() + loops) / 2)
+        return induced
+
+    # Minimum modularity gain to keep going, as in python-louvain
+    _LOUVAIN_MIN_GAIN = 0.0000001
+
+    @concrete_algorithm("clustering.louvain_community")
+    def ss_louvain_community(
+        graph: ScipyGraph, seed: mg.Optional[int]
+    ) -> Tuple[NumpyNodeMap, float]:
+        node_ids, m = _graph_adjacency(graph)
+        m = m.astype(np.float64)
+        m.sort_indices()
+        # Without a seed, nodes are visited in node id order, which is deterministic
+        rng = None if seed is None else np.random.default_rng(seed)
+        partition = np.arange(len(node_ids))
+        communities, mod = _louvain_level(m, rng)
+        while True:
+            unique_communities, communities = np.unique(
+                communities, return_inverse=True
+            )
+            partition = communities[partition]
+            m = _induced_graph(m, communities, len(unique_communities))
+            communities, new_mod = _louvain_level(m, rng)
+            if new_mod - mod < _LOUVAIN_MIN_GAIN:
+                break
+            mod = new_mod
+        return _node_map(node_ids, partition), mod
+
+    @concrete_algorithm("clustering.label_propagation_community")
+    def ss_label_propagation_community(graph: ScipyGraph) -> NumpyNodeMap:
+        node_ids, m = _graph_adjacency(graph)
+        # networkx colors nodes greedily by decreasing degree (self-loops count twice)
+        degrees = np.diff(m.indptr) + (m.diagonal() != 0)
+        order = np.argsort(-degrees, kind="mergesort")
+        labels = _label_propagation(m.indptr, m.indices, order)
+        _, labels = np.unique(labels, return_inverse=True)
+        return _node_map(node_ids, labels)
+
+    # Bytes per (source, node) cell held while a block of shortest paths is processed.
+    # csgraph.dijkstra fills dense float64 lengths and int32 predecessors.
+    _DIJKSTRA_BYTES_PER_CELL = 8 + 4
+
+    def _shortest_path_block_size(
+        num_nodes: int, memory_budget: int = None, bytes_per_cell: int = None
+    ) -> int:
+        if memory_budget is None:
+            memory_budget = config.get(
+                "plugins.scipy.shortest_paths_memory_budget", 2 ** 28
+            )
+        if bytes_per_cell is None:
+            bytes_per_cell = _DIJKSTRA_BYTES_PER_CELL
+        bytes_per_row = bytes_per_cell * max(num_nodes, 1)
+        return int(max(1, min(num_nodes, memory_budget // bytes_per_row)))
+
+    def shortest_path_blocks(
+        graph: ScipyGraph, *, cutoff: float = None, memory_budget: int = None
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Compute shortest paths from every node, one block of sources at a time.
+
+        Yields (sources, lengths, parents) for each block. Rows and columns are positions in
+        graph.edges.node_list. lengths is dense with inf for unreachable nodes and parents holds
+        positions, with -9999 where there is no parent.
+
+        memory_budget (bytes) bounds the dense arrays of each block and defaults to the
+        `plugins.scipy.shortest_paths_memory_budget` config option. Paths longer than cutoff
+        are not followed.
+        """
+        n = graph.edges.value.shape[0]
+        block_size = _shortest_path_block_size(n, memory_budget)
+        return _shortest_path_blocks(graph, block_size, cutoff)
+
+    def _shortest_path_blocks(graph: ScipyGraph, block_size: int, cutoff: float):
+        is_directed = ScipyGraph.Type.compute_abstract_properties(
+            graph, {"is_directed"}
+        )["is_directed"]
+        m = graph.edges.value
+        n = m.shape[0]
+        limit = np.inf if cutoff is None else cutoff
+        for start in range(0, n, block_size):
+            sources = np.arange(start, min(start + block_size, n))
+            lengths, parents = ss.csgraph.dijkstra(
+                m,
+                directed=is_directed,
+                indices=sources,
+                return_predecessors=True,
+                limit=limit,
+            )
+            yield sources, lengths, parents
+
+    def shortest_paths_to_memmap(
+        graph: ScipyGraph,
+        lengths_filename: str,
+        parents_filename: str = None,
+        *,
+        cutoff: float = None,
+        memory_budget: int = None,
+    ) -> Tuple[np.memmap, Optional[np.memmap]]:
+        """
+        Write all pairs shortest path lengths (and optionally parents) to .npy files on disk.
+
+        The files are filled one block of sources at a time (see `shortest_path_blocks`),
+        so only the memory budget is held in RAM. Returns the memory-mapped arrays;
+        they can be reopened with `np.load(filename, mmap_mode="r")`.
+        """
+        n = graph.edges.value.shape[0]
+        lengths_out = np.lib.format.open_memmap(
+            lengths_filename, mode="w+", dtype=np.float64, shape=(n, n)
+        )
+        parents_out = None
+        if parents_filename is not None:
+            parents_out = np.lib.format.open_memmap(
+                parents_filename, mode="w+", dtype=np.int32, shape=(n, n)
+            )
+        for sources, lengths, parents in shortest_path_blocks(
+            graph, cutoff=cutoff, memory_budget=memory_budget
+        ):
+            lengths_out[sources[0] : sources[-1] + 1] = lengths
+            if parents_out is not None:
+                parents_out[sources[0] : sources[-1] + 1] = parents
+        lengths_out.flush()
+        if parents_out is not None:
+            parents_out.flush()
+        return lengths_out, parents_out
+
+    def _sparse_rows(
+        block: np.ndarray, mask: np.ndarray, parts: Tuple[list, list, list], dtype=None
+    ):
+        """Append the entries of a dense block of rows selected by mask to CSR parts (data, indices, row counts)"""
+        index_dtype = np.int32 if block.shape[1] < 2 ** 31 else np.int64
+        # Boolean indexing gathers without materializing (row, col) index arrays
+        columns = np.broadcast_to(
+            np.arange(block.shape[1], dtype=index_dtype), block.shape
+        )
+        data = block[mask]
+        parts[0].append(data if dtype is None else data.astype(dtype, copy=False))
+        parts[1].append(columns[mask])
+        parts[2].append(np.count_nonzero(mask, axis=1))
+
+    def _csr_from_parts(parts: Tuple[list, list, list], shape, dtype) -> ss.csr_matrix:
+        data_parts, indices_parts, count_parts = parts
+        counts = np.concatenate(count_parts) if count_parts else np.zeros(0, np.int64)
+        nnz = int(counts.sum())
+        index_dtype = np.int32 if nnz < 2 ** 31 else np.int64
+        indptr = np.zeros(len(counts) + 1, dtype=index_dtype)
+        np.cumsum(counts, out=indptr[1:])
+        # Concatenate one array at a time, releasing the blocks as we go
+        data = np.empty(nnz, dtype=dtype)
+        indices = np.empty(nnz, dtype=index_dtype)
+        pos = 0
+        while data_parts:
+            block_data = data_parts.pop(0)
+            block_indices = indices_parts.pop(0)
+            data[pos : pos + len(block_data)] = block_data
+            indices[pos : pos + len(block_indices)] = block_indices
+            pos += len(block_data)
+        return ss.csr_matrix((data, indices, indptr), shape=shape)
+
     @concrete_algorithm("traversal.all_pairs_shortest_paths")
     def ss_all_pairs_shortest_paths(
         graph: ScipyGraph,
     ) -> Tuple[ScipyGraph, ScipyGraph]:
-        is_directed = ScipyGraph.Type.compute_abstract_properties(
-            graph, {"is_directed"}
-        )["is_directed"]
-        lengths, parents = ss.csgraph.dijkstra(
-            graph.edges.value, directed=is_directed, return_predecessors=True
+        # Sparsify each block as it is computed to avoid holding dense n x n arrays
+        dtype = graph.edges.value.dtype
+        n = graph.edges.value.shape[0]
+        # Besides the dijkstra output, each cell may need a bool mask, float64 length
+        # and index entries, and int32 parents cast to dtype with their index entries
+        bytes_per_cell = (
+            _DIJKSTRA_BYTES_PER_CELL + 1 + (8 + 4) + (4 + dtype.itemsize + 4)
         )
-        lengths = ss.csr_matrix(lengths)
-        parents = ss.csr_matrix(parents)
-        parents = parents + 9999 * ss.eye(parents.get_shape()[0])
-        parents = parents.astype(graph.edges.value.dtype)
+        block_size = _shortest_path_block_size(n, bytes_per_cell=bytes_per_cell)
+        parent_parts = ([], [], [])
+        length_parts = ([], [], [])
+        for sources, lengths, parents in _shortest_path_blocks(graph, block_size, None):
+            # The source is its own parent, stored as an implicit 0
+            parents[np.arange(len(sources)), sources] = 0
+            _sparse_rows(lengths, lengths != 0, length_parts)
+            _sparse_rows(parents, parents != 0, parent_parts, dtype)
+        parents = _csr_from_parts(parent_parts, (n, n), dtype)
+        lengths = _csr_from_parts(length_parts, (n, n), np.float64)
         return (
             ScipyGraph(ScipyEdgeMap(parents, graph.edges.node_list), nodes=graph.nodes),
             ScipyGraph(ScipyEdgeMap(lengths, graph.edges.node_list), nodes=graph.nodes),
         )
 
+    # Triangle counting kernels
+    # These intersect sorted CSR rows directly, so only the structure of the matrix is used
+    # and no intermediate product (or weight-free copy) is formed.
+
+    if has_numba:
+
+        @numba.njit
+        def _lower_end(indptr, indices, row):
+            """Position in indices where the sorted neighbors of row stop being < row"""
+            lo = indptr[row]
+            hi = indptr[row + 1]
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if indices[mid] < row:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            return lo
+
+        @numba.njit
+        def _count_common(indices, start1, end1, start2, end2, exclude1, exclude2):
+            """Merge-intersect two sorted index ranges, skipping two excluded nodes"""
+            count = 0
+            while start1 < end1 and start2 < end2:
+                a = indices[start1]
+                b = indices[start2]
+                if a < b:
+                    start1 += 1
+                elif b < a:
+                    start2 += 1
+                else:
+                    if a != exclude1 and a != exclude2:
+                        count += 1
+                    start1 += 1
+                    start2 += 1
+            return count
+
+        @numba.njit(parallel=True)
+        def _numba_triangle_count(indptr, indices):
+            """Each triangle k < j < i is found once, in row i, from the lower neighbors"""
+            n = len(indptr) - 1
+            total = 0
+            for row in numba.prange(n):
+                row_end = _lower_end(indptr, indices, row)
+                for jj in range(indptr[row], row_end):
+                    col = indices[jj]
+                    total += _count_common(
+                        indices,
+                        indptr[row],
+                        row_end,
+                        indptr[col],
+                        _lower_end(indptr, indices, col),
+                        -1,
+                        -1,
+                    )
+            return total
+
+        @numba.njit(parallel=True)
+        def _numba_node_triangles(indptr, indices):
+            """Each row only writes its own count, so rows run in parallel without races"""
+            n = len(indptr) - 1
+            counts = np.zeros(n, dtype=np.int64)
+            for row in numba.prange(n):
+                count = 0
+                for jj in range(indptr[row], indptr[row + 1]):
+                    col = indices[jj]
+                    if col != row:
+                        count += _count_common(
+                            indices,
+                            indptr[row],
+                            indptr[row + 1],
+                            indptr[col],
+                            indptr[col + 1],
+                            row,
+                            col,
+                        )
+                # Both other corners of each triangle were seen
+                counts[row] = count // 2
+            return counts
+
+    def _pattern(m: ss.spmatrix) -> ss.csr_matrix:
+        """CSR matrix of ones with the structure of m, without self-loops"""
+        coo = m.tocoo()
+        keep = coo.row != coo.col
+        return ss.csr_matrix(
+            (np.ones(keep.sum(), dtype=np.int64), (coo.row[keep], coo.col[keep])),
+            shape=m.shape,
+        )
+
+    def _sorted_csr(m: ss.spmatrix) -> ss.csr_matrix:
+        m = m.tocsr()
+        if not m.has_sorted_indices:
+            m = m.sorted_indices()
+        return m
+
     @concrete_algorithm("cluster.triangle_count")
     def ss_triangle_count(graph: ScipyGraph) -> int:
-        """
-        Uses the triangle counting method described in
-        https://www.sandia.gov/~srajama/publications/Tricount-HPEC.pdf
-        """
-        props = ScipyGraph.Type.compute_abstract_properties(graph, {"edge_type"})
-        if props["edge_type"] == "map":
-            # Drop weights before performing triangle count
-            m = graph.edges.value.copy()
-            m.data = np.ones_like(m.data)
-        elif props["edge_type"] == "set":
-            m = graph.edges.value
+        m = _sorted_csr(graph.edges.value)
+        if has_numba:
+            return int(_numba_triangle_count(m.indptr, m.indices))
+        # Uses the triangle counting method described in
+        # https://www.sandia.gov/~srajama/publications/Tricount-HPEC.pdf
+        m = _pattern(m)
         L = ss.tril(m, k=-1).tocsr()
         U = ss.triu(m, k=1).tocsc()
         return int((L @ U.T).multiply(L).sum())
 
+    @concrete_algorithm("cluster.triangles")
+    def ss_node_triangles(graph: ScipyGraph) -> NumpyNodeMap:
+        m = _sorted_csr(graph.edges.value)
+        if has_numba:
+            counts = _numba_node_triangles(m.indptr, m.indices)
+        else:
+            # Only lower triangle products are formed, so each triangle k < j < i is
+            # found once rather than six times.  (L @ L)[i, k] counts the middle nodes j,
+            # and (L.T @ L)[j, k] counts the top nodes i; both are masked by the edge (i, k)
+            # or (j, k) closing the triangle.
+            L = ss.tril(_pattern(m), k=-1).tocsr()
+            ends = (L @ L).multiply(L)
+            middles = (L.T @ L).multiply(L)
+            counts = (
+                np.asarray(ends.sum(axis=1)).ravel()
+                + np.asarray(ends.sum(axis=0)).ravel()
+                + np.asarray(middles.sum(axis=1)).ravel()
+            )
+        # Matrix positions follow node_list, which need not be sorted
+        node_list = np.asarray(graph.edges.node_list)
+        if graph.nodes is None:
+            node_ids = np.sort(node_list)
+        else:
+            # Nodes without edges are in no triangles
+            node_ids = np.union1d(node_list, graph.nodes.nodes())
+        all_counts = np.zeros(len(node_ids), dtype=np.int64)
+        all_counts[np.searchsorted(node_ids, node_list)] = counts
+        return _node_map(node_ids, all_counts)
+
+    # CSR traversal kernels
+    # Each kernel works on positions in the CSR arrays and follows out-edges.
+    # Unreached nodes have a parent of -1 (and a depth of -1 or a distance of inf).
+
+    def _numpy_bfs(indptr, indices, source, depth_limit):
+        """Level-synchronous BFS returning (order, depth, parent)"""
+        n = len(indptr) - 1
+        depth = np.full(n, -1, dtype=np.int64)
+        parent = np.full(n, -1, dtype=np.int64)
+        depth[source] = 0
+        parent[source] = source
+        frontier = np.array([source], dtype=np.int64)
+        levels = [frontier]
+        level = 0
+        while len(frontier) > 0 and (depth_limit < 0 or level < depth_limit):
+            starts = indptr[frontier]
+            counts = indptr[frontier + 1] - starts
+            # Gather neighbors of the frontier in order, remembering who found them
+            offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+            neighbors = indices[offsets + np.arange(len(offsets))]
+            sources = np.repeat(frontier, counts)
+            is_new = depth[neighbors] < 0
+            neighbors, sources = neighbors[is_new], sources[is_new]
+            # Keep the first discovery of each node, in discovery order
+            _, first = np.unique(neighbors, return_index=True)
+            first.sort()
+            frontier = neighbors[first].astype(np.int64)
+            level += 1
+            depth[frontier] = level
+            parent[frontier] = sources[first]
+            levels.append(frontier)
+        return np.concatenate(levels), depth, parent
+
+    def _scipy_dijkstra(indptr, indices, data, source):
+        n = len(indptr) - 1
+        m = ss.csr_matrix((data, indices, indptr), shape=(n, n))
+        distance, parent = ss.csgraph.dijkstra(
+            m, directed=True, indices=source, return_predecessors=True
+        )
+        parent = parent.astype(np.int64)
+        parent[parent < 0] = -1
+        parent[source] = source
+        return distance, parent
+
+    def _scipy_bellman_ford(indptr, indices, data, source):
+        n = len(indptr) - 1
+        m = ss.csr_matrix((data, indices, indptr), shape=(n, n))
+        try:
+            distance, parent = ss.csgraph.bellman_ford(
+                m, directed=True, indices=source, return_predecessors=True
+            )
+        except ss.csgraph.NegativeCycleError:
+            return None, None, True
+        parent = parent.astype(np.int64)
+        parent[parent < 0] = -1
+        parent[source] = source
+        return distance, parent, False
+
+    if has_numba:
+
+        @numba.njit
+        def _numba_bfs(indptr, indices, source, depth_limit):
+            """Queue-based BFS returning (order, depth, parent)"""
+            n = len(indptr) - 1
+            depth = np.full(n, -1, dtype=np.int64)
+            parent = np.full(n, -1, dtype=np.int64)
+            order = np.empty(n, dtype=np.int64)
+            depth[source] = 0
+            parent[source] = source
+            order[0] = source
+            head = 0
+            tail = 1
+            while head < tail:
+                node = order[head]
+                head += 1
+                node_depth = depth[node]
+                if depth_limit >= 0 and node_depth >= depth_limit:
+                    # Nodes are visited in order of depth, so all remaining nodes are at the limit
+                    break
+                for j in range(indptr[node], indptr[node + 1]):
+                    nbr = indices[j]
+                    if depth[nbr] < 0:
+                        depth[nbr] = node_depth + 1
+                        parent[nbr] = node
+                        order[tail] = nbr
+                        tail += 1
+            return order[:tail], depth, parent
+
+        @numba.njit
+        def _numba_dijkstra(indptr, indices, data, source):
+            n = len(indptr) - 1
+            distance = np.full(n, np.inf)
+            parent = np.full(n, -1, dtype=np.int64)
+            done = np.zeros(n, dtype=np.bool_)
+            distance[source] = 0.0
+            parent[source] = source
+            heap = [(0.0, np.int64(source))]
+            while len(heap) > 0:
+                node_distance, node = heapq.heappop(heap)
+                if done[node]:
+                    continue
+                done[node] = True
+                for j in range(indptr[node], indptr[node + 1]):
+                    nbr = indices[j]
+                    new_distance = node_distance + data[j]
+                    if new_distance < distance[nbr]:
+                        distance[nbr] = new_distance
+                        parent[nbr] = node
+                        heapq.heappush(heap, (new_distance, np.int64(nbr)))
+            return distance, parent
+
+        @numba.njit
+        def _numba_bellman_ford(indptr, indices, data, source):
+            """Returns (distance, parent, has_negative_cycle)"""
+            n = len(indptr) - 1
+            distance = np.full(n, np.inf)
+            parent = np.full(n, -1, dtype=np.int64)
+            distance[source] = 0.0
+            parent[source] = source
+            for _ in range(n):
+                changed = False
+                for node in range(n):
+                    node_distance = distance[node]
+                    if node_distance == np.inf:
+                        continue
+                    for j in range(indptr[node], indptr[node + 1]):
+                        nbr = indices[j]
+                        new_distance = node_distance + data[j]
+                        if new_distance < distance[nbr]:
+                            distance[nbr] = new_distance
+                            parent[nbr] = node
+                            changed = True
+                if not changed:
+                    return distance, parent, False
+            return distance, parent, True
+
+        _bfs = _numba_bfs
+        _dijkstra = _numba_dijkstra
+        _bellman_ford = _numba_bellman_ford
+    else:
+        _bfs = _numpy_bfs
+        _dijkstra = _scipy_dijkstra
+        _bellman_ford = _scipy_bellman_ford
+
+    def _source_position(node_ids: np.ndarray, source_node: NodeID) -> int:
+        pos = np.searchsorted(node_ids, source_node)
+        if pos == len(node_ids) or node_ids[pos] != source_node:
+            raise ValueError(f"source node {source_node} is not in the graph")
+        return int(pos)
+
+    def _parents_and_distances(
+        node_ids: np.ndarray, parent: np.ndarray, distance: np.ndarray, dtype
+    ) -> Tuple[NumpyNodeMap, NumpyNodeMap]:
+        reached = parent >= 0
+        reached_ids = node_ids[reached]
+        distance = distance[reached]
+        if np.issubdtype(dtype, np.integer):
+            distance = distance.astype(dtype)
+        return (
+            NumpyNodeMap(node_ids[parent[reached]], node_ids=reached_ids),
+            NumpyNodeMap(distance, node_ids=reached_ids),
+        )
+
     @concrete_algorithm("traversal.bfs_iter")
     def ss_breadth_first_search_iter(
         graph: ScipyGraph, source_node: NodeID, depth_limit: int
     ) -> NumpyVector:
+        node_ids, m = _graph_adjacency(graph)
+        source = _source_position(node_ids, source_node)
+        order, _, _ = _bfs(m.indptr, m.indices, source, depth_limit)
+        return NumpyVector(node_ids[order])
+
+    @concrete_algorithm("traversal.bfs_tree")
+    def ss_breadth_first_search_tree(
+        graph: ScipyGraph, source_node: NodeID, depth_limit: int
+    ) -> Tuple[NumpyNodeMap, NumpyNodeMap]:
+        node_ids, m = _graph_adjacency(graph)
+        source = _source_position(node_ids, source_node)
+        _, depth, parent = _bfs(m.indptr, m.indices, source, depth_limit)
+        reached = depth >= 0
+        reached_ids = node_ids[reached]
+        return (
+            NumpyNodeMap(depth[reached], node_ids=reached_ids),
+            NumpyNodeMap(node_ids[parent[reached]], node_ids=reached_ids),
+        )
+
+    @concrete_algorithm("traversal.dijkstra")
+    def ss_dijkstra(
+        graph: ScipyGraph, source_node: NodeID
+    ) -> Tuple[NumpyNodeMap, NumpyNodeMap]:
+        node_ids, m = _graph_adjacency(graph)
+        source = _source_position(node_ids, source_node)
+        distance, parent = _dijkstra(m.indptr, m.indices, m.data, source)
+        return _parents_and_distances(node_ids, parent, distance, m.dtype)
+
+    def _multi_source_paths(
+        graph: ScipyGraph, source_nodes: NumpyNodeSet, **kwargs
+    ) -> Tuple[np.ndarray, ss.csr_matrix, ss.csr_matrix, ss.csr_matrix]:
+        """
+        Run csgraph.dijkstra from every source node, one block of sources at a time.
+
+        Returns (node_ids, adjacency, parents, lengths) where parents and lengths are square
+        matrices in node_ids order with only the source rows populated. Parents holds node ids.
+        Extra kwargs (e.g. unweighted, limit) are passed to csgraph.dijkstra.
+        """
+        node_ids, m = _graph_adjacency(graph)
+        source_ids = source_nodes.nodes()
+        sources = np.searchsorted(node_ids, source_ids)
+        missing = (sources == len(node_ids)) | (
+            node_ids[np.minimum(sources, len(node_ids) - 1)] != source_ids
+        )
+        if missing.any():
+            raise ValueError(
+                f"source node {source_ids[missing][0]} is not in the graph"
+            )
+        n = len(node_ids)
+        # Besides the dijkstra output, each cell may need a bool mask, int64 row and
+        # column, int32 parent positions mapped to node ids, and float64 lengths
+        bytes_per_cell = (
+            _DIJKSTRA_BYTES_PER_CELL + 1 + 8 + 8 + 4 + node_ids.itemsize + 8
+        )
+        block_size = _shortest_path_block_size(n, bytes_per_cell=bytes_per_cell)
+        all_columns = np.arange(n)
+        rows_parts, cols_parts, parent_parts, length_parts = [], [], [], []
+        for start in range(0, len(sources), block_size):
+            block = sources[start : start + block_size]
+            lengths, parents = ss.csgraph.dijkstra(
+                m, indices=block, return_predecessors=True, **kwargs
+            )
+            # The source is its own parent
+            parents[np.arange(len(block)), block] = block
+            # Boolean indexing gathers without materializing (row, col) index arrays
+            reached = np.isfinite(lengths)
+            rows_parts.append(np.repeat(block, np.count_nonzero(reached, axis=1)))
+            cols_parts.append(np.broadcast_to(all_columns, lengths.shape)[reached])
+            parent_parts.append(node_ids[parents[reached]])
+            length_parts.append(lengths[reached])
+        rows = np.concatenate(rows_parts) if rows_parts else np.zeros(0, np.int64)
+        cols = np.concatenate(cols_parts) if cols_parts else np.zeros(0, np.int64)
+        parents = np.concatenate(parent_parts) if parent_parts else node_ids[:0]
+        lengths = np.concatenate(length_parts) if length_parts else np.zeros(0)
+        # Explicit zeros (the source row entries) are kept by building from COO
+        return (
+            node_ids,
+            m,
+            ss.csr_matrix((parents, (rows, cols)), shape=(n, n)),
+            ss.csr_matrix((lengths, (rows, cols)), shape=(n, n)),
+        )
+
+    @concrete_algorithm("traversal.bfs_multi")
+    def ss_breadth_first_search_multi(
+        graph: ScipyGraph, source_nodes: NumpyNodeSet, depth_limit: int
+    ) -> Tuple[ScipyGraph, ScipyGraph]:
+        limit = np.inf if depth_limit < 0 else depth_limit
+        node_ids, _, parents, depths = _multi_source_paths(
+            graph, source_nodes, unweighted=True, limit=limit
+        )
+        depths = depths.astype(np.int64)
+        return (
+            ScipyGraph(ScipyEdgeMap(parents, node_ids)),
+            ScipyGraph(ScipyEdgeMap(depths, node_ids)),
+        )
+
+    @concrete_algorithm("traversal.dijkstra_multi")
+    def ss_dijkstra_multi(
+        graph: ScipyGraph, source_nodes: NumpyNodeSet
+    ) -> Tuple[ScipyGraph, ScipyGraph]:
+        node_ids, m, parents, lengths = _multi_source_paths(graph, source_nodes)
+        if np.issubdtype(m.dtype, np.integer):
+            lengths = lengths.astype(m.dtype)
+        return (
+            ScipyGraph(ScipyEdgeMap(parents, node_ids)),
+            ScipyGraph(ScipyEdgeMap(lengths, node_ids)),
+        )
+
+    @concrete_algorithm("traversal.bellman_ford")
+    def ss_bellman_ford(
+        graph: ScipyGraph, source_node: NodeID
+    ) -> Tuple[NumpyNodeMap, NumpyNodeMap]:
+        node_ids, m = _graph_adjacency(graph)
+        source = _source_position(node_ids, source_node)
+        distance, parent, has_negative_cycle = _bellman_ford(
+            m.indptr, m.indices, m.data, source
+        )
+        if has_negative_cycle:
+            raise ValueError("graph contains a negative weight cycle")
+        return _parents_and_distances(node_ids, parent, distance, m.dtype)
+
+    # Brandes betweenness kernels
+    # These are plain Python over the CSR arrays and are compiled with numba when available.
+
+    def _brandes_source(
+        indptr, indices, data, source, is_target, betweenness, distance, sigma, delta
+    ):
+        """
+        Add the dependencies of one source to betweenness (Dijkstra-based Brandes pass).
+
+        distance, sigma and delta are work arrays of length n; they are reset here.
+        """
+        n = len(indptr) - 1
+        distance[:] = np.inf
+        sigma[:] = 0.0
+        delta[:] = 0.0
+        done = np.zeros(n, dtype=np.bool_)
+        order = np.empty(n, dtype=np.int64)
+        rank = np.empty(n, dtype=np.int64)
+        num_done = 0
+        distance[source] = 0.0
+        sigma[source] = 1.0
+        heap = [(0.0, np.int64(source))]
+        while len(heap) > 0:
+            node_distance, node = heapq.heappop(heap)
+            if done[node]:
+                continue
+            done[node] = True
+            order[num_done] = node
+            rank[node] = num_done
+            num_done += 1
+            for j in range(indptr[node], indptr[node + 1]):
+                nbr = indices[j]
+                new_distance = node_distance + data[j]
+                if not done[nbr] and new_distance < distance[nbr]:
+                    distance[nbr] = new_distance
+                    sigma[nbr] = sigma[node]
+                    heapq.heappush(heap, (new_distance, np.int64(nbr)))
+                elif not done[nbr] and new_distance == distance[nbr]:
+                    sigma[nbr] += sigma[node]
+        # Accumulate dependencies in reverse order of completion. With zero weight edges,
+        # only nodes completed after node are its successors, matching sigma above.
+        for i in range(num_done - 1, -1, -1):
+            node = order[i]
+            for j in range(indptr[node], indptr[node + 1]):
+                nbr = indices[j]
+                if (
+                    nbr != source
+                    and distance[node] + data[j] == distance[nbr]
+                    and rank[nbr] > i
+                ):
+                    coeff = delta[nbr] + 1.0 if is_target[nbr] else delta[nbr]
+                    delta[node] += sigma[node] / sigma[nbr] * coeff
+            if node != source:
+                betweenness[node] += delta[node]
+
+    def _python_brandes(indptr, indices, data, sources, is_target):
+        """Sum of the dependencies of every source, towards the target nodes"""
+        n = len(indptr) - 1
+        betweenness = np.zeros(n)
+        distance = np.empty(n)
+        sigma = np.empty(n)
+        delta = np.empty(n)
+        for source in sources:
+            _brandes_source(
+                indptr,
+                indices,
+                data,
+                source,
+                is_target,
+                betweenness,
+                distance,
+                sigma,
+                delta,
+            )
+        return betweenness
+
+    if has_numba:
+        _brandes_source = numba.njit(_brandes_source)
+
+        @numba.njit(parallel=True)
+        def _numba_brandes(indptr, indices, data, sources, is_target, num_chunks):
+            """
+            Sources are dealt round-robin into num_chunks partitions, one per prange
+            iteration. Each partition accumulates into its own row of partial dependencies,
+            and the rows are summed at the end.
+            """
+            n = len(indptr) - 1
+            partial = np.zeros((num_chunks, n))
+            for chunk in numba.prange(num_chunks):
+                distance = np.empty(n)
+                sigma = np.empty(n)
+                delta = np.empty(n)
+                for i in range(chunk, len(sources), num_chunks):
+                    _brandes_source(
+                        indptr,
+                        indices,
+                        data,
+                        sources[i],
+                        is_target,
+                        partial[chunk],
+                        distance,
+                        sigma,
+                        delta,
+                    )
+            return partial.sum(axis=0)
+
+    def _brandes(m: ss.csr_matrix, sources: np.ndarray, is_target: np.ndarray):
+        """
+        Sum of the dependencies of every source, towards the target nodes.
+
+        With numba, sources are split across `numba.get_num_threads()` threads
+        sharing the CSR arrays; otherwise they are processed one after another.
+        """
+        if has_numba:
+            num_chunks = max(1, min(len(sources), numba.get_num_threads()))
+            return _numba_brandes(
+                m.indptr, m.indices, m.data, sources, is_target, num_chunks
+            )
+        return _python_brandes(m.indptr, m.indices, m.data, sources, is_target)
+
+    def _rescale_betweenness(
+        betweenness: np.ndarray, num_nodes: int, normalize: bool, is_directed: bool
+    ) -> np.ndarray:
+        """Rescale to match networkx"""
+        if normalize:
+            if num_nodes > 2:
+                return betweenness / ((num_nodes - 1) * (num_nodes - 2))
+        elif not is_directed:
+            return betweenness * 0.5
+        return betweenness
+
+    def _betweenness_adjacency(graph: ScipyGraph) -> Tuple[np.ndarray, ss.csr_matrix]:
+        node_ids, m = _graph_adjacency(graph)
+        m = m.astype(np.float64)
+        m.sort_indices()
+        return node_ids, m
+
+    @concrete_algorithm("centrality.approximate_betweenness")
+    def ss_approximate_betweenness_centrality(
+        graph: ScipyGraph,
+        k: mg.Optional[int],
+        epsilon: float,
+        normalize: bool,
+        seed: mg.Optional[int],
+    ) -> NumpyNodeMap:
         is_directed = ScipyGraph.Type.compute_abstract_properties(
             graph, {"is_directed"}
         )["is_directed"]
-        bfs_ordered_incides = ss.csgraph.breadth_first_order(
-            graph.edges.value,
-            source_node,
-            directed=is_directed,
-            return_predecessors=False,
+        node_ids, m = _betweenness_adjacency(graph)
+        n = len(node_ids)
+        k = betweenness_sample_size(n, k, epsilon)
+        rng = np.random.default_rng(seed)
+        sources = np.sort(rng.choice(n, k, replace=False))
+        is_target = np.ones(n, dtype=np.bool_)
+        # Scale the sampled sources up to all n sources
+        betweenness = _brandes(m, sources, is_target) * (n / k if k > 0 else 1.0)
+        return _node_map(
+            node_ids, _rescale_betweenness(betweenness, n, normalize, is_directed)
+        )
+
+    @concrete_algorithm("centrality.betweenness")
+    def ss_betweenness_centrality(
+        graph: ScipyGraph, nodes: mg.Optional[NumpyNodeSet], normalize: bool,
+    ) -> NumpyNodeMap:
+        is_directed = ScipyGraph.Type.compute_abstract_properties(
+            graph, {"is_directed"}
+        )["is_directed"]
+        node_ids, m = _betweenness_adjacency(graph)
+        n = len(node_ids)
+        if nodes is None:
+            sources = np.arange(n)
+        else:
+            # Like networkx's betweenness_centrality_subset, targets are the sources
+            sources = np.flatnonzero(np.isin(node_ids, nodes.nodes()))
+        is_target = np.zeros(n, dtype=np.bool_)
+        is_target[sources] = True
+        betweenness = _brandes(m, sources, is_target)
+        return _node_map(
+            node_ids, _rescale_betweenness(betweenness, n, normalize, is_directed)
+        )
+
+    def _subgraph(graph: ScipyGraph, node_ids: np.ndarray) -> ScipyGraph:
+        """
+        Induced subgraph on sorted node_ids, which must all be nodes of graph.
+
+        The edge matrix is fancy-indexed in node_list order and node values stay aligned.
+        """
+        node_list = np.asarray(graph.edges.node_list)
+        order = np.argsort(node_list, kind="stable")
+        sorted_node_list = node_list[order]
+        pos = np.searchsorted(sorted_node_list, node_ids)
+        if len(node_list) > 0:
+            pos = np.minimum(pos, len(node_list) - 1)
+            found = sorted_node_list[pos] == node_ids
+        else:
+            found = np.zeros(len(node_ids), dtype=bool)
+        positions = np.sort(order[pos[found]])
+        m = graph.edges.value.tocsr()[positions][:, positions]
+        edges = type(graph.edges)(
+            m, node_list[positions], transposed=graph.edges.transposed
         )
-        bfs_ordered_nodes = graph.edges.node_list[bfs_ordered_incides]
-        return NumpyVector(bfs_ordered_nodes)
+        if graph.nodes is None:
+            nodes = None
+        elif isinstance(graph.nodes, NumpyNodeMap):
+            nodes = NumpyNodeMap(graph.nodes.get_many(node_ids), node_ids=node_ids)
+        else:
+            nodes = NumpyNodeSet(node_ids)
+        return ScipyGraph(edges, nodes)
+
+    def _core_numbers(indptr, indices):
+        """
+        Batagelj-Zaversnik bucket peeling in O(m); self-loops are ignored.
+
+        Nodes are kept in an array sorted by current degree, with bucket_start[d]
+        pointing to the first node of degree d. Removing the lowest degree node
+        moves each higher degree neighbor to the front of its bucket and shrinks
+        that bucket by one, so all updates are O(1).
+        """
+        n = len(indptr) - 1
+        degree = np.zeros(n, dtype=np.int64)
+        for node in range(n):
+            for j in range(indptr[node], indptr[node + 1]):
+                if indices[j] != node:
+                    degree[node] += 1
+        max_degree = degree.max() if n > 0 else 0
+        bucket_start = np.zeros(max_degree + 2, dtype=np.int64)
+        for node in range(n):
+            bucket_start[degree[node] + 1] += 1
+        bucket_start = np.cumsum(bucket_start)
+        position = np.empty(n, dtype=np.int64)
+        ordered = np.empty(n, dtype=np.int64)
+        next_slot = bucket_start.copy()
+        for node in range(n):
+            position[node] = next_slot[degree[node]]
+            ordered[position[node]] = node
+            next_slot[degree[node]] += 1
+        for i in range(n):
+            node = ordered[i]
+            for j in range(indptr[node], indptr[node + 1]):
+                nbr = indices[j]
+                if nbr != node and degree[nbr] > degree[node]:
+                    # Swap nbr with the first node of its bucket, then shrink the bucket
+                    nbr_degree = degree[nbr]
+                    first_pos = bucket_start[nbr_degree]
+                    first = ordered[first_pos]
+                    if first != nbr:
+                        ordered[position[nbr]] = first
+                        position[first] = position[nbr]
+                        ordered[first_pos] = nbr
+                        position[nbr] = first_pos
+                    bucket_start[nbr_degree] += 1
+                    degree[nbr] -= 1
+        return degree
+
+    if has_numba:
+        _core_numbers = numba.njit(_core_numbers)
+
+    @concrete_algorithm("subgraph.extract_subgraph")
+    def ss_extract_subgraph(graph: ScipyGraph, nodes: NumpyNodeSet) -> ScipyGraph:
+        node_ids = np.unique(nodes.nodes())
+        if graph.nodes is not None:
+            node_ids = node_ids[graph.nodes.contains_many(node_ids)]
+        else:
+            node_ids = np.intersect1d(
+                node_ids, graph.edges.node_list, assume_unique=True
+            )
+        return _subgraph(graph, node_ids)
 
-    def _reduce_sparse_matrix(
-        func: np.ufunc, sparse_matrix: ss.spmatrix
-    ) -> Tuple[np.ndarray, np.ndarray]:
-        keep_mask = np.diff(sparse_matrix.indptr).astype(bool)
-        reduceat_indices = sparse_matrix.indptr[:-1][keep_mask]
-        reduced_values = func.reduceat(
-            sparse_matrix.data, reduceat_indices, dtype=object
+    @concrete_algorithm("subgraph.core_number")
+    def ss_core_number(graph: ScipyGraph) -> NumpyNodeMap:
+        node_ids, m = _graph_adjacency(graph)
+        return _node_map(node_ids, _core_numbers(m.indptr, m.indices))
+
+    @concrete_algorithm("subgraph.k_core")
+    def ss_k_core(graph: ScipyGraph, k: int) -> ScipyGraph:
+        node_ids, m = _graph_adjacency(graph)
+        cores = _core_numbers(m.indptr, m.indices)
+        return _subgraph(graph, node_ids[cores >= k])
+
+    def _projection_blocks(b: ss.csr_matrix, memory_budget: int = None) -> np.ndarray:
+        """
+        Row boundaries for computing `b @ b.T` one block of rows at a time, where b is
+        a biadjacency matrix of ones.
+
+        The products contributed by a row are bounded by the summed degrees of its
+        neighbors, so blocks are cut wherever that bound fills the memory budget.
+        """
+        if memory_budget is None:
+            memory_budget = config.get(
+                "plugins.scipy.projection_memory_budget", 2 ** 28
+            )
+        # Each product needs an int32 column index and a float64 or int64 value
+        max_products = max(1, memory_budget // 12)
+        other_degrees = np.bincount(b.indices, minlength=b.shape[1])
+        cumulative = np.cumsum(b @ other_degrees)
+        bounds = [0]
+        while bounds[-1] < b.shape[0]:
+            start = bounds[-1]
+            base = cumulative[start - 1] if start > 0 else 0
+            stop = int(np.searchsorted(cumulative, base + max_products, side="right"))
+            bounds.append(min(max(stop, start + 1), b.shape[0]))
+        return np.array(bounds)
+
+    @concrete_algorithm("bipartite.graph_projection")
+    def ss_graph_projection(
+        bgraph: ScipyBipartiteGraph,
+        nodes_retained: int,
+        weighted: bool,
+        normalize: bool,
+    ) -> ScipyGraph:
+        if nodes_retained not in (0, 1):
+            raise ValueError(f"nodes_retained must be 0 or 1, not {nodes_retained}")
+        b = bgraph.value.tocsr()
+        if nodes_retained == 0:
+            node_list = bgraph.node0_list
+        else:
+            b = b.T.tocsr()
+            node_list = bgraph.node1_list
+        # Shared neighbor counts only depend on the sparsity pattern
+        b = ss.csr_matrix(
+            (np.ones(b.nnz, dtype=np.int64), b.indices, b.indptr), shape=b.shape
         )
-        return reduced_values, keep_mask
+        bt = b.T.tocsr()
+        rows, cols, counts = [], [], []
+        bounds = _projection_blocks(b)
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            block = (b[start:stop] @ bt).tocoo()
+            block_rows = block.row + start
+            # Drop self-loops from each node to itself
+            keep = block_rows != block.col
+            rows.append(block_rows[keep])
+            cols.append(block.col[keep])
+            counts.append(block.data[keep])
+        rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        cols = np.concatenate(cols) if cols else np.zeros(0, dtype=np.int64)
+        counts = np.concatenate(counts) if counts else np.zeros(0, dtype=np.int64)
+        n = len(node_list)
+        if weighted:
+            values = counts / b.shape[1] if normalize else counts
+        else:
+            values = np.ones_like(counts)
+        m = ss.coo_matrix((values, (rows, cols)), shape=(n, n)).tocsr()
+        if weighted:
+            edges = ScipyEdgeMap(m, node_list)
+        else:
+            edges = ScipyEdgeSet(m, node_list)
+        return ScipyGraph(edges)
 
     @concrete_algorithm("util.graph.aggregate_edges")
     def ss_graph_aggregate_edges(
@@ -104,27 +1334,30 @@ if has_scipy:
             if not is_directed:
                 in_edges = True
                 out_edges = False
-        nrows = graph.edges.value.shape[0]
+        weights = graph.edges.value
+        if (
+            weights.dtype.kind in "biuf"
+            and np.asarray(initial_value).dtype.kind in "biuf"
+        ):
+            # Aggregated values have the dtype of the weights (and initial value)
+            dtype = np.result_type(weights.dtype, initial_value)
+        else:
+            dtype = object
+        nrows = weights.shape[0]
         num_agg_values = nrows if graph.nodes is None else len(graph.nodes)
-        final_position_to_agg_value = np.full(num_agg_values, initial_value)
-        if not isinstance(func, np.ufunc):
-            func = np.frompyfunc(func, 2, 1)
-        matrix_position_to_agg_value = np.full(nrows, initial_value)
+        final_position_to_agg_value = np.full(
+            num_agg_values, initial_value, dtype=dtype
+        )
+        matrix_position_to_agg_value = np.full(nrows, initial_value, dtype=dtype)
         if in_edges:
-            csc_matrix = graph.edges.value.tocsc()
-            in_edges_aggregated_values, keep_mask = _reduce_sparse_matrix(
-                func, csc_matrix
-            )
-            matrix_position_to_agg_value[keep_mask] = func(
-                matrix_position_to_agg_value[keep_mask], in_edges_aggregated_values
+            csc_matrix = weights.tocsc()
+            reduce_segments(
+                func, csc_matrix.indptr, csc_matrix.data, matrix_position_to_agg_value
             )
         if out_edges:
-            csr_matrix = graph.edges.value
-            out_edges_aggregated_values, keep_mask = _reduce_sparse_matrix(
-                func, csr_matrix
-            )
-            matrix_position_to_agg_value[keep_mask] = func(
-                matrix_position_to_agg_value[keep_mask], out_edges_aggregated_values
+            csr_matrix = weights.tocsr()
+            reduce_segments(
+                func, csr_matrix.indptr, csr_matrix.data, matrix_position_to_agg_value
             )
         # TODO This doesn't assume sortedness of any node list ; make these other data structures not require sorted node lists as that is expensive for large graphs
         graph_node_ids = (
@@ -150,8 +1383,7 @@ if has_scipy:
     def ss_graph_filter_edges(
         graph: ScipyGraph, func: Callable[[Any], bool]
     ) -> ScipyGraph:
-        # TODO consider caching this somewhere or enforcing that only vectorized functions are given
-        func_vectorized = numba.vectorize(func) if has_numba else np.vectorize(func)
+        func_vectorized = vectorize(func, graph.edges.value.dtype)
         # TODO Explicitly handle the CSR case
         result_matrix = (
             graph.edges.value.copy()
@@ -32,101 +32,253 @@ if has_scipy:
 
 
 if has_scipy and has_networkx:
+    import itertools
     import networkx as nx
-    from .types import ScipyGraph
-    from ..networkx.types import NetworkXGraph
+    from .types import ScipyGraph, ScipyBipartiteGraph
+    from ..networkx.types import NetworkXGraph, NetworkXBipartiteGraph
 
     @translator
     def graph_from_networkx(x: NetworkXGraph, **props) -> ScipyGraph:
         aprops = NetworkXGraph.Type.compute_abstract_properties(
             x, {"node_type", "edge_type"}
         )
-        ordered_nodes = list(
-            sorted(x.value.nodes())
-        )  # TODO do we necesarily have to sort? Expensive for large inputs
-        is_sequential = ordered_nodes[-1] == len(ordered_nodes) - 1
+        g = x.value
+        all_nodes = np.fromiter(g.nodes(), dtype=np.int64, count=len(g))
+        node_order = np.argsort(all_nodes)
+        ordered_nodes = all_nodes[node_order]
+
+        # Extract edges as bulk arrays straight from the adjacency dicts.
+        # Undirected adjacency is already symmetric, with self-loops listed once.
+        adj = g.adj
+        degrees = np.fromiter(map(len, adj.values()), dtype=np.int64, count=len(adj))
+        num_entries = int(degrees.sum())
+        sources = np.repeat(all_nodes, degrees)
+        targets = np.fromiter(
+            itertools.chain.from_iterable(adj.values()),
+            dtype=np.int64,
+            count=num_entries,
+        )
+        if aprops["edge_type"] == "map":
+            weight_label = x.edge_weight_label
+            weights = np.array(
+                [
+                    attrs[weight_label]
+                    for nbrs in adj.values()
+                    for attrs in nbrs.values()
+                ]
+            )
+        else:
+            weights = np.ones(num_entries, dtype=np.int64)
+
+        # Edges only reference non-isolated nodes; positions come from their sorted order
+        node_list, positions = np.unique(
+            np.concatenate([sources, targets]), return_inverse=True
+        )
+        rows = positions[:num_entries]
+        cols = positions[num_entries:]
+        num_edge_nodes = len(node_list)
+        m = ss.coo_matrix(
+            (weights, (rows, cols)), shape=(num_edge_nodes, num_edge_nodes)
+        ).tocsr()
+        if aprops["edge_type"] == "map":
+            edges = ScipyEdgeMap(m, node_list)
+        else:
+            edges = ScipyEdgeSet(m, node_list)
+
+        num_nodes = len(ordered_nodes)
+        is_sequential = num_nodes == 0 or ordered_nodes[-1] == num_nodes - 1
         if aprops["node_type"] == "map":
             node_vals = np.array(
-                [x.value.nodes[n].get(x.node_weight_label) for n in ordered_nodes]
-            )
+                [attrs.get(x.node_weight_label) for _, attrs in g.nodes(data=True)]
+            )[node_order]
             if is_sequential:
                 nodes = NumpyNodeMap(node_vals)
             else:
-                nodes = NumpyNodeMap(node_vals, node_ids=np.array(ordered_nodes))
-        elif not is_sequential:
-            nodes = NumpyNodeSet(np.array(ordered_nodes))
+                nodes = NumpyNodeMap(node_vals, node_ids=ordered_nodes)
+        elif not is_sequential or num_edge_nodes != num_nodes:
+            # Isolated nodes are only known from the node set
+            nodes = NumpyNodeSet(ordered_nodes)
         else:
             nodes = None
-        orphan_nodes = set(nx.isolates(x.value))
-        ordered_nodes = [n for n in ordered_nodes if n not in orphan_nodes]
-        if aprops["edge_type"] == "map":
-            m = nx.convert_matrix.to_scipy_sparse_matrix(
-                x.value, nodelist=ordered_nodes, weight=x.edge_weight_label,
-            )
-            edges = ScipyEdgeMap(m, ordered_nodes)
-        else:
-            m = nx.convert_matrix.to_scipy_sparse_matrix(
-                x.value, nodelist=ordered_nodes
-            )
-            edges = ScipyEdgeSet(m, ordered_nodes)
         return ScipyGraph(edges, nodes)
 
     @translator
     def graph_to_networkx(x: ScipyGraph, **props) -> NetworkXGraph:
-        from ..python.translators import dtype_casting
-
         aprops = ScipyGraph.Type.compute_abstract_properties(
             x, {"is_directed", "edge_type", "edge_dtype"}
         )
+        nx_graph = nx.DiGraph() if aprops["is_directed"] else nx.Graph()
 
-        nx_graph = nx.from_scipy_sparse_matrix(
-            x.edges.value,
-            create_using=nx.DiGraph if aprops["is_directed"] else nx.Graph,
-            edge_attribute="weight",
-        )
-
+        # Map positions to node ids up front so no relabel pass is needed
+        node_list = np.asarray(x.edges.node_list)
+        nx_graph.add_nodes_from(node_list.tolist())
+        coo = x.edges.value.tocoo()
+        rows, cols, vals = coo.row, coo.col, coo.data
+        if not aprops["is_directed"]:
+            # Symmetric matrix; only add each edge once
+            keep = rows <= cols
+            rows, cols, vals = rows[keep], cols[keep], vals[keep]
+        sources = node_list[rows].tolist()
+        targets = node_list[cols].tolist()
         if aprops["edge_type"] == "set":
-            # Remove weight attribute
-            for _, _, attr in nx_graph.edges(data=True):
-                del attr["weight"]
+            nx_graph.add_edges_from(zip(sources, targets))
         else:
-            caster = dtype_casting[aprops["edge_dtype"]]
-            for _, _, attr in nx_graph.edges(data=True):
-                attr["weight"] = caster(attr["weight"])
-
-        if x.edges.node_list is not None:
-            pos2id = dict(enumerate(x.edges.node_list))
-            nx.relabel_nodes(nx_graph, pos2id, False)
+            if aprops["edge_dtype"] == "str":
+                vals = vals.astype(str)
+            # tolist casts to the equivalent Python scalars in a single pass
+            nx_graph.add_weighted_edges_from(zip(sources, targets, vals.tolist()))
 
         if x.nodes is not None:
             if isinstance(x.nodes, NumpyNodeSet):
-                nx_graph.add_nodes_from(x.nodes)
+                nx_graph.add_nodes_from(x.nodes.nodes().tolist())
             elif isinstance(x.nodes, NumpyNodeMap):
-                # TODO make __iter__ a required method for NodeMap implementations or making __getitem__ handle sets of ids to simplify this sort of code
-                make_weight_dict = lambda weight: {"weight": weight}
-                if x.nodes.mask is not None:
-                    ids = np.flatnonzero(x.nodes.mask)
-                    attrs = map(make_weight_dict, x.nodes.value[x.nodes.mask])
-                    id2attr = dict(zip(ids, attrs))
-                elif x.nodes.id2pos is not None:
-                    id2attr = {
-                        node_id: make_weight_dict(x.nodes.value[pos])
-                        for node_id, pos in x.nodes.id2pos.items()
-                    }
-                else:
-                    id2attr = dict(enumerate(map(make_weight_dict, x.nodes.value)))
-                nx.set_node_attributes(nx_graph, id2attr, name="weight")
+                ids, vals = x.nodes.items_arrays()
+                weights = ({"weight": val} for val in vals.tolist())
+                nx_graph.add_nodes_from(zip(ids.tolist(), weights))
 
         return NetworkXGraph(nx_graph)
 
+    @translator
+    def bipartite_graph_from_networkx(
+        x: NetworkXBipartiteGraph, **props
+    ) -> ScipyBipartiteGraph:
+        aprops = NetworkXBipartiteGraph.Type.compute_abstract_properties(
+            x, {"is_directed", "node0_type", "node1_type", "edge_type"}
+        )
+        if aprops["is_directed"]:
+            raise TypeError("Cannot translate a directed bipartite graph")
+        for prop in ("node0_type", "node1_type"):
+            if aprops[prop] != "set":
+                raise TypeError(f"Cannot translate with {prop}={aprops[prop]}")
+        node0_list = np.array(sorted(x.nodes[0]), dtype=np.int64)
+        node1_list = np.array(sorted(x.nodes[1]), dtype=np.int64)
+
+        # Each edge is listed once from its node0 end. Listed nodes need not be in the graph.
+        adj = x.value.adj
+        nbrs = [adj.get(node, {}) for node in node0_list.tolist()]
+        degrees = np.fromiter(map(len, nbrs), dtype=np.int64, count=len(nbrs))
+        num_edges = int(degrees.sum())
+        rows = np.repeat(np.arange(len(node0_list)), degrees)
+        targets = np.fromiter(
+            itertools.chain.from_iterable(nbrs), dtype=np.int64, count=num_edges
+        )
+        cols = np.searchsorted(node1_list, targets)
+        found = cols < len(node1_list)
+        found[found] = node1_list[cols[found]] == targets[found]
+        if not found.all():
+            raise ValueError("Edges must connect a node0 node to a node1 node")
+        if aprops["edge_type"] == "map":
+            weight_label = x.edge_weight_label
+            weights = np.array(
+                [attrs[weight_label] for nbr in nbrs for attrs in nbr.values()]
+            )
+        else:
+            weights = np.ones(num_edges, dtype=np.int64)
+        m = ss.coo_matrix(
+            (weights, (rows, cols)), shape=(len(node0_list), len(node1_list))
+        ).tocsr()
+        return ScipyBipartiteGraph(
+            m, node0_list, node1_list, edge_type=aprops["edge_type"]
+        )
+
+    @translator
+    def bipartite_graph_to_networkx(
+        x: ScipyBipartiteGraph, **props
+    ) -> NetworkXBipartiteGraph:
+        nx_graph = nx.Graph()
+        node0_list = x.node0_list.tolist()
+        node1_list = x.node1_list.tolist()
+        nx_graph.add_nodes_from(node0_list)
+        nx_graph.add_nodes_from(node1_list)
+        coo = x.value.tocoo()
+        sources = x.node0_list[coo.row].tolist()
+        targets = x.node1_list[coo.col].tolist()
+        if x.edge_type == "set":
+            nx_graph.add_edges_from(zip(sources, targets))
+        else:
+            nx_graph.add_weighted_edges_from(zip(sources, targets, coo.data.tolist()))
+        return NetworkXBipartiteGraph(nx_graph, (node0_list, node1_list))
+
 
 if has_scipy and has_grblas:
     import scipy.sparse as ss
-    from .types import ScipyMatrixType
-    from ..graphblas.types import GrblasMatrixType
+    from .types import ScipyMatrixType, ScipyGraph
+    from ..graphblas.types import (
+        GrblasMatrixType,
+        GrblasEdgeSet,
+        GrblasEdgeMap,
+        GrblasGraph,
+        GrblasNodeSet,
+        GrblasNodeMap,
+    )
+
+    def _export_csr(x):
+        """Export a grblas.Matrix as a scipy.sparse.csr_matrix without going through COO"""
+        info = x.ss.export("csr", sort=True)
+        return ss.csr_matrix(
+            (info["values"], info["col_indices"], info["indptr"]),
+            shape=(info["nrows"], info["ncols"]),
+        )
+
+    def _compact_node_ids(m):
+        """
+        Drop rows and columns of a square CSR matrix which have no edges.
+
+        Returns (node_list, matrix). If every node has an edge, m is returned as-is.
+        """
+        has_edges = np.diff(m.indptr) > 0
+        has_edges[m.indices] = True
+        if has_edges.all():
+            return np.arange(m.shape[0]), m
+        node_list = np.flatnonzero(has_edges)
+        id2pos = np.cumsum(has_edges) - 1
+        indptr = np.concatenate([[0], m.indptr[node_list + 1]])
+        n = len(node_list)
+        compact = ss.csr_matrix((m.data, id2pos[m.indices], indptr), shape=(n, n))
+        return node_list, compact
 
     @translator
     def matrix_from_graphblas(x: GrblasMatrixType, **props) -> ScipyMatrixType:
-        rows, cols, vals = x.to_values()
-        mat = ss.coo_matrix((vals, (rows, cols)), x.shape)
-        return mat
+        return _export_csr(x)
+
+    def _edges_from_graphblas(x):
+        positions, m = _compact_node_ids(_export_csr(x.value))
+        if x.node_list is not None:
+            # Map compacted grblas positions back to node ids
+            return x.node_list[positions], m
+        return positions, m
+
+    @translator
+    def edgeset_from_graphblas(x: GrblasEdgeSet, **props) -> ScipyEdgeSet:
+        node_list, m = _edges_from_graphblas(x)
+        return ScipyEdgeSet(m, node_list, transposed=x.transposed)
+
+    @translator
+    def edgemap_from_graphblas(x: GrblasEdgeMap, **props) -> ScipyEdgeMap:
+        node_list, m = _edges_from_graphblas(x)
+        return ScipyEdgeMap(m, node_list, transposed=x.transposed)
+
+    @translator
+    def graph_from_graphblas(x: GrblasGraph, **props) -> ScipyGraph:
+        if isinstance(x.edges, GrblasEdgeMap):
+            edges = edgemap_from_graphblas(x.edges)
+        else:
+            edges = edgeset_from_graphblas(x.edges)
+
+        if isinstance(x.nodes, GrblasNodeMap):
+            node_ids, vals = x.nodes.items_arrays()
+            nodes = NumpyNodeMap(vals, node_ids=node_ids)
+        elif isinstance(x.nodes, GrblasNodeSet):
+            node_ids = np.asarray(x.nodes.value.to_values()[0])
+            if x.nodes.node_list is not None:
+                node_ids = x.nodes.node_list[node_ids]
+            nodes = NumpyNodeSet(node_ids)
+        elif len(edges.node_list) != x.edges.value.nrows:
+            # Without a node set, every id in the matrix dimensions is a node
+            if x.edges.node_list is not None:
+                nodes = NumpyNodeSet(x.edges.node_list)
+            else:
+                nodes = NumpyNodeSet(np.arange(x.edges.value.nrows))
+        else:
+            nodes = None
+        return ScipyGraph(edges, nodes)
@@ -1,7 +1,12 @@
 from typing import Set, Dict, Any
 from metagraph import ConcreteType, dtypes
-from metagraph.types import Matrix, EdgeSet, EdgeMap, Graph
-from metagraph.wrappers import EdgeSetWrapper, EdgeMapWrapper, CompositeGraphWrapper
+from metagraph.types import Matrix, EdgeSet, EdgeMap, Graph, BipartiteGraph
+from metagraph.wrappers import (
+    EdgeSetWrapper,
+    EdgeMapWrapper,
+    CompositeGraphWrapper,
+    BipartiteGraphWrapper,
+)
 from metagraph.plugins import has_scipy
 import numpy as np
 
@@ -247,3 +252,136 @@ if has_scipy:
         def copy(self):
             nodes = self.nodes if self.nodes is None else self.nodes.copy()
             return ScipyGraph(self.edges.copy(), nodes=nodes)
+
+    class ScipyBipartiteGraph(BipartiteGraphWrapper, abstract=BipartiteGraph):
+        """
+        ScipyBipartiteGraph stores an undirected bipartite graph as a biadjacency matrix.
+
+        Row i of the matrix is node node0_list[i] and column j is node node1_list[j].
+        Nodes without edges are empty rows or columns. Edge values are ignored when
+        edge_type is "set". Node values are not supported.
+        """
+
+        def __init__(self, matrix, node0_list=None, node1_list=None, edge_type="map"):
+            self._assert_instance(matrix, ss.spmatrix)
+            self._assert(edge_type in {"set", "map"}, f"Invalid edge_type: {edge_type}")
+            nrows, ncols = matrix.shape
+            if node0_list is None:
+                node0_list = np.arange(nrows)
+            elif not isinstance(node0_list, np.ndarray):
+                node0_list = np.array(node0_list)
+            if node1_list is None:
+                node1_list = np.arange(nrows, nrows + ncols)
+            elif not isinstance(node1_list, np.ndarray):
+                node1_list = np.array(node1_list)
+            self._assert(
+                nrows == len(node0_list),
+                f"node0 list size ({len(node0_list)}) and matrix rows ({nrows}) don't match.",
+            )
+            self._assert(
+                ncols == len(node1_list),
+                f"node1 list size ({len(node1_list)}) and matrix columns ({ncols}) don't match.",
+            )
+            common_nodes = np.intersect1d(node0_list, node1_list)
+            if len(common_nodes) > 0:
+                raise ValueError(
+                    f"Node IDs found in both parts of the graph: {common_nodes}"
+                )
+            self.value = matrix
+            self.node0_list = node0_list
+            self.node1_list = node1_list
+            self.edge_type = edge_type
+
+        def copy(self):
+            return ScipyBipartiteGraph(
+                self.value.copy(),
+                self.node0_list.copy(),
+                self.node1_list.copy(),
+                edge_type=self.edge_type,
+            )
+
+        def _sorted_matrix(self):
+            """Biadjacency CSR matrix with rows and columns in sorted node id order"""
+            m = self.value.tocsr()
+            order0 = np.argsort(self.node0_list)
+            order1 = np.argsort(self.node1_list)
+            m = m[order0][:, order1]
+            m.sort_indices()
+            return m
+
+        class TypeMixin:
+            @classmethod
+            def _compute_abstract_properties(
+                cls, obj, props: Set[str], known_props: Dict[str, Any]
+            ) -> Dict[str, Any]:
+                ret = known_props.copy()
+
+                # fast properties
+                for prop in {
+                    "is_directed",
+                    "node0_type",
+                    "node1_type",
+                    "node0_dtype",
+                    "node1_dtype",
+                    "edge_type",
+                } - ret.keys():
+                    if prop == "is_directed":
+                        ret[prop] = False
+                    if prop in {"node0_type", "node1_type"}:
+                        ret[prop] = "set"
+                    if prop in {"node0_dtype", "node1_dtype"}:
+                        ret[prop] = None
+                    if prop == "edge_type":
+                        ret[prop] = obj.edge_type
+
+                # slow properties, only compute if asked
+                for prop in props - ret.keys():
+                    if prop == "edge_dtype":
+                        if ret["edge_type"] == "map":
+                            ret[prop] = dtypes.dtypes_simplified[obj.value.dtype]
+                        else:
+                            ret[prop] = None
+                    if prop == "edge_has_negative_weights":
+                        dtype = dtypes.dtypes_simplified[obj.value.dtype]
+                        if ret["edge_type"] == "set" or dtype in {"bool", "str"}:
+                            neg_weights = None
+                        elif obj.value.nnz == 0:
+                            neg_weights = False
+                        else:
+                            neg_weights = bool(obj.value.data.min() < 0)
+                        ret[prop] = neg_weights
+
+                return ret
+
+            @classmethod
+            def assert_equal(
+                cls,
+                obj1,
+                obj2,
+                aprops1,
+                aprops2,
+                cprops1,
+                cprops2,
+                *,
+                rel_tol=1e-9,
+                abs_tol=0.0,
+            ):
+                assert aprops1 == aprops2, f"property mismatch: {aprops1} != {aprops2}"
+                for part in ("node0_list", "node1_list"):
+                    nodes1 = np.sort(getattr(obj1, part))
+                    nodes2 = np.sort(getattr(obj2, part))
+                    assert (
+                        len(nodes1) == len(nodes2) and (nodes1 == nodes2).all()
+                    ), f"{part} mismatch: {nodes1} != {nodes2}"
+                d1 = obj1._sorted_matrix()
+                d2 = obj2._sorted_matrix()
+                assert d1.nnz == d2.nnz, f"num edges mismatch: {d1.nnz} != {d2.nnz}"
+                assert (d1.indptr == d2.indptr).all(), f"{d1.indptr == d2.indptr}"
+                assert (d1.indices == d2.indices).all(), f"{d1.indices == d2.indices}"
+                if aprops1["edge_type"] == "map":
+                    if issubclass(d1.dtype.type, np.floating):
+                        assert np.isclose(
+                            d1.data, d2.data, rtol=rel_tol, atol=abs_tol
+                        ).all()
+                    else:
+                        assert (d1.data == d2.data).all()
@@ -96,3 +96,80 @@ v /      |          v
     MultiVerify(dpr, "centrality.betweenness", graph, normalize=False,).assert_equals(
         expected_answer
     )
+
+
+def test_approximate_betweenness_centrality(default_plugin_resolver):
+    """
+0 <--2-- 1        5 --10-> 6
+|      ^ |      ^ ^      / 
+|     /  |     /  |     /   
+1    7   3    9   5   11   
+|   /    |  /     |   /    
+v        v /        v      
+3 --8--> 4 <--4-- 2 --6--> 7
+    """
+    dpr = default_plugin_resolver
+    ebunch = [
+        (0, 3, 1),
+        (1, 0, 2),
+        (1, 4, 3),
+        (2, 4, 4),
+        (2, 5, 5),
+        (2, 7, 6),
+        (3, 1, 7),
+        (3, 4, 8),
+        (4, 5, 9),
+        (5, 6, 10),
+        (6, 2, 11),
+    ]
+    nx_graph = nx.DiGraph()
+    nx_graph.add_weighted_edges_from(ebunch)
+    graph = dpr.wrappers.Graph.NetworkXGraph(nx_graph)
+    # Sampling every node is exact
+    expected_answer_unwrapped = {
+        0: 1.0,
+        1: 1.0,
+        2: 9.0,
+        3: 6.0,
+        4: 12.0,
+        5: 13.0,
+        6: 11.0,
+        7: 0.0,
+    }
+    expected_answer = dpr.wrappers.NodeMap.PythonNodeMap(expected_answer_unwrapped)
+    MultiVerify(
+        dpr, "centrality.approximate_betweenness", graph, k=8, seed=42
+    ).assert_equals(expected_answer)
+    # Small graphs need more samples than nodes to reach epsilon
+    MultiVerify(
+        dpr, "centrality.approximate_betweenness", graph, epsilon=0.5
+    ).assert_equals(expected_answer)
+
+    # The same seed samples the same sources
+    scipy_graph = dpr.translate(graph, dpr.types.Graph.ScipyGraphType)
+    first = dpr.algos.centrality.approximate_betweenness(scipy_graph, k=3, seed=7)
+    second = dpr.algos.centrality.approximate_betweenness(scipy_graph, k=3, seed=7)
+    dpr.assert_equal(first, second)
+
+
+def test_betweenness_centrality_zero_weights(default_plugin_resolver, monkeypatch):
+    from metagraph.plugins.scipy import algorithms as scipy_algorithms
+
+    dpr = default_plugin_resolver
+    for edges in [
+        [(0, 1, 1), (0, 2, 1), (2, 1, 0), (1, 3, 1)],
+        [(0, 1, 1), (0, 2, 1), (1, 2, 0), (2, 3, 1)],
+    ]:
+        nx_graph = nx.DiGraph()
+        nx_graph.add_weighted_edges_from(edges)
+        graph = dpr.translate(
+            dpr.wrappers.Graph.NetworkXGraph(nx_graph), dpr.types.Graph.ScipyGraphType
+        )
+        expected = nx.betweenness_centrality(
+            nx_graph, normalized=False, weight="weight"
+        )
+        # The Python kernel is used when numba is missing and must give the same answer
+        for has_numba in {scipy_algorithms.has_numba, False}:
+            monkeypatch.setattr(scipy_algorithms, "has_numba", has_numba)
+            result = scipy_algorithms.ss_betweenness_centrality(graph, None, False)
+            assert {n: result[n] for n in nx_graph} == expected
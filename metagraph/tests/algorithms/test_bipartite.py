@@ -35,3 +35,45 @@ def test_graph_projection(default_plugin_resolver):
     proj_graph.add_edges_from(projected_edges)
     result = dpr.wrappers.Graph.NetworkXGraph(proj_graph)
     MultiVerify(dpr, "bipartite.graph_projection", bgraph, 1).assert_equals(result)
+
+
+def test_weighted_graph_projection(default_plugin_resolver):
+    """
+    0  1  2  3
+    |\   /|\  \
+    | \ / | \  \
+    5  6  7  8  9
+    """
+    dpr = default_plugin_resolver
+    ebunch = [
+        (0, 5),
+        (0, 6),
+        (2, 6),
+        (2, 7),
+        (2, 8),
+        (3, 9),
+        (3, 5),
+        (2, 5),
+    ]
+    nx_graph = nx.Graph()
+    nx_graph.add_nodes_from([0, 1, 2, 3, 5, 6, 7, 8, 9])
+    nx_graph.add_edges_from(ebunch)
+    bgraph = dpr.wrappers.BipartiteGraph.NetworkXBipartiteGraph(
+        nx_graph, [(0, 1, 2, 3), (5, 6, 7, 8, 9)]
+    )
+    # Weights count the shared neighbors
+    proj_graph = nx.Graph()
+    proj_graph.add_nodes_from([0, 1, 2, 3])
+    proj_graph.add_weighted_edges_from([(0, 2, 2), (0, 3, 1), (2, 3, 1)])
+    result = dpr.wrappers.Graph.NetworkXGraph(proj_graph)
+    MultiVerify(dpr, "bipartite.graph_projection", bgraph, 0, True).assert_equals(
+        result
+    )
+    # Normalized by the size of the other node group
+    proj_graph = nx.Graph()
+    proj_graph.add_nodes_from([0, 1, 2, 3])
+    proj_graph.add_weighted_edges_from([(0, 2, 0.4), (0, 3, 0.2), (2, 3, 0.2)])
+    result = dpr.wrappers.Graph.NetworkXGraph(proj_graph)
+    MultiVerify(dpr, "bipartite.graph_projection", bgraph, 0, True, True).assert_equals(
+        result
+    )
@@ -161,3 +161,110 @@ def test_label_propagation(default_plugin_resolver):
     MultiVerify(dpr, "clustering.label_propagation_community", graph).custom_compare(
         cmp_func, dpr.types.NodeMap.PythonNodeMapType
     )
+
+
+def test_louvain_seed(default_plugin_resolver):
+    """
+0 ---2-- 1        5 --10-- 6
+|      / |        |      / 
+|     /  |        |     /   
+1   7    3        5   11   
+|  /     |        |  /    
+| /      |        | /      
+3 --8--- 4        2 --6--- 7
+    """
+    dpr = default_plugin_resolver
+    ebunch = [
+        (0, 3, 1),
+        (1, 0, 2),
+        (1, 4, 3),
+        (2, 5, 5),
+        (2, 7, 6),
+        (3, 1, 7),
+        (3, 4, 8),
+        (5, 6, 10),
+        (6, 2, 11),
+    ]
+    nx_graph = nx.Graph()
+    nx_graph.add_weighted_edges_from(ebunch)
+    graph = dpr.wrappers.Graph.NetworkXGraph(nx_graph)
+    expected_modularity = nx.algorithms.community.modularity(
+        nx_graph, [{0, 1, 3, 4}, {2, 5, 6, 7}]
+    )
+
+    def cmp_func(x):
+        # The two components are the communities
+        communities, modularity_score = x
+        communities = dpr.translate(communities, dpr.types.NodeMap.PythonNodeMapType)
+        c1 = set(communities[i] for i in (0, 1, 3, 4))
+        c2 = set(communities[i] for i in (2, 5, 6, 7))
+        assert len(c1) == 1, c1
+        assert len(c2) == 1, c2
+        assert c1 != c2, f"{c1}, {c2}"
+        assert abs(modularity_score - expected_modularity) < 1e-9, modularity_score
+
+    MultiVerify(dpr, "clustering.louvain_community", graph, seed=42).custom_compare(
+        cmp_func
+    )
+
+
+def test_louvain_weight_label(default_plugin_resolver):
+    dpr = default_plugin_resolver
+    ebunch = [
+        (0, 3, 1),
+        (1, 0, 2),
+        (1, 4, 3),
+        (2, 5, 5),
+        (2, 7, 6),
+        (3, 1, 7),
+        (3, 4, 8),
+        (5, 6, 10),
+        (6, 2, 11),
+    ]
+    nx_graph = nx.Graph()
+    nx_graph.add_weighted_edges_from(ebunch, weight="wait")
+    graph = dpr.wrappers.Graph.NetworkXGraph(nx_graph, edge_weight_label="wait")
+    expected_modularity = nx.algorithms.community.modularity(
+        nx_graph, [{0, 1, 3, 4}, {2, 5, 6, 7}], weight="wait"
+    )
+    # Unweighted modularity of the same partition differs
+    assert (
+        abs(
+            expected_modularity
+            - nx.algorithms.community.modularity(
+                nx_graph, [{0, 1, 3, 4}, {2, 5, 6, 7}], weight=None
+            )
+        )
+        > 1e-3
+    )
+
+    def cmp_func(x):
+        _, modularity_score = x
+        assert abs(modularity_score - expected_modularity) < 1e-9, modularity_score
+
+    MultiVerify(dpr, "clustering.louvain_community", graph, seed=42).custom_compare(
+        cmp_func
+    )
+
+
+def test_label_propagation_matches_networkx(default_plugin_resolver):
+    dpr = default_plugin_resolver
+    nx_graph = nx.Graph()
+    karate_club = nx.karate_club_graph()
+    nx_graph.add_nodes_from(sorted(karate_club))
+    nx_graph.add_edges_from(karate_club.edges(), weight=1)
+    graph = dpr.wrappers.Graph.NetworkXGraph(nx_graph)
+    expected = sorted(
+        sorted(c)
+        for c in nx.algorithms.community.label_propagation_communities(nx_graph)
+    )
+
+    def cmp_func(x):
+        communities = {}
+        for node, label in x.value.items():
+            communities.setdefault(label, []).append(node)
+        assert sorted(sorted(c) for c in communities.values()) == expected
+
+    MultiVerify(dpr, "clustering.label_propagation_community", graph).custom_compare(
+        cmp_func, dpr.types.NodeMap.PythonNodeMapType
+    )
@@ -0,0 +1,41 @@
+from metagraph.tests.util import default_plugin_resolver
+import networkx as nx
+import numpy as np
+from . import MultiVerify
+
+
+def test_eigenvector_centrality(default_plugin_resolver):
+    """
+    +-+  -1-  +-+  -2-  +-+
+    |0|       |1|       |4|
+    +-+       +-+       +-+
+     |       /           |
+     2      1            1
+     |     /             |
+    +-+  -------3-----  +-+
+    |2|                 |3|
+    +-+                 +-+
+"""
+    dpr = default_plugin_resolver
+    networkx_graph_data = [
+        (0, 1, 1),
+        (0, 2, 2),
+        (1, 2, 1),
+        (2, 3, 3),
+        (3, 4, 1),
+        (1, 4, 2),
+    ]
+    networkx_graph = nx.Graph()
+    networkx_graph.add_weighted_edges_from(networkx_graph_data)
+    data = {
+        0: 0.37690222344729646,
+        1: 0.37038770049197595,
+        2: 0.618095150474698,
+        3: 0.5034948477624536,
+        4: 0.29190578706335196,
+    }
+    expected_val = dpr.wrappers.NodeMap.PythonNodeMap(data)
+    graph = dpr.wrappers.Graph.NetworkXGraph(networkx_graph)
+    MultiVerify(dpr, "centrality.eigenvector", graph, tolerance=1e-8).assert_equals(
+        expected_val, rel_tol=1e-5
+    )
@@ -32,3 +32,42 @@ def test_pagerank(default_plugin_resolver):
     MultiVerify(dpr, "centrality.pagerank", graph, tolerance=1e-7).assert_equals(
         expected_val, rel_tol=1e-5
     )
+
+
+def test_pagerank_dangling(default_plugin_resolver):
+    """
+          +-+
+ ------>  |1|
+ |        +-+
+ |
+ |         |
+ |         v
+
++-+  <--  +-+       +-+
+|0|       |2|  <--  |3|
++-+  -->  +-+       +-+
+
+           |
+           v        +-+
+          +-+       |5|
+          |4|       +-+
+          +-+
+"""
+    dpr = default_plugin_resolver
+    networkx_graph_data = [(0, 1), (0, 2), (2, 0), (1, 2), (3, 2), (2, 4)]
+    networkx_graph = nx.DiGraph()
+    networkx_graph.add_edges_from(networkx_graph_data)
+    networkx_graph.add_node(5)
+    data = {
+        0: 0.20086106658018754,
+        1: 0.14764396998326546,
+        2: 0.326077822670184,
+        3: 0.06227803709308757,
+        4: 0.20086106658018754,
+        5: 0.06227803709308757,
+    }
+    expected_val = dpr.wrappers.NodeMap.PythonNodeMap(data)
+    graph = dpr.wrappers.Graph.NetworkXGraph(networkx_graph)
+    MultiVerify(dpr, "centrality.pagerank", graph, tolerance=1e-7).assert_equals(
+        expected_val, rel_tol=1e-5
+    )
@@ -29,6 +29,37 @@ def test_extract_graph(default_plugin_resolver):
     ).assert_equals(extracted_graph)
 
 
+def test_extract_graph_node_weights(default_plugin_resolver):
+    """
+0 ---2-- 1        5 --10-- 6
+       / |        |      / 
+      /  |        |     /   
+    7    3        5   11      8
+   /     |        |  /    
+  /      |        | /      
+3        4        2 --6--- 7
+    """
+    dpr = default_plugin_resolver
+    nx_graph = nx.Graph()
+    nx_graph.add_nodes_from((node, {"weight": node * 10}) for node in range(9))
+    nx_graph.add_weighted_edges_from(
+        [(1, 0, 2), (1, 4, 3), (2, 5, 5), (2, 7, 6), (3, 1, 7), (5, 6, 10), (6, 2, 11),]
+    )
+    # Node 9 is not in the graph and is ignored
+    desired_nodes = {0, 1, 4, 8, 9}
+    nx_extracted_graph = nx.Graph()
+    nx_extracted_graph.add_nodes_from(
+        (node, {"weight": node * 10}) for node in (0, 1, 4, 8)
+    )
+    nx_extracted_graph.add_weighted_edges_from([(1, 0, 2), (1, 4, 3)])
+    graph = dpr.wrappers.Graph.NetworkXGraph(nx_graph)
+    desired_nodes_wrapped = dpr.wrappers.NodeSet.PythonNodeSet(desired_nodes)
+    extracted_graph = dpr.wrappers.Graph.NetworkXGraph(nx_extracted_graph)
+    MultiVerify(
+        dpr, "subgraph.extract_subgraph", graph, desired_nodes_wrapped
+    ).assert_equals(extracted_graph)
+
+
 def test_k_core(default_plugin_resolver):
     """
 0 ---2-- 1        5 --10-- 6
@@ -52,3 +83,26 @@ def test_k_core(default_plugin_resolver):
     graph = dpr.wrappers.Graph.NetworkXGraph(nx_graph)
     k_core_graph = dpr.wrappers.Graph.NetworkXGraph(nx_k_core_graph)
     MultiVerify(dpr, "subgraph.k_core", graph, k).assert_equals(k_core_graph)
+
+
+def test_core_number(default_plugin_resolver):
+    """
+0 ---2-- 1        5 --10-- 6
+       / |        |      / 
+      /  |        |     /   
+    7    3        5   11   
+   /     |        |  /    
+  /      |        | /      
+3        4        2 --6--- 7
+    """
+    dpr = default_plugin_resolver
+    nx_graph = nx.Graph()
+    nx_graph.add_weighted_edges_from(
+        [(1, 0, 2), (1, 4, 3), (2, 5, 5), (2, 7, 6), (3, 1, 7), (5, 6, 10), (6, 2, 11),]
+    )
+    nx_graph.add_node(8)
+    graph = dpr.wrappers.Graph.NetworkXGraph(nx_graph)
+    expected = dpr.wrappers.NodeMap.PythonNodeMap(
+        {0: 1, 1: 1, 2: 2, 3: 1, 4: 1, 5: 2, 6: 2, 7: 1, 8: 0}
+    )
+    MultiVerify(dpr, "subgraph.core_number", graph).assert_equals(expected)
@@ -2,6 +2,11 @@ from metagraph.tests.util import default_plugin_resolver
 import networkx as nx
 import numpy as np
 import scipy.sparse as ss
+from metagraph.plugins.scipy.types import ScipyGraph
+from metagraph.plugins.scipy.algorithms import (
+    shortest_path_blocks,
+    shortest_paths_to_memmap,
+)
 from . import MultiVerify
 
 
@@ -44,6 +49,50 @@ C --4--- D
     )
 
 
+def test_all_pairs_shortest_paths_blocks(tmp_path):
+    """
+A --1--- B
+|     _/ |
+|   _9   |
+3  /     2
+| /      |
+C --4--- D
+    """
+    graph = ScipyGraph(
+        ss.csr_matrix(
+            np.array(
+                [[0, 1, 3, 0], [1, 0, 9, 2], [3, 9, 0, 4], [0, 2, 4, 0]],
+                dtype=np.int64,
+            )
+        )
+    )
+    expected_lengths = np.array(
+        [[0, 1, 3, 3], [1, 0, 4, 2], [3, 4, 0, 4], [3, 2, 4, 0]], dtype=np.float64
+    )
+    # Budget of 2 dense rows per block
+    blocks = list(shortest_path_blocks(graph, memory_budget=2 * 12 * 4))
+    assert [list(sources) for sources, _, _ in blocks] == [[0, 1], [2, 3]]
+    lengths = np.vstack([block_lengths for _, block_lengths, _ in blocks])
+    np.testing.assert_array_equal(lengths, expected_lengths)
+
+    # Paths longer than the cutoff are not computed
+    _, lengths, parents = next(shortest_path_blocks(graph, cutoff=2))
+    np.testing.assert_array_equal(lengths[0], [0, 1, np.inf, np.inf])
+    np.testing.assert_array_equal(parents[0], [-9999, 0, -9999, -9999])
+
+    lengths, parents = shortest_paths_to_memmap(
+        graph,
+        str(tmp_path / "lengths.npy"),
+        str(tmp_path / "parents.npy"),
+        memory_budget=12 * 4,
+    )
+    np.testing.assert_array_equal(lengths, expected_lengths)
+    np.testing.assert_array_equal(
+        np.load(str(tmp_path / "lengths.npy"), mmap_mode="r"), expected_lengths
+    )
+    np.testing.assert_array_equal(parents[3], [1, 3, 3, -9999])
+
+
 def test_bfs_iter(default_plugin_resolver):
     """
 0 <--2-- 1        5 --10-> 6
@@ -74,6 +123,136 @@ v        v /        v
     MultiVerify(dpr, "traversal.bfs_iter", graph, 0).assert_equals(correct_answer)
 
 
+def test_bfs_iter_depth_limit(default_plugin_resolver):
+    """
+0 <--2-- 1        5 --10-> 6
+|        |      ^ ^      /
+|        |     /  |     /
+1        3    9   5   11
+|        |  /     |   /
+v        v /        v
+3 --8--> 4 <--4-- 2 --6--> 7
+    """
+    dpr = default_plugin_resolver
+    ebunch = [
+        (0, 3, 1),
+        (1, 0, 2),
+        (1, 4, 3),
+        (2, 4, 4),
+        (2, 5, 5),
+        (2, 7, 6),
+        (3, 4, 8),
+        (4, 5, 9),
+        (5, 6, 10),
+        (6, 2, 11),
+    ]
+    nx_graph = nx.DiGraph()
+    nx_graph.add_weighted_edges_from(ebunch)
+    graph = dpr.wrappers.Graph.NetworkXGraph(nx_graph, edge_weight_label="weight")
+    correct_answer = dpr.wrappers.Vector.NumpyVector(np.array([0, 3, 4]))
+    MultiVerify(dpr, "traversal.bfs_iter", graph, 0, depth_limit=2).assert_equals(
+        correct_answer
+    )
+
+
+def test_bfs_tree(default_plugin_resolver):
+    """
+0 <--2-- 1        5 --10-> 6
+|        |      ^ ^      /
+|        |     /  |     /
+1        3    9   5   11
+|        |  /     |   /
+v        v /        v
+3 --8--> 4 <--4-- 2 --6--> 7
+    """
+    dpr = default_plugin_resolver
+    ebunch = [
+        (0, 3, 1),
+        (1, 0, 2),
+        (1, 4, 3),
+        (2, 4, 4),
+        (2, 5, 5),
+        (2, 7, 6),
+        (3, 4, 8),
+        (4, 5, 9),
+        (5, 6, 10),
+        (6, 2, 11),
+    ]
+    nx_graph = nx.DiGraph()
+    nx_graph.add_weighted_edges_from(ebunch)
+    graph = dpr.wrappers.Graph.NetworkXGraph(nx_graph, edge_weight_label="weight")
+    node_to_depth_mapping = {1: 0, 0: 1, 4: 1, 3: 2, 5: 2, 6: 3, 2: 4, 7: 5}
+    node_to_parent_mapping = {1: 1, 0: 1, 4: 1, 3: 0, 5: 4, 6: 5, 2: 6, 7: 2}
+    expected_answer = (
+        dpr.wrappers.NodeMap.PythonNodeMap(node_to_depth_mapping),
+        dpr.wrappers.NodeMap.PythonNodeMap(node_to_parent_mapping),
+    )
+    MultiVerify(dpr, "traversal.bfs_tree", graph, 1).assert_equals(expected_answer)
+
+    expected_answer = (
+        dpr.wrappers.NodeMap.PythonNodeMap({1: 0, 0: 1, 4: 1}),
+        dpr.wrappers.NodeMap.PythonNodeMap({1: 1, 0: 1, 4: 1}),
+    )
+    MultiVerify(dpr, "traversal.bfs_tree", graph, 1, depth_limit=1).assert_equals(
+        expected_answer
+    )
+
+
+def test_bfs_multi(default_plugin_resolver):
+    """
+0 <--2-- 1        5 --10-> 6
+|      ^ |      ^ ^      /
+|     /  |     /  |     /
+1    7   3    9   5   11
+|   /    |  /     |   /
+v        v /        v
+3 --8--> 4 <--4-- 2 --6--> 7
+    """
+    dpr = default_plugin_resolver
+    ebunch = [
+        (0, 3, 1),
+        (1, 0, 2),
+        (1, 4, 3),
+        (2, 4, 4),
+        (2, 5, 5),
+        (2, 7, 6),
+        (3, 1, 7),
+        (3, 4, 8),
+        (4, 5, 9),
+        (5, 6, 10),
+        (6, 2, 11),
+    ]
+    nx_graph = nx.DiGraph()
+    nx_graph.add_weighted_edges_from(ebunch)
+    graph = dpr.wrappers.Graph.NetworkXGraph(nx_graph)
+    sources = dpr.wrappers.NodeSet.PythonNodeSet({0, 5})
+    parents = {
+        0: {0: 0, 3: 0, 1: 3, 4: 3, 5: 4, 6: 5, 2: 6, 7: 2},
+        5: {5: 5, 6: 5, 2: 6, 4: 2, 7: 2},
+    }
+    depths = {
+        0: {0: 0, 3: 1, 1: 2, 4: 2, 5: 3, 6: 4, 2: 5, 7: 6},
+        5: {5: 0, 6: 1, 2: 2, 4: 3, 7: 3},
+    }
+    expected_answer = (
+        _multi_source_graph(dpr, range(8), parents),
+        _multi_source_graph(dpr, range(8), depths),
+    )
+    MultiVerify(dpr, "traversal.bfs_multi", graph, sources).assert_equals(
+        expected_answer
+    )
+
+    parents = {0: {0: 0, 3: 0}, 5: {5: 5, 6: 5}}
+    depths = {0: {0: 0, 3: 1}, 5: {5: 0, 6: 1}}
+    expected_answer = (
+        _multi_source_graph(dpr, range(8), parents),
+        _multi_source_graph(dpr, range(8), depths),
+    )
+    MultiVerify(
+        dpr, "traversal.bfs_multi", graph, sources, depth_limit=1
+    ).assert_equals(expected_answer)
+
+
 def test_bellman_ford(default_plugin_resolver):
     """
 0 <--2-- 1        5 --10-> 6
@@ -144,3 +323,57 @@ v        v /        v
         dpr.wrappers.NodeMap.PythonNodeMap(node_to_length_mapping),
     )
     MultiVerify(dpr, "traversal.dijkstra", graph, 0).assert_equals(expected_answer)
+
+
+def test_dijkstra_multi(default_plugin_resolver):
+    """
+0 <--2-- 1        5 --10-> 6
+|      ^ |      ^ ^      /
+|     /  |     /  |     /
+1    7   3    9   5   11
+|   /    |  /     |   /
+v        v /        v
+3 --8--> 4 <--4-- 2 --6--> 7
+    """
+    dpr = default_plugin_resolver
+    ebunch = [
+        (0, 3, 1),
+        (1, 0, 2),
+        (1, 4, 3),
+        (2, 4, 4),
+        (2, 5, 5),
+        (2, 7, 6),
+        (3, 1, 7),
+        (3, 4, 8),
+        (4, 5, 9),
+        (5, 6, 10),
+        (6, 2, 11),
+    ]
+    nx_graph = nx.DiGraph()
+    nx_graph.add_weighted_edges_from(ebunch)
+    graph = dpr.wrappers.Graph.NetworkXGraph(nx_graph)
+    sources = dpr.wrappers.NodeSet.PythonNodeSet({0, 2})
+    parents = {
+        0: {0: 0, 3: 0, 1: 3, 4: 3, 5: 4, 6: 5, 2: 6, 7: 2},
+        2: {2: 2, 4: 2, 5: 2, 7: 2, 6: 5},
+    }
+    lengths = {
+        0: {0: 0, 3: 1, 1: 8, 4: 9, 5: 18, 6: 28, 2: 39, 7: 45},
+        2: {2: 0, 4: 4, 5: 5, 7: 6, 6: 15},
+    }
+    expected_answer = (
+        _multi_source_graph(dpr, range(8), parents),
+        _multi_source_graph(dpr, range(8), lengths),
+    )
+    MultiVerify(dpr, "traversal.dijkstra_multi", graph, sources).assert_equals(
+        expected_answer
+    )
+
+
+def _multi_source_graph(dpr, nodes, values_by_source):
+    """Build the expected multi-source output graph from {source: {node: value}}"""
+    g = nx.DiGraph()
+    g.add_nodes_from(nodes)
+    for source, values in values_by_source.items():
+        g.add_weighted_edges_from((source, v, val) for v, val in values.items())
+    return dpr.wrappers.Graph.NetworkXGraph(g)
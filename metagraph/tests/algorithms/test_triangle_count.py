@@ -1,5 +1,6 @@
 from metagraph.tests.util import default_plugin_resolver
 import networkx as nx
+import numpy as np
 from . import MultiVerify
 
 # Simple graph with 5 triangles
@@ -30,3 +31,57 @@ def test_triangle_count(default_plugin_resolver):
     graph = dpr.wrappers.Graph.NetworkXGraph(simple_graph)
 
     MultiVerify(dpr, "cluster.triangle_count", graph).assert_equals(5)
+
+
+def test_node_triangles(default_plugin_resolver):
+    dpr = default_plugin_resolver
+    simple_graph = nx.Graph()
+    simple_graph.add_weighted_edges_from(simple_graph_data)
+    # Self-loops and isolated nodes are in no triangles
+    simple_graph.add_edge(7, 7, weight=1)
+    simple_graph.add_node(8)
+    graph = dpr.wrappers.Graph.NetworkXGraph(simple_graph)
+    expected = dpr.wrappers.NodeMap.PythonNodeMap(
+        {0: 3, 1: 3, 2: 1, 3: 3, 4: 3, 5: 1, 6: 1, 7: 0, 8: 0}
+    )
+    MultiVerify(dpr, "cluster.triangles", graph).assert_equals(expected)
+    MultiVerify(dpr, "cluster.triangle_count", graph).assert_equals(5)
+
+
+def test_node_triangles_without_numba(default_plugin_resolver, monkeypatch):
+    from metagraph.plugins.scipy import algorithms as scipy_algorithms
+
+    dpr = default_plugin_resolver
+    nx_graph = nx.gnm_random_graph(60, 400, seed=7)
+    nx_graph.add_edge(3, 3)
+    graph = dpr.translate(
+        dpr.wrappers.Graph.NetworkXGraph(nx_graph), dpr.types.Graph.ScipyGraphType
+    )
+    expected = nx.triangles(nx_graph)
+    # The sparse matrix products must agree with the numba kernels
+    for has_numba in {scipy_algorithms.has_numba, False}:
+        monkeypatch.setattr(scipy_algorithms, "has_numba", has_numba)
+        counts = scipy_algorithms.ss_node_triangles(graph)
+        assert {n: counts[n] for n in nx_graph} == expected
+        assert scipy_algorithms.ss_triangle_count(graph) == sum(expected.values()) // 3
+
+
+def test_node_triangles_unsorted_node_list(default_plugin_resolver, monkeypatch):
+    from metagraph.plugins.scipy import algorithms as scipy_algorithms
+    from metagraph.plugins.scipy.types import ScipyEdgeSet, ScipyGraph
+    from metagraph.plugins.numpy.types import NumpyNodeSet
+
+    nx_graph = nx.Graph([(30, 10), (10, 20), (20, 30), (30, 40), (40, 50)])
+    nx_graph.add_node(60)
+    node_list = [40, 10, 50, 30, 20]
+    matrix = nx.to_scipy_sparse_matrix(nx_graph, nodelist=node_list, weight=None)
+    edges = ScipyEdgeSet(matrix.tocsr(), node_list=node_list)
+    expected = nx.triangles(nx_graph)
+    for has_numba in {scipy_algorithms.has_numba, False}:
+        monkeypatch.setattr(scipy_algorithms, "has_numba", has_numba)
+        counts = scipy_algorithms.ss_node_triangles(ScipyGraph(edges))
+        assert {n: counts[n] for n in node_list} == {n: expected[n] for n in node_list}
+        counts = scipy_algorithms.ss_node_triangles(
+            ScipyGraph(edges, NumpyNodeSet(np.array(list(nx_graph))))
+        )
+        assert {n: counts[n] for n in nx_graph} == expected
@@ -48,6 +48,26 @@ def test_nodeset_sort(default_plugin_resolver):
     MultiVerify(dpr, "util.nodemap.sort", py_node_map, False).assert_equals(
         dpr.wrappers.Vector.NumpyVector(np.array([7, 6, 5, 4, 3, 2, 1]))
     )
+    # Masked and compact node maps
+    masked_node_map = dpr.wrappers.NodeMap.NumpyNodeMap(
+        np.array([0, 50, 20, 0, 40, 10]),
+        mask=np.array([False, True, True, False, True, True]),
+    )
+    MultiVerify(dpr, "util.nodemap.sort", masked_node_map, True, 2).assert_equals(
+        dpr.wrappers.Vector.NumpyVector(np.array([5, 2]))
+    )
+    MultiVerify(dpr, "util.nodemap.sort", masked_node_map, False, 3).assert_equals(
+        dpr.wrappers.Vector.NumpyVector(np.array([1, 4, 2]))
+    )
+    compact_node_map = dpr.wrappers.NodeMap.NumpyNodeMap(
+        np.array([50, 20, 40, 10]), node_ids=np.array([1, 20, 400, 5000])
+    )
+    MultiVerify(dpr, "util.nodemap.sort", compact_node_map, True, 3).assert_equals(
+        dpr.wrappers.Vector.NumpyVector(np.array([5000, 20, 400]))
+    )
+    MultiVerify(dpr, "util.nodemap.sort", compact_node_map, False, 1).assert_equals(
+        dpr.wrappers.Vector.NumpyVector(np.array([1]))
+    )
 
 
 def test_nodemap_select(default_plugin_resolver):
@@ -87,6 +107,15 @@ def test_nodemap_apply(default_plugin_resolver):
     MultiVerify(dpr, "util.nodemap.apply", node_map, apply_func).assert_equals(
         correct_answer
     )
+    # Masked node map
+    node_map = dpr.wrappers.NodeMap.NumpyNodeMap(
+        np.array([0, 11, 22, -33, 0]), mask=np.array([False, True, True, True, False]),
+    )
+    correct_answer = dpr.wrappers.NodeMap.PythonNodeMap({1: 11, 2: 22, 3: 33})
+    apply_func = lambda x: -x if x < 0 else x
+    MultiVerify(dpr, "util.nodemap.apply", node_map, apply_func).assert_equals(
+        correct_answer
+    )
 
 
 def test_nodemap_reduce(default_plugin_resolver):
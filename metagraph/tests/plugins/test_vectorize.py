@@ -0,0 +1,134 @@
+import gc
+import operator
+import weakref
+import pytest
+import numpy as np
+from metagraph.plugins import has_numba
+from metagraph.plugins.numpy.vectorize import (
+    vectorize,
+    reduce_segments,
+    _reducer_cache,
+    _unjitable_cache,
+    _vectorized_cache,
+)
+
+
+def test_ufunc_used_directly():
+    assert vectorize(np.abs, np.int64) is np.abs
+
+
+def test_cached_per_func_and_dtype():
+    func = lambda x: x * 2
+    vectorized = vectorize(func, np.int64)
+    assert vectorize(func, np.int64) is vectorized
+    np.testing.assert_array_equal(vectorized(np.array([1, 2, 3])), [2, 4, 6])
+    np.testing.assert_array_equal(
+        vectorize(func, np.float64)(np.array([0.5])), np.array([1.0])
+    )
+    # Strings cannot be compiled, but still work
+    doubled = vectorize(func, np.dtype("<U2"))(np.array(["a", "bc"]))
+    np.testing.assert_array_equal(doubled, ["aa", "bcbc"])
+
+
+@pytest.mark.skipif(not has_numba, reason="numba not installed")
+def test_signatures():
+    func = lambda x: x + 1
+    vectorized = vectorize(func, signatures=["int64(int64)", "float64(float64)"])
+    assert len(vectorized.types) == 2
+    assert vectorize(func, np.int64) is vectorized
+    assert vectorize(func, np.float64) is vectorized
+    assert vectorize(vectorized, np.int64) is vectorized
+    np.testing.assert_array_equal(vectorized(np.array([1, 2])), [2, 3])
+
+
+@pytest.mark.skipif(not has_numba, reason="numba not installed")
+def test_cache_does_not_keep_func_alive():
+    func = lambda x: x - 1
+    vectorize(func, np.int64)(np.arange(3))
+    func_ref = weakref.ref(func)
+    assert func in _vectorized_cache
+    del func
+    gc.collect()
+    assert func_ref() is None
+
+
+def test_reduce_segments():
+    # Segments [1, 2], [], [3, 4, 5]
+    indptr = np.array([0, 2, 2, 5])
+    values = np.array([1, 2, 3, 4, 5])
+    lookup = {}
+    for func, expected in [
+        (np.add, [13, 10, 22]),
+        (operator.add, [13, 10, 22]),
+        (max, [10, 10, 10]),
+        (min, [1, 10, 3]),
+        # Compiled with numba if available
+        (lambda x, acc: x * acc, [20, 10, 600]),
+        # Not jit-able, so reduced as Python objects
+        (lambda x, acc: lookup.get(x, x) + acc, [13, 10, 22]),
+    ]:
+        out = np.full(3, 10)
+        reduce_segments(func, indptr, values, out)
+        np.testing.assert_array_equal(out, expected)
+        assert out.dtype == np.int64
+    # Strings are reduced as Python objects, folding each value in as func(value, acc)
+    out = np.full(3, "", dtype=object)
+    reduce_segments(operator.add, indptr, np.array(list("abcde")), out)
+    np.testing.assert_array_equal(out, ["ba", "", "edc"])
+
+
+def test_reduce_segments_fold_order():
+    # Segments [1, 2], [], [3, 4, 5]
+    indptr = np.array([0, 2, 2, 5])
+    values = np.array([1, 2, 3, 4, 5])
+    lookup = {}
+    # acc = value - acc, starting from 10
+    expected = [2 - (1 - 10), 10, 5 - (4 - (3 - 10))]
+    for func in [
+        # Compiled with numba if available
+        lambda value, acc: value - acc,
+        # Not jit-able, so reduced as Python objects
+        lambda value, acc: lookup.get(value, value) - acc,
+        np.subtract,
+    ]:
+        for _ in range(2):
+            # The second call of the unjitable function skips compilation
+            out = np.full(3, 10)
+            reduce_segments(func, indptr, values, out)
+            np.testing.assert_array_equal(out, expected)
+        out = np.full(3, 10, dtype=object)
+        reduce_segments(func, indptr, values, out)
+        np.testing.assert_array_equal(out, expected)
+
+
+@pytest.mark.skipif(not has_numba, reason="numba not installed")
+def test_reduce_segments_remembers_unjitable():
+    lookup = {}
+    func = lambda x, acc: lookup.get(x, x) + acc
+    indptr = np.array([0, 2, 3])
+    values = np.array([1, 2, 3])
+    out = np.zeros(2, dtype=np.int64)
+    reduce_segments(func, indptr, values, out)
+    np.testing.assert_array_equal(out, [3, 3])
+    assert (values.dtype, out.dtype) in _unjitable_cache[func]
+
+    # Later calls with the same dtypes go straight to the Python fallback
+    def fail(*args):
+        raise AssertionError("compiled reducer was called again")
+
+    _reducer_cache[func] = fail
+    out = np.zeros(2, dtype=np.int64)
+    reduce_segments(func, indptr, values, out)
+    np.testing.assert_array_equal(out, [3, 3])
+
+    # The fallback folds in the same order as the compiled kernel
+    subtract = lambda x, acc: x - acc
+    unjitable_subtract = lambda x, acc: lookup.get(x, x) - acc
+    out = np.full(2, 10, dtype=np.int64)
+    reduce_segments(subtract, indptr, values, out)
+    unjitable_out = np.full(2, 10, dtype=np.int64)
+    reduce_segments(unjitable_subtract, indptr, values, unjitable_out)
+    assert (values.dtype, out.dtype) in _unjitable_cache[unjitable_subtract]
+    assert subtract not in _unjitable_cache
+    np.testing.assert_array_equal(out, [2 - (1 - 10), 3 - 10])
+    np.testing.assert_array_equal(unjitable_out, out)
@@ -1,5 +1,6 @@
 import sys
 import os
+import inspect
 import pytest
 
 import metagraph.core.entrypoints
@@ -11,6 +12,7 @@ from metagraph.core.plugin import (
     ConcreteAlgorithm,
     Wrapper,
 )
+from metagraph.core.resolver import Resolver
 
 
 from .util import site_dir, bad_site_dir
@@ -38,3 +40,36 @@ def test_load_registry(site_dir):
 def test_load_failure(bad_site_dir):
     with pytest.raises(metagraph.core.entrypoints.EntryPointsError):
         plugins = metagraph.core.entrypoints.load_plugins()
+
+
+def test_load_plugins_filtering(site_dir, monkeypatch):
+    plugins = metagraph.core.entrypoints.load_plugins(enabled=["plugin1"])
+    assert set(plugins) == {"plugin1"}
+
+    plugins = metagraph.core.entrypoints.load_plugins(enabled=["core*"])
+    assert "plugin1" not in plugins
+    assert "core" in plugins
+
+    # Disabled packages are never imported
+    monkeypatch.delitem(sys.modules, "plugin1", raising=False)
+    plugins = metagraph.core.entrypoints.load_plugins(disabled=["plugin1"])
+    assert "plugin1" not in plugins
+    assert "plugin1" not in sys.modules
+
+
+def test_load_plugins_prunes_dangling_references():
+    from metagraph.plugins.networkx.types import NetworkXGraph
+
+    plugins = metagraph.core.entrypoints.load_plugins(disabled=["core_networkx"])
+    assert "core_networkx" not in plugins
+    for plugin in plugins.values():
+        for tr in plugin.get("translators", ()):
+            sig = inspect.signature(tr.func)
+            assert sig.return_annotation is not NetworkXGraph
+            for p in sig.parameters.values():
+                assert p.annotation is not NetworkXGraph
+
+    # Registering the remaining plugins must succeed
+    res = Resolver()
+    res.register(plugins)
+    assert not hasattr(res.plugins, "core_networkx")
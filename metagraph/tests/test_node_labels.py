@@ -44,3 +44,55 @@ def test_nodes_to_labels():
     with pytest.raises(KeyError):
         labels.ids[(42, 0)]
     assert labels.ids[[42, 0]] == ["C", "A"]
+
+
+def test_vectorized_lookup():
+    labels = NodeLabels([42, 0, 10], ["C", "A", "B"])
+    np.testing.assert_array_equal(labels[np.array(["B", "B", "C"])], [10, 10, 42])
+    np.testing.assert_array_equal(
+        labels.ids[np.array([0, 42, 10])], np.array(["A", "C", "B"])
+    )
+    with pytest.raises(KeyError, match="D"):
+        labels[np.array(["A", "D"])]
+    with pytest.raises(KeyError):
+        labels.ids[np.array([0, 1])]
+    # Lookups return Python scalars
+    assert type(labels["A"]) is int
+    assert type(labels.ids[10]) is str
+
+
+def test_object_labels():
+    labels = NodeLabels([0, 1, 2], [("a", 1), ("b", 2), "c"])
+    assert labels[("b", 2)] == 1
+    assert labels["c"] == 2
+    assert ("a", 2) not in labels
+    assert labels.ids[0] == ("a", 1)
+    assert labels[[("a", 1), "c"]] == [0, 2]
+    np.testing.assert_array_equal(labels[np.array(["c"], dtype=object)], [2])
+
+    # Numbers and strings are not mixed up
+    labels = NodeLabels([0, 1], [1, "1"])
+    assert labels[1] == 0
+    assert labels["1"] == 1
+
+    # Mixed numeric types keep the labels as given
+    labels = NodeLabels([0, 1], [1, 2.5])
+    assert labels.ids[0] == 1 and type(labels.ids[0]) is int
+    assert type(labels.ids[1]) is float
+    assert list(labels.ids[[0, 1]]) == [1, 2.5]
+    assert labels[1] == 0
+    assert labels[2.5] == 1
+    labels = NodeLabels([0, 1], [True, 2])
+    assert labels.ids[0] is True
+    assert type(labels.ids[1]) is int
+    assert labels[True] == 0
+    assert labels[2] == 1
+    with pytest.raises(TypeError, match="node ids must be int"):
+        NodeLabels([True, 2], ["a", "b"])
+
+    with pytest.raises(ValueError, match="duplicate labels"):
+        NodeLabels([0, 1], [("a", 1), ("a", 1)])
+    with pytest.raises(ValueError, match="duplicate labels"):
+        NodeLabels([0, 1], ["a", "a"])
+    with pytest.raises(ValueError, match="duplicate node ids"):
+        NodeLabels([0, 0], ["a", "b"])
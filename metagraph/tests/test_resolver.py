@@ -701,6 +701,39 @@ def test_plugin_specific_concrete_algorithms():
     assert r.algos.cluster.triangle_count.core_networkx(graph) == 5
 
 
+def test_pinned_plugins():
+    r = mg.resolver
+    import networkx as nx
+
+    graph = r.wrappers.Graph.NetworkXGraph(nx.complete_graph(4))
+    all_plans = r.find_algorithm_solutions("cluster.triangle_count", graph)
+    assert len(all_plans) > 1
+
+    with config.set(
+        {"core.dispatch.pinned_plugins": {"cluster.triangle_count": "core_scipy"}}
+    ):
+        plans = r.find_algorithm_solutions("cluster.triangle_count", graph)
+        expected = r.plugins.core_scipy.concrete_algorithms["cluster.triangle_count"]
+        assert {plan.algo for plan in plans} == expected
+        assert r.algos.cluster.triangle_count(graph) == 4
+
+    with config.set(
+        {
+            "core.dispatch.pinned_plugins": {
+                "cluster.triangle_count": ["core_scipy", "core_networkx"]
+            }
+        }
+    ):
+        plans = r.find_algorithm_solutions("cluster.triangle_count", graph)
+        assert len(plans) == 2
+
+    with config.set(
+        {"core.dispatch.pinned_plugins": {"cluster.triangle_count": "not_a_plugin"}}
+    ):
+        with pytest.raises(ValueError, match="has not been registered"):
+            r.find_algorithm_solutions("cluster.triangle_count", graph)
+
+
 def test_duplicate_plugin():
     class AbstractType1(AbstractType):
         pass
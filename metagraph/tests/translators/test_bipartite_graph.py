@@ -0,0 +1,53 @@
+import pytest
+from metagraph.tests.util import default_plugin_resolver
+from metagraph.plugins.scipy.types import ScipyBipartiteGraph
+from metagraph.plugins.networkx.types import NetworkXBipartiteGraph
+import networkx as nx
+import scipy.sparse as ss
+import numpy as np
+
+
+def test_networkx_scipy(default_plugin_resolver):
+    dpr = default_plugin_resolver
+    g = nx.Graph()
+    g.add_nodes_from([0, 1, 2, 5, 6, 7, 8])
+    g.add_weighted_edges_from([(6, 0, 2), (0, 5, 1), (1, 7, 3)])
+    x = NetworkXBipartiteGraph(g, [{0, 1, 2}, {5, 6, 7, 8}])
+    # Convert networkx -> scipy biadjacency
+    #    5 6 7 8
+    # 0 [1 2    ]
+    # 1 [    3  ]
+    # 2 [       ]
+    m = ss.csr_matrix(([1, 2, 3], ([0, 0, 1], [0, 1, 2])), shape=(3, 4))
+    intermediate = ScipyBipartiteGraph(m, [0, 1, 2], [5, 6, 7, 8])
+    y = dpr.translate(x, ScipyBipartiteGraph)
+    dpr.assert_equal(y, intermediate)
+    # Convert scipy biadjacency -> networkx
+    x2 = dpr.translate(y, NetworkXBipartiteGraph)
+    dpr.assert_equal(x, x2)
+
+
+def test_networkx_scipy_edgeset(default_plugin_resolver):
+    dpr = default_plugin_resolver
+    g = nx.Graph()
+    g.add_edges_from([(0, 5), (6, 0), (1, 7)])
+    x = NetworkXBipartiteGraph(g, [{0, 1}, {5, 6, 7}])
+    m = ss.csr_matrix(([1, 1, 1], ([0, 0, 1], [0, 1, 2])), shape=(2, 3))
+    intermediate = ScipyBipartiteGraph(m, [0, 1], [5, 6, 7], edge_type="set")
+    y = dpr.translate(x, ScipyBipartiteGraph)
+    dpr.assert_equal(y, intermediate)
+    x2 = dpr.translate(y, NetworkXBipartiteGraph)
+    dpr.assert_equal(x, x2)
+
+
+def test_networkx_scipy_invalid(default_plugin_resolver):
+    dpr = default_plugin_resolver
+    g = nx.DiGraph()
+    g.add_edges_from([(0, 5), (1, 6)])
+    with pytest.raises(TypeError, match="directed"):
+        dpr.translate(NetworkXBipartiteGraph(g, [{0, 1}, {5, 6}]), ScipyBipartiteGraph)
+    # Edges within a node group are not bipartite
+    g = nx.Graph()
+    g.add_edges_from([(0, 5), (0, 1)])
+    with pytest.raises(ValueError, match="node1"):
+        dpr.translate(NetworkXBipartiteGraph(g, [{0, 1}, {5}]), ScipyBipartiteGraph)
@@ -1,14 +1,12 @@
 import pytest
 from metagraph.tests.util import default_plugin_resolver
-from metagraph.plugins.numpy.types import NumpyNodeSet
+from metagraph.plugins.numpy.types import NumpyNodeSet, NumpyNodeMap
 from metagraph.plugins.scipy.types import ScipyEdgeMap, ScipyEdgeSet, ScipyGraph
 from metagraph.plugins.networkx.types import NetworkXGraph
-from metagraph.plugins.graphblas.types import GrblasEdgeMap
-from metagraph.plugins.pandas.types import PandasEdgeMap
-from metagraph import NodeLabels
+from metagraph.plugins.pandas.types import PandasEdgeMap, PandasEdgeSet
+from metagraph import NodeLabels, config
 import networkx as nx
 import scipy.sparse as ss
-import grblas
 import pandas as pd
 import numpy as np
 
@@ -49,7 +47,43 @@ def test_networkx_scipy_edgeset(default_plugin_resolver):
     dpr.assert_equal(y, intermediate)
 
 
+def test_networkx_scipy_roundtrip(default_plugin_resolver):
+    dpr = default_plugin_resolver
+    # Undirected, with a self-loop, an isolated node, and node weights
+    g = nx.Graph()
+    g.add_nodes_from([(0, {"weight": 1.5}), (1, {"weight": 2.5})])
+    g.add_nodes_from([(2, {"weight": 0.0}), (3, {"weight": -1.0})])
+    g.add_weighted_edges_from([(0, 1, 4), (1, 1, 5), (3, 0, 6)])
+    x = NetworkXGraph(g)
+    y = dpr.translate(x, ScipyGraph)
+    #    0 1 3
+    # 0 [  4 6]
+    # 1 [4 5  ]
+    # 3 [6    ]
+    m = ss.coo_matrix(
+        ([4, 6, 4, 5, 6], ([0, 0, 1, 1, 2], [1, 2, 0, 1, 0])), dtype=np.int64
+    )
+    dpr.assert_equal(
+        y.edges, ScipyEdgeMap(m.tocsr(), [0, 1, 3]),
+    )
+    assert (y.nodes.value == [1.5, 2.5, 0.0, -1.0]).all()
+    x2 = dpr.translate(y, NetworkXGraph)
+    dpr.assert_equal(x, x2)
+
+    # Sequential node ids with an isolated node keep the node set
+    g = nx.DiGraph()
+    g.add_nodes_from(range(4))
+    g.add_edges_from([(0, 1), (1, 2)])
+    y = dpr.translate(NetworkXGraph(g), ScipyGraph)
+    assert y.nodes is not None and y.nodes.num_nodes == 4
+    x2 = dpr.translate(y, NetworkXGraph)
+    dpr.assert_equal(NetworkXGraph(g), x2)
+
+
 def test_scipy_graphblas(default_plugin_resolver):
+    grblas = pytest.importorskip("grblas")
+    from metagraph.plugins.graphblas.types import GrblasEdgeMap
+
     dpr = default_plugin_resolver
     #    0 2 7
     # 0 [1 2  ]
@@ -66,6 +100,151 @@ def test_scipy_graphblas(default_plugin_resolver):
     intermediate = GrblasEdgeMap(m)
     y = dpr.translate(x, GrblasEdgeMap)
     dpr.assert_equal(y, intermediate)
+    # Convert scipy adjacency <- graphblas
+    x2 = dpr.translate(y, ScipyEdgeMap)
+    dpr.assert_equal(x2, ScipyEdgeMap(g.tocsr(), [0, 2, 7]))
+
+
+def test_scipy_graphblas_compact(default_plugin_resolver):
+    grblas = pytest.importorskip("grblas")
+    from metagraph.plugins.graphblas.types import GrblasEdgeMap, GrblasGraph
+
+    dpr = default_plugin_resolver
+    #    0 1 2
+    # 0 [1 2  ]
+    # 1 [  0 3]
+    # 2 [  3  ]
+    g = ss.csr_matrix(
+        ([1, 2, 0, 3, 3], ([0, 0, 1, 1, 2], [0, 1, 1, 2, 1])), dtype=np.float64
+    )
+    x = ScipyGraph(ScipyEdgeMap(g))
+    m = grblas.Matrix.from_values(
+        [0, 0, 1, 1, 2], [0, 1, 1, 2, 1], [1, 2, 0, 3, 3], dtype=grblas.dtypes.FP64
+    )
+    intermediate = GrblasGraph(GrblasEdgeMap(m))
+    y = dpr.translate(x, GrblasGraph)
+    dpr.assert_equal(y, intermediate)
+    # Convert scipy graph <- graphblas graph
+    x2 = dpr.translate(y, ScipyGraph)
+    dpr.assert_equal(x2, x)
+
+
+def test_scipy_graphblas_sparse_node_ids(default_plugin_resolver):
+    grblas = pytest.importorskip("grblas")
+    from metagraph.plugins.graphblas.types import (
+        GrblasEdgeMap,
+        GrblasGraph,
+        GrblasNodeMap,
+    )
+
+    dpr = default_plugin_resolver
+    #           0 1000 1000000
+    # 0       [ 1   2         ]
+    # 1000    [     0        3]
+    # 1000000 [     3         ]
+    node_ids = [0, 1000, 1000000]
+    g = ss.csr_matrix(
+        ([1, 2, 0, 3, 3], ([0, 0, 1, 1, 2], [0, 1, 1, 2, 1])), dtype=np.int64
+    )
+    nodes = NumpyNodeMap(np.array([1, 2, 3]), node_ids=np.array(node_ids))
+    x = ScipyGraph(ScipyEdgeMap(g, node_ids), nodes)
+    # GraphBLAS dimensions are the node count rather than the largest node id
+    m = grblas.Matrix.from_values(
+        [0, 0, 1, 1, 2], [0, 1, 1, 2, 1], [1, 2, 0, 3, 3], dtype=grblas.dtypes.INT64
+    )
+    v = grblas.Vector.from_values([0, 1, 2], [1, 2, 3], dtype=grblas.dtypes.INT64)
+    intermediate = GrblasGraph(
+        GrblasEdgeMap(m, node_list=node_ids), GrblasNodeMap(v, node_list=node_ids)
+    )
+    y = dpr.translate(x, GrblasGraph)
+    dpr.assert_equal(y, intermediate)
+    assert y.edges.node_list is y.nodes.node_list
+    # Convert scipy graph <- graphblas graph
+    x2 = dpr.translate(y, ScipyGraph)
+    dpr.assert_equal(x2, x)
+
+
+def test_scipy_graphblas_compact_equal(default_plugin_resolver):
+    grblas = pytest.importorskip("grblas")
+    from metagraph.plugins.graphblas.types import GrblasEdgeMap
+
+    dpr = default_plugin_resolver
+    #    0 2 7
+    # 0 [    3]
+    # 2 [  1 2]
+    # 7 [3   0]
+    m = ss.coo_matrix(
+        ([3, 1, 2, 3, 0], ([0, 1, 1, 2, 2], [2, 1, 2, 0, 2])), dtype=np.int64
+    )
+    for x in [ScipyEdgeMap(m.tocsr(), [0, 2, 7]), ScipyEdgeMap(m.tocsc(), [0, 2, 7])]:
+        # Node ids used as positions, with gaps for the missing ids
+        with config.set({"plugins.graphblas.compact_ratio": None}):
+            y_sparse = dpr.translate(x, GrblasEdgeMap)
+        assert y_sparse.node_list is None
+        assert y_sparse.value.nrows == 8
+        # Node ids compacted into a node_list
+        with config.set({"plugins.graphblas.compact_ratio": 1}):
+            y_compact = dpr.translate(x, GrblasEdgeMap)
+        assert y_compact.value.nrows == 3
+        np.testing.assert_array_equal(y_compact.node_list, [0, 2, 7])
+        dpr.assert_equal(y_sparse, y_compact)
+        dpr.assert_equal(dpr.translate(y_sparse, ScipyEdgeMap), x)
+        dpr.assert_equal(dpr.translate(y_compact, ScipyEdgeMap), x)
+    # Edges are compared by node id
+    other = GrblasEdgeMap(
+        grblas.Matrix.from_values(
+            [0, 1, 1, 2, 2], [2, 1, 2, 0, 1], [3, 1, 2, 3, 0], dtype=grblas.dtypes.INT64
+        ),
+        node_list=[0, 2, 7],
+    )
+    with pytest.raises(AssertionError):
+        dpr.assert_equal(y_sparse, other)
+
+
+def test_pandas_scipy_edgemap(default_plugin_resolver):
+    dpr = default_plugin_resolver
+    df = pd.DataFrame(
+        {
+            "source": [2, 2, 7, 0, 7],
+            "target": [2, 7, 0, 7, 7],
+            "weight": [1, 2, 3, 3, 0],
+        }
+    )
+    x = PandasEdgeMap(df)
+    # Convert pandas edge list -> scipy adjacency
+    #    0 2 7
+    # 0 [    3]
+    # 2 [  1 2]
+    # 7 [3   0]
+    m = ss.coo_matrix(
+        ([3, 1, 2, 3, 0], ([0, 1, 1, 2, 2], [2, 1, 2, 0, 2])), dtype=np.int64
+    )
+    intermediate = ScipyEdgeMap(m.tocsr(), [0, 2, 7])
+    y = dpr.translate(x, ScipyEdgeMap)
+    dpr.assert_equal(y, intermediate)
+    # Convert pandas edge list <- scipy adjacency
+    x2 = dpr.translate(y, PandasEdgeMap)
+    dpr.assert_equal(x, x2)
+
+
+def test_pandas_scipy_edgeset_undirected(default_plugin_resolver):
+    dpr = default_plugin_resolver
+    df = pd.DataFrame({"source": [0, 2, 0], "target": [2, 7, 7]})
+    x = PandasEdgeSet(df, is_directed=False)
+    # Convert pandas edge list -> scipy adjacency
+    #    0 2 7
+    # 0 [  1 1]
+    # 2 [1   1]
+    # 7 [1 1  ]
+    m = ss.coo_matrix(
+        ([1, 1, 1, 1, 1, 1], ([0, 0, 1, 1, 2, 2], [1, 2, 0, 2, 0, 1])), dtype=np.int64
+    )
+    intermediate = ScipyEdgeSet(m.tocsr(), [0, 2, 7])
+    y = dpr.translate(x, ScipyEdgeSet)
+    dpr.assert_equal(y, intermediate)
+    # Convert pandas edge list <- scipy adjacency
+    x2 = dpr.translate(y, PandasEdgeSet)
+    dpr.assert_equal(x, x2)
 
 
 # def test_networkx_2_pandas(default_plugin_resolver):
@@ -1,10 +1,8 @@
 import pytest
 from metagraph.tests.util import default_plugin_resolver
 from metagraph.plugins.numpy.types import NumpyMatrix
-from metagraph.plugins.graphblas.types import GrblasMatrixType
 from metagraph.plugins.scipy.types import ScipyMatrixType
 import numpy as np
-import grblas
 import scipy.sparse as ss
 
 
@@ -26,6 +24,8 @@ def test_numpy_2_scipy(default_plugin_resolver):
 
 
 def test_grblas_2_scipy(default_plugin_resolver):
+    grblas = pytest.importorskip("grblas")
+
     dpr = default_plugin_resolver
     x = grblas.Matrix.from_values(
         [0, 0, 1, 2],
@@ -3,9 +3,7 @@ from metagraph import NodeLabels
 from metagraph.tests.util import default_plugin_resolver
 from metagraph.plugins.python.types import PythonNodeMap
 from metagraph.plugins.numpy.types import NumpyNodeMap
-from metagraph.plugins.graphblas.types import GrblasNodeMap
 import numpy as np
-import grblas
 
 
 def test_python_2_numpy(default_plugin_resolver):
@@ -68,6 +66,9 @@ def test_python_2_numpy(default_plugin_resolver):
 
 
 def test_graphblas_python(default_plugin_resolver):
+    grblas = pytest.importorskip("grblas")
+    from metagraph.plugins.graphblas.types import GrblasNodeMap
+
     dpr = default_plugin_resolver
     x = GrblasNodeMap(
         grblas.Vector.from_values([9, 24, 25], [-1.2, 33.4, 12.5], size=26),
@@ -80,6 +81,9 @@ def test_graphblas_python(default_plugin_resolver):
 
 
 def test_numpy_graphblas(default_plugin_resolver):
+    grblas = pytest.importorskip("grblas")
+    from metagraph.plugins.graphblas.types import GrblasNodeMap
+
     dpr = default_plugin_resolver
     data = np.array([1, 1, 3, 1, 4, 1, -1])
     missing = data == 1
@@ -1,11 +1,13 @@
+import pytest
 from metagraph.tests.util import default_plugin_resolver
 from metagraph.plugins.numpy.types import NumpyVector
-from metagraph.plugins.graphblas.types import GrblasVectorType
-import grblas
 import numpy as np
 
 
 def test_numpy_2_graphblas(default_plugin_resolver):
+    grblas = pytest.importorskip("grblas")
+    from metagraph.plugins.graphblas.types import GrblasVectorType
+
     dpr = default_plugin_resolver
     dense_array = np.array([0, 1.1, 0, 0, 4.4, 5.5, 6.6, 0])
     missing_mask = dense_array == 0
@@ -1,10 +1,8 @@
 import pytest
 from metagraph.plugins.pandas.types import PandasEdgeMap, PandasEdgeSet
-from metagraph.plugins.graphblas.types import GrblasEdgeMap
 from metagraph.plugins.scipy.types import ScipyEdgeMap
 from metagraph import NodeLabels
 import pandas as pd
-import grblas
 import scipy.sparse as ss
 import numpy as np
 
@@ -79,6 +77,9 @@ def test_pandas_edge():
 
 
 def test_graphblas():
+    grblas = pytest.importorskip("grblas")
+    from metagraph.plugins.graphblas.types import GrblasEdgeMap
+
     # [1 2  ]
     # [  0 3]
     # [  3  ]
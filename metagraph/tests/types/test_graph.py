@@ -1,6 +1,6 @@
 import pytest
 from metagraph.plugins.networkx.types import NetworkXGraph
-from metagraph.plugins.scipy.types import ScipyGraph, ScipyEdgeMap
+from metagraph.plugins.scipy.types import ScipyGraph, ScipyEdgeMap, ScipyBipartiteGraph
 from metagraph.plugins.numpy.types import NumpyNodeMap
 import networkx as nx
 import numpy as np
@@ -201,3 +201,40 @@ def test_scipy():
             {},
             {},
         )
+
+
+def test_scipy_bipartite():
+    # 5 6 7
+    # [1 2  ] 0
+    # [    3] 1
+    aprops = {
+        "is_directed": False,
+        "node0_type": "set",
+        "node1_type": "set",
+        "node0_dtype": None,
+        "node1_dtype": None,
+        "edge_type": "map",
+        "edge_dtype": "int",
+    }
+    m = ss.csr_matrix(([1, 2, 3], ([0, 0, 1], [0, 1, 2])), dtype=np.int64)
+    g = ScipyBipartiteGraph(m, [0, 1], [5, 6, 7])
+    assert (
+        ScipyBipartiteGraph.Type.compute_abstract_properties(g, set(aprops)) == aprops
+    )
+    # Node order does not affect comparison
+    m_reordered = ss.csr_matrix(([3, 2, 1], ([0, 1, 1], [0, 1, 2])), dtype=np.int64)
+    ScipyBipartiteGraph.Type.assert_equal(
+        g, ScipyBipartiteGraph(m_reordered, [1, 0], [7, 6, 5]), aprops, aprops, {}, {}
+    )
+    with pytest.raises(AssertionError):
+        ScipyBipartiteGraph.Type.assert_equal(
+            g, ScipyBipartiteGraph(m, [0, 1], [5, 6, 8]), aprops, aprops, {}, {}
+        )
+    with pytest.raises(AssertionError):
+        ScipyBipartiteGraph.Type.assert_equal(
+            g, ScipyBipartiteGraph(m * 2, [0, 1], [5, 6, 7]), aprops, aprops, {}, {}
+        )
+    with pytest.raises(ValueError, match="both parts"):
+        ScipyBipartiteGraph(m, [0, 1], [1, 6, 7])
+    with pytest.raises(TypeError):
+        ScipyBipartiteGraph(m, [0, 1, 2], [5, 6, 7])
@@ -1,10 +1,8 @@
 import pytest
 from metagraph.plugins.numpy.types import NumpyMatrix
 from metagraph.plugins.scipy.types import ScipyMatrixType
-from metagraph.plugins.graphblas.types import GrblasMatrixType
 import numpy as np
 import scipy.sparse as ss
-import grblas
 
 
 def test_numpy():
@@ -152,6 +150,9 @@ def test_scipy():
 
 
 def test_graphblas():
+    grblas = pytest.importorskip("grblas")
+    from metagraph.plugins.graphblas.types import GrblasMatrixType
+
     GrblasMatrixType.assert_equal(
         grblas.Matrix.from_values(
             [0, 0, 0, 1, 1, 1], [0, 1, 2, 0, 1, 2], [1, 2, 3, 4, 5, 6]
@@ -1,10 +1,10 @@
 import pytest
-from metagraph.plugins.python.types import PythonNodeMap
-from metagraph.plugins.numpy.types import NumpyNodeMap
-from metagraph.plugins.graphblas.types import GrblasNodeMap
+from metagraph.plugins.python.types import PythonNodeMap, PythonNodeSet
+from metagraph.plugins.numpy.types import NumpyNodeMap, NumpyNodeSet, NodeIndex
 from metagraph import NodeLabels
+from metagraph.types import NodeMap
+from metagraph.wrappers import NodeMapWrapper
 import numpy as np
-from grblas import Vector
 
 
 def test_python():
@@ -131,7 +131,106 @@ def test_numpy_compact():
         NumpyNodeMap(np.array([5, 1, 3]), node_ids=np.array([7, 0, 2])),
 
 
+def test_numpy_node_index():
+    x = NumpyNodeMap(np.array([1, 3, 5]), node_ids=np.array([0, 240, 968]))
+    assert isinstance(x.id2pos, NodeIndex)
+    assert 240 in x
+    assert 241 not in x
+    assert 1000 not in x
+    assert x[968] == 5
+    with pytest.raises(ValueError, match="not in the NodeMap"):
+        x[5]
+    assert x.id2pos[240] == 1
+    assert x.id2pos.get(7) is None
+    assert dict(x.id2pos.items()) == {0: 0, 240: 1, 968: 2}
+    # Vectorized lookup
+    assert (x.id2pos.positions(np.array([968, 0])) == [2, 0]).all()
+    assert (x.id2pos.contains(np.array([-1, 0, 1, 968, 969])) == [0, 1, 0, 1, 0]).all()
+    with pytest.raises(ValueError, match="not in the index"):
+        x.id2pos.positions(np.array([0, 3]))
+    # Empty index
+    empty = NodeIndex(np.array([], dtype=int))
+    assert 0 not in empty
+    assert not empty.contains(np.array([0, 1])).any()
+
+
+def test_numpy_nodeset_membership():
+    x = NumpyNodeSet(np.array([9, 1, 5]))
+    # The Python set is only built on request
+    assert x._node_set is None
+    assert 5 in x
+    assert 4 not in x
+    assert 10 not in x
+    assert x._node_set is None
+    assert (x.contains_many([0, 1, 5, 9, 10]) == [False, True, True, True, False]).all()
+    assert x.node_set == {1, 5, 9}
+
+    x = NumpyNodeSet(mask=np.array([False, True, False, True]))
+    assert 3 in x
+    assert 4 not in x
+    assert (x.contains_many(np.array([-1, 0, 1, 3, 4])) == [0, 0, 1, 1, 0]).all()
+    assert x.node_set is None
+
+
+def test_bulk_access():
+    maps = [
+        PythonNodeMap({0: 10, 3: 13, 5: 15}),
+        NumpyNodeMap(np.array([10, 13, 15]), node_ids=np.array([0, 3, 5])),
+        NumpyNodeMap(
+            np.array([10, -1, -1, 13, -1, 15]),
+            mask=np.array([True, False, False, True, False, True]),
+        ),
+    ]
+    for x in maps:
+        ids, vals = x.items_arrays()
+        np.testing.assert_array_equal(ids, [0, 3, 5])
+        np.testing.assert_array_equal(vals, [10, 13, 15])
+        np.testing.assert_array_equal(x.get_many([5, 0, 5]), [15, 10, 15])
+        np.testing.assert_array_equal(
+            x.contains_many([0, 1, 5, 6]), [True, False, True, False]
+        )
+        with pytest.raises(ValueError, match="not in the NodeMap"):
+            x.get_many([0, 1])
+
+    # The NodeMapWrapper defaults only need nodes, __contains__ and __getitem__
+    class DictNodeMap(NodeMapWrapper, abstract=NodeMap, register=False):
+        def __init__(self, data):
+            self.value = data
+
+        def nodes(self):
+            return list(self.value)
+
+        def __contains__(self, node_id):
+            return node_id in self.value
+
+        def __getitem__(self, node_id):
+            return self.value[node_id]
+
+    x = DictNodeMap({5: 15, 0: 10, 3: 13})
+    ids, vals = x.items_arrays()
+    np.testing.assert_array_equal(ids, [0, 3, 5])
+    np.testing.assert_array_equal(vals, [10, 13, 15])
+    np.testing.assert_array_equal(
+        x.contains_many([0, 1, 5, 6]), [True, False, True, False]
+    )
+    with pytest.raises(ValueError, match="not in the NodeMap"):
+        x.get_many([0, 1])
+
+    x = NumpyNodeMap(np.array([10, 11, 12]))
+    ids, vals = x.items_arrays()
+    np.testing.assert_array_equal(ids, [0, 1, 2])
+    np.testing.assert_array_equal(x.get_many([2, 1]), [12, 11])
+    np.testing.assert_array_equal(x.contains_many([-1, 0, 3]), [False, True, False])
+
+    for x in [PythonNodeSet({2, 4}), NumpyNodeSet(np.array([2, 4]))]:
+        np.testing.assert_array_equal(x.contains_many([1, 2, 4]), [False, True, True])
+
+
 def test_graphblas():
+    pytest.importorskip("grblas")
+    from grblas import Vector
+    from metagraph.plugins.graphblas.types import GrblasNodeMap
+
     GrblasNodeMap.Type.assert_equal(
         GrblasNodeMap(Vector.from_values([0, 1, 3, 4], [1, 2, 3, 4])),
         GrblasNodeMap(Vector.from_values([0, 1, 3, 4], [1, 2, 3, 4])),
@@ -170,3 +269,44 @@ def test_graphblas():
             {},
             {},
         )
+
+
+def test_graphblas_node_list():
+    pytest.importorskip("grblas")
+    from grblas import Vector
+    from metagraph.plugins.graphblas.types import GrblasNodeMap
+
+    # Sparse node ids stored compactly at positions 0..2
+    x = GrblasNodeMap(
+        Vector.from_values([0, 1, 2], [10, 20, 30]), node_list=[5, 1000, 1000000]
+    )
+    assert x.num_nodes == 3
+    assert x[1000] == 20
+    assert 1000000 in x
+    assert 1 not in x
+    assert 7 not in x
+    with pytest.raises(ValueError):
+        x[7]
+    np.testing.assert_array_equal(x.contains_many([5, 6, 1000]), [True, False, True])
+    np.testing.assert_array_equal(x.get_many([1000000, 5]), [30, 10])
+    ids, vals = x.items_arrays()
+    np.testing.assert_array_equal(ids, [5, 1000, 1000000])
+    np.testing.assert_array_equal(vals, [10, 20, 30])
+
+    # Same nodes stored with a different layout compare equal
+    y = GrblasNodeMap(
+        Vector.from_values([1, 2, 3], [10, 20, 30], size=4),
+        node_list=[0, 5, 1000, 1000000],
+    )
+    GrblasNodeMap.Type.assert_equal(x, y, {}, {}, {}, {})
+    with pytest.raises(AssertionError):
+        GrblasNodeMap.Type.assert_equal(
+            x,
+            GrblasNodeMap(Vector.from_values([0, 1, 2], [10, 20, 30])),
+            {},
+            {},
+            {},
+            {},
+        )
+    with pytest.raises(TypeError):
+        GrblasNodeMap(Vector.from_values([0, 1], [1, 2]), node_list=[3, 4, 5])
@@ -1,8 +1,6 @@
 import pytest
 from metagraph.plugins.numpy.types import NumpyVector
-from metagraph.plugins.graphblas.types import GrblasVectorType
 import numpy as np
-import grblas
 
 
 def test_numpy():
@@ -84,6 +82,9 @@ def test_numpy():
 
 
 def test_graphblas():
+    grblas = pytest.importorskip("grblas")
+    from metagraph.plugins.graphblas.types import GrblasVectorType
+
     GrblasVectorType.assert_equal(
         grblas.Vector.from_values([0, 1, 2], [1, 2, 3]),
         grblas.Vector.from_values([0, 1, 2], [1, 2, 3]),
@@ -9,15 +9,60 @@ from .types import (
     Graph,
     BipartiteGraph,
 )
-from typing import Set, Dict, Any
+import numpy as np
+from typing import Set, Dict, Any, Tuple
 
 
 class NodeSetWrapper(Wrapper, abstract=NodeSet, register=False):
-    pass
+    def contains_many(self, node_ids) -> np.ndarray:
+        """
+        Boolean array indicating which of node_ids are in the NodeSet.
+
+        This default loops over ``__contains__``; wrappers should override it with a
+        vectorized implementation.
+        """
+        node_ids = np.asarray(node_ids)
+        return np.fromiter(
+            (node_id in self for node_id in node_ids.tolist()), bool, len(node_ids)
+        )
 
 
 class NodeMapWrapper(Wrapper, abstract=NodeMap, register=False):
-    pass
+    def contains_many(self, node_ids) -> np.ndarray:
+        """
+        Boolean array indicating which of node_ids are in the NodeMap.
+
+        This default loops over ``__contains__``; wrappers should override it with a
+        vectorized implementation.
+        """
+        node_ids = np.asarray(node_ids)
+        return np.fromiter(
+            (node_id in self for node_id in node_ids.tolist()), bool, len(node_ids)
+        )
+
+    def get_many(self, node_ids) -> np.ndarray:
+        """
+        Array of the values for node_ids.
+
+        Raises ValueError if any of node_ids are not in the NodeMap.
+        This default loops over ``__getitem__``; wrappers should override it with a
+        vectorized implementation.
+        """
+        node_ids = np.asarray(node_ids)
+        found = self.contains_many(node_ids)
+        if not found.all():
+            raise ValueError(f"nodes {node_ids[~found]} are not in the NodeMap")
+        return np.array([self[node_id] for node_id in node_ids.tolist()])
+
+    def items_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return (node_ids, values) as two aligned arrays, with node_ids sorted.
+
+        This default sorts the result of ``nodes()`` and looks up the values with
+        ``get_many``; wrappers should override it with a direct implementation.
+        """
+        node_ids = np.sort(np.asarray(self.nodes()))
+        return node_ids, self.get_many(node_ids)
 
 
 class NodeTableWrapper(Wrapper, abstract=NodeTable, register=False):